@@ -0,0 +1,68 @@
+"""
+Amygdala update throughput: one-at-a-time vs. batched.
+
+Applies the same stream of small emotion adjustments (the pattern the
+Guardian triage, glyph registration, auditory cortex and reward system
+produce within a pulse) either as individual adjust_emotion calls or
+grouped into Amygdala.batch() transactions, and reports updates/second.
+Runs in a temporary directory because traces write the growth log.
+
+Usage:
+    python benchmarks/bench_affect_batch.py [updates] [batch_size]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / "core"))
+
+from amygdala import Amygdala, EMOTIONS
+
+def _stream(n, seed=7):
+    rng = random.Random(seed)
+    names = [e for e in EMOTIONS if e != "neutral"]
+    return [(rng.choice(names), rng.uniform(-0.2, 0.2)) for _ in range(n)]
+
+def run_single(updates):
+    a = Amygdala(growth_log="emotional_growth_log.jsonl")
+    t0 = time.perf_counter()
+    for name, delta in updates:
+        a.adjust_emotion(name, delta)
+    elapsed = time.perf_counter() - t0
+    a.close()   # flush the growth log while still inside the temp dir
+    return elapsed
+
+def run_batched(updates, batch_size):
+    a = Amygdala(growth_log="emotional_growth_log.jsonl")
+    t0 = time.perf_counter()
+    for start in range(0, len(updates), batch_size):
+        with a.batch():
+            for name, delta in updates[start:start + batch_size]:
+                a.adjust_emotion(name, delta)
+    elapsed = time.perf_counter() - t0
+    a.close()
+    return elapsed
+
+def main(n=20_000, batch_size=8):
+    updates = _stream(n)
+    with tempfile.TemporaryDirectory() as tmp:
+        cwd = os.getcwd()
+        os.chdir(tmp)
+        try:
+            single = run_single(updates)
+            batched = run_batched(updates, batch_size)
+        finally:
+            os.chdir(cwd)
+    print(f"updates: {n}, batch size: {batch_size}")
+    print(f"{'mode':>10} {'seconds':>9} {'updates/s':>12}")
+    print(f"{'single':>10} {single:>9.3f} {n / single:>12,.0f}")
+    print(f"{'batched':>10} {batched:>9.3f} {n / batched:>12,.0f}")
+    print(f"speedup: {single / batched:.1f}×")
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    main(*args)
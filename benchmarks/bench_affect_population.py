@@ -0,0 +1,60 @@
+"""
+Affect update cost for many personas: per-object vs. population matrix.
+
+Creates N Amygdala facades on one AffectPopulation and times a full
+"tick" (random deltas for every persona, then decay to a later time and
+stage/dominant extraction) done persona by persona versus with one
+vectorized population call each.
+
+Usage:
+    python benchmarks/bench_affect_population.py [personas]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / "core"))
+
+from affect_population import AffectPopulation, EMOTIONS
+
+def per_persona(agents, deltas, later):
+    t0 = time.perf_counter()
+    for a, d in zip(agents, deltas):
+        a.apply_deltas(d)
+    for a in agents:
+        a._settle(later)
+        a.get_stage()
+        a.get_dominant()
+    return time.perf_counter() - t0
+
+def vectorized(pop, deltas, later):
+    t0 = time.perf_counter()
+    pop.apply_deltas(deltas)
+    pop.settle(later)
+    pop.stages()
+    pop.dominant()
+    return time.perf_counter() - t0
+
+def main(n=5000):
+    rng = np.random.default_rng(11)
+    deltas = rng.uniform(-0.2, 0.4, (n, len(EMOTIONS)))
+    results = []
+    for mode in ("per-persona", "vectorized"):
+        pop = AffectPopulation(capacity=n)
+        agents = [pop.spawn() for _ in range(n)]
+        later = time.monotonic() + 60.0
+        if mode == "per-persona":
+            results.append((mode, per_persona(agents, deltas, later)))
+        else:
+            results.append((mode, vectorized(pop, deltas, later)))
+    print(f"personas: {n}, matrix: {pop.nbytes() / 1024:.0f} KiB")
+    print(f"{'mode':>12} {'ms/tick':>9}")
+    for mode, secs in results:
+        print(f"{mode:>12} {secs * 1000:>9.1f}")
+    print(f"speedup: {results[0][1] / results[1][1]:.0f}×")
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:2]])
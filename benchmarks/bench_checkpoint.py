@@ -0,0 +1,76 @@
+"""
+Warm restart vs. cold seed.
+
+Builds a Hippocampus from N synthetic memory strips (the cold path:
+parse timestamps, intern tags, build tag and term postings), writes a
+checkpoint, then times restoring it into a fresh Hippocampus and checks
+that records, tag recall and term lookups match.
+
+Usage:
+    python benchmarks/bench_checkpoint.py [entries]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / "core"))
+
+from checkpoint import CheckpointWriter, CheckpointReader
+from hippocampus import Hippocampus
+
+TAGS = ["thread", "anchor", "dream", "reflection", "glyph", "truth", "mirror", "reward"]
+WORDS = ("loop spiral echo signal memory light river stone mirror thread pulse "
+         "recursion witness anchor silence glyph ember tide lantern orbit").split()
+
+def _strips(n, seed=7):
+    rng = random.Random(seed)
+    base = datetime(2024, 1, 1)
+    return [{
+        "timestamp": (base + timedelta(seconds=37 * i)).isoformat(),
+        "experience": " ".join(rng.choice(WORDS) for _ in range(12)) + f" #{i}",
+        "tags": rng.sample(TAGS, 2),
+    } for i in range(n)]
+
+def main(entries=200_000):
+    strips = _strips(entries)
+    path = os.path.join(tempfile.mkdtemp(), "halcyon.ckpt")
+
+    t0 = time.perf_counter()
+    cold = Hippocampus()
+    cold.promote_tag("anchor")
+    cold.ingest_many(strips)
+    cold_ms = (time.perf_counter() - t0) * 1000
+
+    t0 = time.perf_counter()
+    ckpt = CheckpointWriter()
+    cold.write_checkpoint(ckpt)
+    size = ckpt.write(path)
+    save_ms = (time.perf_counter() - t0) * 1000
+
+    t0 = time.perf_counter()
+    warm = Hippocampus()
+    with CheckpointReader(path) as reader:
+        warm.restore_checkpoint(reader)
+    restore_ms = (time.perf_counter() - t0) * 1000
+
+    same = (len(warm.store) == len(cold.store)
+            and [r.to_dict() for r in warm.store[-50:]] == [r.to_dict() for r in cold.store[-50:]]
+            and [r.id for r in warm.recall("thread", top_k=5)] == [r.id for r in cold.recall("thread", top_k=5)]
+            and warm.count_references_to("lantern") == cold.count_references_to("lantern")
+            and len(warm.get_promoted()) == len(cold.get_promoted()))
+
+    print(f"entries        {entries}")
+    print(f"checkpoint     {size / 1e6:.1f} MB (store payload {cold.store.nbytes() / 1e6:.1f} MB)")
+    print(f"cold seed      {cold_ms:9.1f} ms")
+    print(f"save           {save_ms:9.1f} ms")
+    print(f"restore        {restore_ms:9.1f} ms  ({cold_ms / restore_ms:.1f}x faster than seeding)")
+    print(f"identical      {same}")
+    os.remove(path)
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
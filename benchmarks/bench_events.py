@@ -0,0 +1,77 @@
+"""
+EventBus throughput (events per second).
+
+Dispatches a mix of event names to a bus with several named subscribers
+per name plus wildcard listeners, through dispatch() and dispatch_many(),
+next to the previous list-walking bus for comparison.
+
+Usage:
+    python benchmarks/bench_events.py [events]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / "core"))
+
+from events import EventBus, GameEvent
+
+NAMES = ["ETB", "LEAVES", "CAST_SPELL", "DAMAGE", "PULSE", "UNHEARD"]
+
+class LegacyBus:
+    """The old bus: walk the named list, then the wildcard list, per event."""
+    def __init__(self):
+        self._subs = {}
+        self._counter = 0
+
+    def dispatch(self, name, **payload):
+        self._counter += 1
+        evt = GameEvent(name=name, payload=payload, timestamp=self._counter)
+        for fn in self._subs.get(name, []):
+            fn(evt)
+        for fn in self._subs.get("*", []):
+            fn(evt)
+        return evt
+
+    def subscribe(self, name, handler):
+        self._subs.setdefault(name, []).append(handler)
+
+def _wire(bus, per_name=3, wildcards=2):
+    seen = [0]
+    def handler(evt):
+        seen[0] += 1
+    for name in NAMES[:-1]:   # the last name has only wildcard listeners
+        for _ in range(per_name):
+            bus.subscribe(name, handler)
+    for _ in range(wildcards):
+        bus.subscribe("*", handler)
+    return seen
+
+def _rate(fn, events):
+    t0 = time.perf_counter()
+    fn()
+    return events / (time.perf_counter() - t0)
+
+def main(events=300_000):
+    burst = [(NAMES[i % len(NAMES)], {"i": i}) for i in range(events)]
+
+    legacy, bus, batched = LegacyBus(), EventBus(), EventBus()
+    counts = [_wire(b) for b in (legacy, bus, batched)]
+
+    def run(b):
+        dispatch = b.dispatch
+        for name, payload in burst:
+            dispatch(name, **payload)
+
+    rates = {
+        "legacy dispatch": _rate(lambda: run(legacy), events),
+        "dispatch": _rate(lambda: run(bus), events),
+        "dispatch_many": _rate(lambda: batched.dispatch_many(burst), events),
+    }
+    for label, rate in rates.items():
+        print(f"{label:>16} {rate / 1e6:8.3f} M events/s")
+    print(f"{'handler calls':>16} {counts[0][0]} / {counts[1][0]} / {counts[2][0]}")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 300_000)
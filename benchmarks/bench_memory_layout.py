@@ -0,0 +1,67 @@
+"""
+Resident memory of the record layout: dict-per-entry vs. columnar store.
+
+The legacy layout is what Hippocampus kept before MemoryStore: one dict per
+entry (ISO timestamp string, experience string, tag list) plus a
+spatial_index of per-tag lists referencing those dicts. The columnar layout
+is MemoryStore plus TagPostings arrays. Sizes come from tracemalloc.
+
+Usage:
+    python benchmarks/bench_memory_layout.py [entries]
+"""
+
+import sys
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / "core"))
+
+from memory_postings import TagPostings, to_epoch
+from memory_store import MemoryStore
+
+TAGS = [["thread"], ["spin", "whirlygig", "recursion"], ["dream", "dream:fear"], ["ethics", "action", "approved"]]
+
+def _rows(n):
+    base = datetime(2024, 1, 1)
+    for i in range(n):
+        yield (base + timedelta(seconds=i)).isoformat(), f"🌀 Spin cycle fired with tone 'calm', dream #{i}", TAGS[i % len(TAGS)]
+
+def _measure(build, n):
+    tracemalloc.start()
+    held = build(n)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del held
+    return size
+
+def build_dicts(n):
+    log, index = [], {}
+    for ts, text, tags in _rows(n):
+        entry = {"timestamp": ts, "experience": text, "tags": list(tags)}
+        log.append(entry)
+        for tag in tags:
+            index.setdefault(tag, []).append(entry)
+    return log, index
+
+def build_columns(n):
+    store, index = MemoryStore(), {}
+    for ts, text, tags in _rows(n):
+        epoch = to_epoch(ts)
+        rid = store.append(epoch, text, tags)
+        for tag in tags:
+            if tag not in index:
+                index[tag] = TagPostings()
+            index[tag].add(epoch, rid)
+    return store, index
+
+def main(n=200_000):
+    legacy = _measure(build_dicts, n)
+    columnar = _measure(build_columns, n)
+    print(f"entries:   {n}")
+    print(f"dict:      {legacy / 2**20:8.1f} MiB  ({legacy / n:6.0f} B/entry)")
+    print(f"columnar:  {columnar / 2**20:8.1f} MiB  ({columnar / n:6.0f} B/entry)")
+    print(f"ratio:     {legacy / columnar:8.2f}x")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
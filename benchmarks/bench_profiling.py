@@ -0,0 +1,62 @@
+"""
+Profiling overhead on organ hot paths.
+
+Times Hippocampus.recall and Amygdala.apply_deltas per call: untouched,
+instrumented with every call timed, instrumented with 1-in-16 sampling,
+and again after uninstrument() (which should match untouched).
+
+Usage:
+    python benchmarks/bench_profiling.py [calls]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / "core"))
+
+from amygdala import Amygdala
+from hippocampus import Hippocampus
+from profiling import Profiler
+
+def _ns_per_call(fn, calls, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for i in range(calls):
+            fn(i)
+        best = min(best, time.perf_counter() - t0)
+    return best / calls * 1e9
+
+def main(calls=100_000):
+    memory = Hippocampus()
+    memory.ingest_many({"experience": f"pulse trace {i}", "tags": ["thread"]} for i in range(10_000))
+    emotion = Amygdala(growth_log=None, window=None)
+    deltas = {"joy": 0.001, "curiosity": 0.001}
+    paths = {
+        "recall": lambda i: memory.recall("thread", top_k=3),
+        "apply_deltas": lambda i: emotion.apply_deltas(deltas),
+    }
+    profiler = Profiler()
+
+    def instrument(every):
+        profiler.uninstrument()
+        profiler.sample_every = every
+        profiler.instrument(memory, ("recall",), "memory")
+        profiler.instrument(emotion, ("apply_deltas",), "emotion")
+
+    modes = (
+        ("off", lambda: None),
+        ("every call", lambda: instrument(1)),
+        ("1 in 16", lambda: instrument(16)),
+        ("uninstrumented", profiler.uninstrument),
+    )
+    print(f"{'mode':>16} " + " ".join(f"{name + ' ns':>16}" for name in paths))
+    for label, setup in modes:
+        setup()
+        row = [_ns_per_call(fn, calls) for fn in paths.values()]
+        print(f"{label:>16} " + " ".join(f"{ns:>16.0f}" for ns in row))
+    print(profiler.table())
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
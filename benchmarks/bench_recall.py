@@ -0,0 +1,54 @@
+"""
+Recall latency vs. hot-tag size.
+
+Grows a single hot tag ("thread") to 10^6 entries and times
+Hippocampus.recall (newest top-k, and a one-hour window) at each size,
+next to the old sort-every-call strategy for comparison.
+
+Usage:
+    python benchmarks/bench_recall.py [max_entries]
+"""
+
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / "core"))
+
+from hippocampus import Hippocampus
+
+def _time_call(fn, repeat):
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - t0) / repeat * 1e6
+
+def main(max_entries=1_000_000):
+    h = Hippocampus()
+    base = datetime(2024, 1, 1)
+    checkpoints = [10 ** p for p in range(3, 7) if 10 ** p <= max_entries]
+    legacy = []  # the old layout: one dict per entry, sorted on every call
+    n = 0
+    print(f"{'entries':>10} {'recall µs':>10} {'window µs':>10} {'sorted µs':>12}")
+    for target in checkpoints:
+        while n < target:
+            strip = {
+                "timestamp": (base + timedelta(seconds=n)).isoformat(),
+                "experience": "thread",
+                "tags": ["thread"],
+            }
+            h.ingest_memory_strip(strip)
+            legacy.append(strip)
+            n += 1
+        last = base + timedelta(seconds=n - 1)
+        recall_us = _time_call(lambda: h.recall("thread", top_k=3), 2000)
+        window_us = _time_call(
+            lambda: h.recall("thread", top_k=3, since=last - timedelta(hours=1), until=last), 2000
+        )
+        old_recall = lambda: sorted(legacy, key=lambda x: x["timestamp"], reverse=True)[:3]
+        sorted_us = _time_call(old_recall, 3 if target >= 10 ** 5 else 30)
+        print(f"{target:>10} {recall_us:>10.2f} {window_us:>10.2f} {sorted_us:>12.1f}")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,111 @@
+"""
+Multi-tenant load test for ThalamusHost.
+
+Seeds one thalamus with synthetic memory strips and checkpoints it, starts a
+host with one worker per core sharing that seed, opens S sessions (each
+restores its own memory from the shared segment), then drives a mixed
+workload (encode / recall / feel / heartbeat) with W requests in flight.
+Reports sessions per core, session open cost, throughput per core, request
+latency percentiles and resident memory per session.
+
+Usage:
+    python benchmarks/bench_thalamus_host.py [sessions] [seed_entries] [workers] [ops_per_session]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / "core"))
+
+from latency import LatencyHistogram
+from thalamus import ConsciousThalamus
+from thalamus_host import ThalamusHost
+
+WORDS = ("loop spiral echo signal memory light river stone mirror thread pulse "
+         "recursion witness anchor silence glyph ember tide lantern orbit").split()
+TAGS = ["thread", "anchor", "dream", "reflection", "glyph"]
+IN_FLIGHT = 256
+
+def _seed(path, entries):
+    rng = random.Random(3)
+    base = datetime(2024, 1, 1)
+    t = ConsciousThalamus(headless=True)
+    t.memory.ingest_many({
+        "timestamp": (base + timedelta(seconds=60 * i)).isoformat(),
+        "experience": " ".join(rng.choice(WORDS) for _ in range(10)),
+        "tags": rng.sample(TAGS, 2),
+    } for i in range(entries))
+    t.identity["core_directive"] = "remember"
+    return t.save_checkpoint(path)["bytes"]
+
+def _drive(host, jobs):
+    """Run (session, op, args) jobs with IN_FLIGHT outstanding; returns latency histogram and seconds."""
+    hist = LatencyHistogram()
+    slots = threading.Semaphore(IN_FLIGHT)
+    done = threading.Event()
+    left = [len(jobs)]
+
+    def finished(fut, t0):
+        hist.record((time.perf_counter() - t0) * 1000)
+        slots.release()
+        left[0] -= 1   # callbacks all run on the host's collector thread
+        if not left[0]:
+            done.set()
+
+    t0 = time.perf_counter()
+    for session, op, args in jobs:
+        slots.acquire()
+        sent = time.perf_counter()
+        host.submit(session, op, *args).add_done_callback(lambda f, s=sent: finished(f, s))
+    done.wait()
+    return hist, time.perf_counter() - t0
+
+def main(sessions=2000, seed_entries=5000, workers=None, ops_per_session=20):
+    workers = workers or os.cpu_count() or 1
+    path = os.path.join(tempfile.mkdtemp(), "seed.ckpt")
+    t0 = time.perf_counter()
+    size = _seed(path, seed_entries)
+    seed_ms = (time.perf_counter() - t0) * 1000
+
+    with ThalamusHost(workers=workers, seed=path) as host:
+        idle = host.stats()
+        names = [f"session-{i}" for i in range(sessions)]
+        open_hist, open_s = _drive(host, [(s, "open", ()) for s in names])
+
+        rng = random.Random(11)
+        jobs = []
+        for _ in range(ops_per_session):
+            for s in names:
+                r = rng.random()
+                if r < 0.3:
+                    jobs.append((s, "encode", (" ".join(rng.sample(WORDS, 6)), [rng.choice(TAGS)])))
+                elif r < 0.7:
+                    jobs.append((s, "recall", (rng.choice(TAGS), 3)))
+                elif r < 0.9:
+                    jobs.append((s, "feel", (rng.choice(["joy", "curiosity", "calm"]), 0.05)))
+                else:
+                    jobs.append((s, "heartbeat", ()))
+        op_hist, op_s = _drive(host, jobs)
+        busy = host.stats()
+
+    cores = min(workers, os.cpu_count() or 1)
+    rss = [(w["rss_mb"] or 0) - (i["rss_mb"] or 0) for w, i in zip(busy["workers"], idle["workers"])]
+    spread = [w["sessions"] for w in busy["workers"]]
+    print(f"workers            {workers} (cores: {os.cpu_count()})")
+    print(f"seed               {seed_entries} entries, {size / 1e6:.1f} MB checkpoint, built in {seed_ms:.0f} ms")
+    print(f"sessions           {busy['sessions']}  ({busy['sessions'] / cores:.0f} per core, spread {min(spread)}..{max(spread)})")
+    print(f"open               {sessions / open_s:9.0f} sessions/s   p50 {open_hist.percentile(50):.2f} ms  p99 {open_hist.percentile(99):.2f} ms")
+    print(f"requests           {len(jobs) / op_s:9.0f} ops/s  ({len(jobs) / op_s / cores:.0f} per core)")
+    print(f"latency            p50 {op_hist.percentile(50):.2f} ms  p95 {op_hist.percentile(95):.2f} ms  p99 {op_hist.percentile(99):.2f} ms")
+    print(f"memory / session   {sum(rss) / max(1, sessions) * 1000:.0f} kB  (worker RSS growth)")
+    os.remove(path)
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:]]
+    main(*args)
@@ -0,0 +1,66 @@
+"""
+ConsciousThalamus startup cost: lazy organ registry vs. eager loading.
+
+Each scenario runs in a fresh interpreter and reports the time to import
+core/thalamus.py, to construct ConsciousThalamus, and (for "eager") to
+resolve every organ as the old constructor did, plus which heavy
+third-party stacks ended up in sys.modules.
+
+Usage:
+    python benchmarks/bench_thalamus_import.py
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+CORE = Path(__file__).resolve().parent.parent / "core"
+HEAVY = ("cv2", "speech_recognition", "numpy")
+
+PROBE = r"""
+import json, os, sys, tempfile, time
+sys.path.append({core!r})
+os.chdir(tempfile.mkdtemp())
+t0 = time.perf_counter()
+import thalamus
+t1 = time.perf_counter()
+th = thalamus.ConsciousThalamus(headless={headless})
+t2 = time.perf_counter()
+errors = {{}}
+if {eager}:
+    for name in th.organs.specs:
+        try:
+            th.organs.get(name)
+        except Exception as e:
+            errors[name] = type(e).__name__ + ": " + str(e)
+t3 = time.perf_counter()
+print(json.dumps({{
+    "import_ms": (t1 - t0) * 1000, "construct_ms": (t2 - t1) * 1000, "organs_ms": (t3 - t2) * 1000,
+    "loaded": th.organs.loaded(), "errors": errors,
+    "heavy": [m for m in {heavy!r} if m in sys.modules],
+}}))
+"""
+
+def run(headless, eager):
+    code = PROBE.format(core=str(CORE), headless=headless, eager=eager, heavy=HEAVY)
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    if out.returncode:
+        return {"failed": out.stderr.strip().splitlines()[-1]}
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+def main():
+    scenarios = [("headless, lazy", True, False), ("full, lazy", False, False), ("full, eager", False, True)]
+    print(f"{'scenario':>16} {'import ms':>10} {'construct ms':>13} {'organs ms':>10}  loaded / heavy modules")
+    for label, headless, eager in scenarios:
+        r = run(headless, eager)
+        if "failed" in r:
+            print(f"{label:>16}  failed: {r['failed']}")
+            continue
+        print(f"{label:>16} {r['import_ms']:>10.1f} {r['construct_ms']:>13.1f} {r['organs_ms']:>10.1f}"
+              f"  {len(r['loaded'])} organs / {', '.join(r['heavy']) or '-'}")
+        for name, err in r["errors"].items():
+            print(f"{'':>16}   {name}: {err}")
+
+if __name__ == "__main__":
+    main()
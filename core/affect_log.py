@@ -0,0 +1,178 @@
+"""
+Affect Log – background, append-only time series of emotional state.
+The Amygdala hands over its latest snapshot and returns immediately; a
+writer thread wakes every flush_interval seconds and appends only the
+newest snapshot each log was given (intermediate ones are coalesced away)
+as one JSON line.
+
+Every AffectLog on the same file shares one module-level writer (one
+thread, one atexit hook, one append per flush), so a process with many
+Amygdalas still has a single writer per file. Each line carries the
+source id of the log that offered it.
+
+Line format:
+    {"t": "<utc iso>", "src": "<pid>:<n>", "stage": "Flow", "emotions": {"joy": 0.3, ...}}
+"""
+
+import atexit
+import itertools
+import json
+import os
+import threading
+from datetime import datetime, timezone
+
+_writers = {}                 # absolute path → _SharedWriter
+_writers_lock = threading.Lock()
+_sources = itertools.count(1)
+
+class _SharedWriter:
+    def __init__(self, path, flush_interval):
+        self.path = path
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._pending = {}    # AffectLog → (epoch, stage, values) not yet written
+        self._logs = set()    # attached AffectLogs
+        self._wake = threading.Event()
+        self._closed = False
+        self._worker = None
+
+    def attach(self, log):
+        with self._lock:
+            self._logs.add(log)
+            self.flush_interval = min(self.flush_interval, log.flush_interval)
+
+    def detach(self, log):
+        """Write log's pending snapshot; the last log to leave stops the thread."""
+        self.flush(log)
+        with _writers_lock:
+            with self._lock:
+                self._logs.discard(log)
+                last = not self._logs
+            if last and _writers.get(self.path) is self:
+                del _writers[self.path]
+        if last:
+            self.close()
+
+    def offer(self, log, snapshot):
+        """Returns True if an unwritten snapshot of log was replaced."""
+        with self._lock:
+            coalesced = log in self._pending
+            self._pending[log] = snapshot
+            start = self._worker is None and not self._closed
+        if start:
+            self._start()
+        return coalesced
+
+    def _start(self):
+        with self._lock:
+            if self._worker is not None:
+                return
+            self._worker = threading.Thread(target=self._loop, name="AffectLogWriter", daemon=True)
+            self._worker.start()
+        atexit.register(self.close)
+
+    def _loop(self):
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"[Amygdala] Growth log write failed: {e}")
+
+    def flush(self, log=None):
+        """
+        Append the pending snapshots (of every log, or only of log) in one
+        write. Returns the number of lines written.
+        """
+        with self._lock:
+            if log is None:
+                pending, self._pending = self._pending, {}
+            elif log in self._pending:
+                pending = {log: self._pending.pop(log)}
+            else:
+                pending = {}
+        if not pending:
+            return 0
+        lines = []
+        for owner, (epoch, stage, values) in pending.items():
+            lines.append(json.dumps({
+                "t": datetime.fromtimestamp(epoch, tz=timezone.utc).replace(tzinfo=None).isoformat(),
+                "src": owner.source,
+                "stage": stage,
+                "emotions": {k: round(float(v), 4) for k, v in zip(owner.names, values)},
+            }, ensure_ascii=False, separators=(",", ":")) + "\n")
+            owner.stats["written"] += 1
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write("".join(lines))
+        return len(lines)
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._wake.set()
+        if self._worker is not None and self._worker is not threading.current_thread():
+            self._worker.join(timeout=5.0)
+        self.flush()
+
+def _attach(log):
+    """The shared writer for log.path, with log attached to it."""
+    key = os.path.abspath(log.path)
+    with _writers_lock:
+        writer = _writers.get(key)
+        if writer is None:
+            writer = _writers[key] = _SharedWriter(key, log.flush_interval)
+        writer.attach(log)
+        return writer
+
+class AffectLog:
+    def __init__(self, path="emotional_growth_log.jsonl", flush_interval: float = 2.0, names=(), source=None):
+        """
+        source: id written into this log's lines (default "<pid>:<n>",
+        unique per AffectLog in the process).
+        """
+        self.path = path
+        self.flush_interval = flush_interval
+        self.names = tuple(names)     # emotion order of the snapshot vectors
+        self.source = source if source is not None else f"{os.getpid()}:{next(_sources)}"
+        self._closed = False
+        self.stats = {"offered": 0, "written": 0, "coalesced": 0}
+        self._writer = _attach(self)
+
+    def offer(self, epoch: float, stage: str, values):
+        """
+        Record the newest state; never blocks on disk.
+        values is a sequence (or array copy) in self.names order.
+        """
+        if self._closed:
+            return
+        if self._writer.offer(self, (epoch, stage, values)):
+            self.stats["coalesced"] += 1
+        self.stats["offered"] += 1
+
+    def flush(self):
+        """
+        Append this log's pending snapshot, if any. Returns True if a line was written.
+        """
+        return self._writer.flush(self) > 0
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._writer.detach(self)
+
+    def read(self, all_sources: bool = False):
+        """
+        The recorded series, oldest first, as a list of dicts: this log's
+        lines, or every line in the file with all_sources.
+        """
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                lines = [json.loads(line) for line in f if line.strip()]
+        except FileNotFoundError:
+            return []
+        if all_sources:
+            return lines
+        return [line for line in lines if line.get("src") == self.source]
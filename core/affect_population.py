@@ -0,0 +1,265 @@
+"""
+Affect Population – one agents × emotions matrix for many personas.
+Every Amygdala owns a row. Decay, homeostasis, metrics, stage
+classification and dominant-emotion extraction run over all rows in one
+vectorized call, and a single Amygdala's own reads and writes touch only
+its row (a view, never a copy).
+
+Per-row columns kept next to the matrix:
+    settled_at   monotonic time the row was last decayed to
+    metrics      mean, var, energy, entropy of the non-neutral emotions
+    stage_codes  index into STAGES
+"""
+
+import threading
+import time
+
+import numpy as np
+
+# fixed emotion order: index i of every affect vector is EMOTIONS[i]
+EMOTIONS = (
+    "joy","sadness","anger","fear",
+    "trust","surprise","anticipation","calm",
+    "curiosity","gratitude","wonder","resolve",
+    "focus","frustration","serenity","bond",
+    "anxiety","neutral"
+)
+EMOTION_INDEX = {name: i for i, name in enumerate(EMOTIONS)}
+NEUTRAL = EMOTION_INDEX["neutral"]
+_ACTIVE = slice(0, NEUTRAL)   # neutral is last, so the rest is one contiguous view
+
+# simple opponent pairs (tunable)
+ANTAGONISTS = {
+    "joy":"sadness","sadness":"joy","anger":"calm","calm":"anger",
+    "fear":"resolve","resolve":"fear","anxiety":"serenity","serenity":"anxiety",
+    "trust":"surprise","surprise":"trust","frustration":"gratitude",
+    "gratitude":"frustration","focus":"curiosity","curiosity":"focus",
+    "bond":"anticipation","anticipation":"bond","wonder":"focus"
+}
+
+STAGES = ("Calm", "Flow", "Surge")
+METRICS = ("mean", "var", "energy", "entropy")
+
+# legacy pulse decay: 0.01 per tick at the thalamus' default 1.33 Hz
+TICK_DECAY = 0.01
+PULSE_HZ = 1.33
+SETTLE_EPS = 1e-3   # seconds; shorter gaps are left to accumulate
+
+def antagonist_index(antagonists: dict):
+    """Index array: opp[i] is the antagonist of emotion i, or -1."""
+    opp = np.full(len(EMOTIONS), -1, dtype=np.int64)
+    for name, other in antagonists.items():
+        opp[EMOTION_INDEX[name]] = EMOTION_INDEX[other]
+    return opp
+
+# ---------- ROW KERNELS (any (k, emotions) block, in place) ----------
+def homeostasis(block):
+    # keep total energy bounded; let 'neutral' act as a ballast
+    total_non_neutral = block[:, _ACTIVE].sum(axis=1)
+    # softly push neutral toward 1 - clamp to [0,1]
+    block[:, NEUTRAL] = np.clip(1.0 - 0.5 * np.minimum(1.0, total_non_neutral), 0.0, 1.0)
+
+def measure(block):
+    """(k, 4) array of mean, var, energy, entropy over the non-neutral emotions."""
+    vals = block[:, _ACTIVE]
+    out = np.empty((len(block), len(METRICS)))
+    out[:, 0] = vals.mean(axis=1)
+    out[:, 1] = vals.var(axis=1)
+    energy = out[:, 2] = vals.sum(axis=1)              # overall activation
+    live = energy > 1e-9
+    p = vals / np.where(live, energy, 1.0)[:, None]
+    out[:, 3] = np.where(live, -(p * np.log(p + 1e-9)).sum(axis=1), 0.0)
+    return out
+
+def classify(mean, energy):
+    # stage thresholds (tweak as you like)
+    surge = (energy >= 6.0) | (mean > 0.45)
+    flow = (energy >= 2.5) | (mean > 0.25)
+    return np.where(surge, 2, np.where(flow, 1, 0)).astype(np.int8)
+
+class AffectPopulation:
+    def __init__(self, capacity: int = 64, decay_mode="linear", decay_rate: float = None,
+                 antagonists: dict = None):
+        """
+        decay_mode: "linear" (decay_rate units/s) or "exponential" (v *= e^-rate·dt),
+        applied lazily from elapsed monotonic time; None disables time decay.
+        decay_rate defaults to the legacy tick rate, TICK_DECAY * PULSE_HZ.
+        """
+        if decay_mode not in (None, "linear", "exponential"):
+            raise ValueError(f"Unknown decay mode: {decay_mode}")
+        self.decay_mode = decay_mode
+        self.decay_rate = TICK_DECAY * PULSE_HZ if decay_rate is None else decay_rate
+        self.antagonists = dict(ANTAGONISTS if antagonists is None else antagonists)
+        self._opp = antagonist_index(self.antagonists)
+
+        capacity = max(1, capacity)
+        self.matrix = np.zeros((capacity, len(EMOTIONS)), dtype=np.float64)
+        self.settled_at = np.zeros(capacity, dtype=np.float64)
+        self.metrics = np.zeros((capacity, len(METRICS)), dtype=np.float64)
+        self.stage_codes = np.zeros(capacity, dtype=np.int8)
+        self._live = np.zeros(capacity, dtype=bool)
+        self._free = []
+        self.lock = threading.RLock()   # taken by every write; facades on other threads share the matrix
+        self._n = 0   # rows ever handed out
+
+    # ---------- ROWS ----------
+    def allocate(self):
+        """Claim a row at rest (neutral = 1) and return its index."""
+        with self.lock:
+            if self._free:
+                row = self._free.pop()
+            else:
+                self._reserve(self._n + 1)
+                row = self._n
+                self._n += 1
+            self.matrix[row] = 0.0
+            self.matrix[row, NEUTRAL] = 1.0
+            self.settled_at[row] = time.monotonic()
+            self._live[row] = True
+            self.refresh(row)
+            return row
+
+    def release(self, row: int):
+        with self.lock:
+            if self._live[row]:
+                self._live[row] = False
+                self._free.append(row)
+
+    def spawn(self, **kwargs):
+        """New Amygdala facade on a fresh row (window off unless given)."""
+        from amygdala import Amygdala
+        kwargs.setdefault("window", None)
+        return Amygdala(population=self, **kwargs)
+
+    def _reserve(self, needed: int):
+        cap = len(self.matrix)
+        if needed <= cap:
+            return
+        while cap < needed:
+            cap *= 2
+        def grow(arr, fill=0):
+            out = np.full((cap,) + arr.shape[1:], fill, dtype=arr.dtype)
+            out[:len(arr)] = arr
+            return out
+        self.matrix = grow(self.matrix)
+        self.settled_at = grow(self.settled_at)
+        self.metrics = grow(self.metrics)
+        self.stage_codes = grow(self.stage_codes)
+        self._live = grow(self._live, False)
+
+    def rows(self):
+        """Indices of live rows."""
+        return np.flatnonzero(self._live[:self._n])
+
+    def __len__(self):
+        return int(self._live[:self._n].sum())
+
+    # ---------- SINGLE ROW ----------
+    def settle_row(self, row: int, now: float = None):
+        """
+        Decay one row up to now. Returns True if its state changed.
+        """
+        with self.lock:
+            if self.decay_mode is None:
+                return False
+            now = time.monotonic() if now is None else now
+            dt = now - self.settled_at[row]
+            if dt < SETTLE_EPS:
+                return False
+            self.settled_at[row] = now
+            block = self.matrix[row:row + 1]
+            if not block[:, _ACTIVE].any():
+                return False
+            self._decay(block, np.array([dt]))
+            homeostasis(block)
+            self.refresh(row)
+            return True
+
+    def rebalance(self, row: int):
+        homeostasis(self.matrix[row:row + 1])
+
+    def refresh(self, row: int):
+        m = measure(self.matrix[row:row + 1])
+        self.metrics[row] = m[0]
+        self.stage_codes[row] = classify(m[:, 0], m[:, 2])[0]
+
+    def _decay(self, block, dt):
+        a = block[:, _ACTIVE]
+        if self.decay_mode == "linear":
+            a -= (self.decay_rate * dt)[:, None]
+            np.maximum(a, 0.0, out=a)
+        else:
+            a *= np.exp(-self.decay_rate * dt)[:, None]
+
+    # ---------- WHOLE POPULATION ----------
+    def settle(self, now: float = None):
+        """
+        Decay every live row to now, rebalance neutral and refresh metrics
+        and stages in one pass. Returns the number of rows updated.
+        """
+        with self.lock:
+            if self.decay_mode is None:
+                return 0
+            now = time.monotonic() if now is None else now
+            n = self._n
+            due = self._live[:n] & (now - self.settled_at[:n] >= SETTLE_EPS)
+            idx = np.flatnonzero(due)
+            if not len(idx):
+                return 0
+            block = self.matrix[idx]
+            self._decay(block, now - self.settled_at[idx])
+            self._commit(idx, block)
+            self.settled_at[idx] = now
+            return len(idx)
+
+    def apply_deltas(self, deltas, rows=None):
+        """
+        Add a (k, emotions) delta block to rows (default: all live rows, in
+        order), clamp, oppose antagonists, rebalance and refresh at once.
+        """
+        with self.lock:
+            idx = self.rows() if rows is None else np.asarray(rows, dtype=np.int64)
+            if self.decay_mode is not None:
+                self.settle()
+            d = np.asarray(deltas, dtype=np.float64).reshape(len(idx), len(EMOTIONS))
+            block = self.matrix[idx]
+            block += d
+            np.clip(block, 0.0, 1.0, out=block)
+            src = np.flatnonzero(self._opp >= 0)
+            opp = np.zeros_like(block)
+            np.add.at(opp, (slice(None), self._opp[src]), 0.5 * d[:, src])
+            block -= opp
+            np.clip(block, 0.0, 1.0, out=block)
+            self._commit(idx, block)
+
+    def _commit(self, idx, block):
+        homeostasis(block)
+        self.matrix[idx] = block
+        m = measure(block)
+        self.metrics[idx] = m
+        self.stage_codes[idx] = classify(m[:, 0], m[:, 2])
+
+    def stages(self):
+        """Stage name per live row, after settling."""
+        self.settle()
+        return [STAGES[c] for c in self.stage_codes[self.rows()]]
+
+    def dominant(self, top_n: int = 3, min_thresh: float = 0.12):
+        """
+        Dominant emotions per live row (same rule as Amygdala.get_dominant).
+        """
+        self.settle()
+        idx = self.rows()
+        vals = self.matrix[idx, _ACTIVE]
+        k = min(top_n, vals.shape[1])
+        top = np.argsort(-vals, axis=1, kind="stable")[:, :k]
+        strong = np.take_along_axis(vals, top, axis=1) >= min_thresh
+        out = []
+        for names, keep in zip(top.tolist(), strong.tolist()):
+            dom = [EMOTIONS[i] for i, ok in zip(names, keep) if ok]
+            out.append(dom or ["neutral"])
+        return out
+
+    def nbytes(self):
+        return (self.matrix.nbytes + self.settled_at.nbytes + self.metrics.nbytes
+                + self.stage_codes.nbytes + self._live.nbytes)
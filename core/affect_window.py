@@ -0,0 +1,116 @@
+"""
+Affect Window – fixed-size ring buffer of emotion vectors with running stats.
+Each push updates, in O(emotions) time and without rescanning the window:
+
+    ewma        exponentially weighted moving average (alpha per sample)
+    mean / var  rolling mean and variance over the last `size` samples
+                (sliding Welford update: add the new sample, retire the oldest)
+    min / max   rolling extremes via one monotonic deque per emotion
+                (amortized O(1) per emotion)
+
+Readers (heartbeat, SentienceHypothesis, thalamus vitals) just look the
+numbers up.
+"""
+
+from collections import deque
+
+import numpy as np
+
+class AffectWindow:
+    def __init__(self, size: int = 256, dims: int = 18, alpha: float = 0.1, names=()):
+        if size < 1:
+            raise ValueError("window size must be >= 1")
+        self.size = size
+        self.alpha = alpha
+        self.names = tuple(names)
+        self._ring = np.zeros((size, dims), dtype=np.float64)
+        self._seq = 0                      # samples ever pushed
+        self.ewma = np.zeros(dims)
+        self.mean = np.zeros(dims)
+        self._m2 = np.zeros(dims)          # sum of squared deviations in the window
+        self._lo = [deque() for _ in range(dims)]   # (seq, value), increasing values
+        self._hi = [deque() for _ in range(dims)]   # (seq, value), decreasing values
+
+    def push(self, x):
+        x = np.asarray(x, dtype=np.float64)
+        seq = self._seq
+        slot = seq % self.size
+        n_before = min(seq, self.size)
+
+        if seq == 0:
+            self.ewma[:] = x
+        else:
+            self.ewma += self.alpha * (x - self.ewma)
+
+        if n_before < self.size:
+            # window still filling: plain Welford
+            delta = x - self.mean
+            self.mean += delta / (n_before + 1)
+            self._m2 += delta * (x - self.mean)
+        else:
+            # full: replace the oldest sample
+            old = self._ring[slot]
+            old_mean = self.mean.copy()
+            self.mean += (x - old) / self.size
+            self._m2 += (x - old) * (x - self.mean + old - old_mean)
+            np.maximum(self._m2, 0.0, out=self._m2)
+        self._ring[slot] = x
+
+        expired = seq - self.size
+        for i, v in enumerate(x.tolist()):
+            lo, hi = self._lo[i], self._hi[i]
+            while lo and lo[-1][1] >= v:
+                lo.pop()
+            lo.append((seq, v))
+            if lo[0][0] <= expired:
+                lo.popleft()
+            while hi and hi[-1][1] <= v:
+                hi.pop()
+            hi.append((seq, v))
+            if hi[0][0] <= expired:
+                hi.popleft()
+        self._seq = seq + 1
+
+    # ---------- READ ----------
+    def __len__(self):
+        return min(self._seq, self.size)
+
+    @property
+    def var(self):
+        n = len(self)
+        return self._m2 / n if n else np.zeros_like(self._m2)
+
+    @property
+    def min(self):
+        return np.array([d[0][1] if d else 0.0 for d in self._lo])
+
+    @property
+    def max(self):
+        return np.array([d[0][1] if d else 0.0 for d in self._hi])
+
+    def volatility(self):
+        """Mean rolling standard deviation across emotions."""
+        return float(np.sqrt(self.var).mean()) if len(self) > 1 else 0.0
+
+    def latest(self):
+        return self._ring[(self._seq - 1) % self.size].copy() if self._seq else None
+
+    def window(self):
+        """Samples currently held, oldest first (a copy; for inspection)."""
+        n = len(self)
+        start = self._seq % self.size if self._seq >= self.size else 0
+        return np.roll(self._ring, -start, axis=0)[:n]
+
+    def as_dict(self, arr, digits: int = 3):
+        return dict(zip(self.names, np.round(arr, digits).tolist()))
+
+    def summary(self, digits: int = 3):
+        return {
+            "samples": len(self),
+            "ewma": self.as_dict(self.ewma, digits),
+            "mean": self.as_dict(self.mean, digits),
+            "var": self.as_dict(self.var, digits),
+            "min": self.as_dict(self.min, digits),
+            "max": self.as_dict(self.max, digits),
+            "volatility": round(self.volatility(), digits),
+        }
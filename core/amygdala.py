@@ -1,35 +1,156 @@
-import json, math, random, time
-from collections import defaultdict
+import functools, json, random, threading, time
+from collections.abc import MutableMapping
+from contextlib import contextmanager
+
+import numpy as np
+
+from affect_log import AffectLog
+from affect_window import AffectWindow
+
+from affect_population import (
+    AffectPopulation, EMOTIONS, EMOTION_INDEX, NEUTRAL, ANTAGONISTS, STAGES, METRICS,
+    TICK_DECAY, antagonist_index,
+)
+
+def _locked(method):
+    """Run an Amygdala write under its population's lock (rows share one matrix)."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._pop.lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+class EmotionView(MutableMapping):
+    """Dict-style window onto the affect array (emotional_core[name] reads/writes one slot)."""
+    __slots__ = ("_owner",)
+
+    def __init__(self, owner):
+        self._owner = owner
+
+    def __getitem__(self, name):
+        self._owner._settle()
+        return float(self._owner._v[EMOTION_INDEX[name]])
+
+    def __setitem__(self, name, value):
+        with self._owner._pop.lock:
+            self._owner._settle()
+            self._owner._v[EMOTION_INDEX[name]] = value
+
+    def __delitem__(self, name):
+        raise TypeError("emotions are fixed; set them to 0.0 instead")
+
+    def __contains__(self, name):
+        return name in EMOTION_INDEX
+
+    def __iter__(self):
+        return iter(EMOTIONS)
+
+    def __len__(self):
+        return len(EMOTIONS)
+
+    def items(self):
+        self._owner._settle()
+        return zip(EMOTIONS, self._owner._v.tolist())
+
+    def values(self):
+        self._owner._settle()
+        return self._owner._v.tolist()
+
+    def copy(self):
+        self._owner._settle()
+        return dict(zip(EMOTIONS, self._owner._v.tolist()))
+
+    def __repr__(self):
+        return repr(self.copy())
+
+class AffectBatch:
+    """
+    Handle yielded by Amygdala.batch(); steps are the deferred deltas in
+    call order, packet holds the combined trace after commit.
+    """
+    __slots__ = ("steps", "count", "packet")
+
+    def __init__(self):
+        self.steps = []       # (index, delta) from adjust, or a delta vector from apply_deltas
+        self.count = 0
+        self.packet = None
 
 class Amygdala:
-    def __init__(self, debug=False):
+    def __init__(self, debug=False, growth_log=None, flush_interval: float = 2.0,
+                 decay_mode="linear", decay_rate: float = None, population: AffectPopulation = None,
+                 window: int = 256, window_alpha: float = 0.1):
+        """
+        growth_log: path of a JSONL time series of emotional state, appended
+        in the background every flush_interval seconds (default None: no log).
+        decay_mode: "linear" (decay_rate units/s) or "exponential" (v *= e^-rate·dt),
+        applied lazily from elapsed monotonic time whenever state is read or
+        written; None keeps the old per-call decay_emotions(rate) only.
+        decay_rate defaults to the legacy tick rate (TICK_DECAY per pulse at PULSE_HZ).
+        population: shared AffectPopulation to take a row in (its decay
+        settings apply); by default the Amygdala gets a private one.
+        window: samples kept in the AffectWindow (EWMA, rolling var, min/max),
+        fed on every emotion event and heartbeat; 0/None disables it.
+        """
         self.debug = debug
-        self.emotional_core = {
-            "joy":0.0,"sadness":0.0,"anger":0.0,"fear":0.0,
-            "trust":0.0,"surprise":0.0,"anticipation":0.0,"calm":0.0,
-            "curiosity":0.0,"gratitude":0.0,"wonder":0.0,"resolve":0.0,
-            "focus":0.0,"frustration":0.0,"serenity":0.0,"bond":0.0,
-            "anxiety":0.0,"neutral":1.0
-        }
-        # simple opponent pairs (tunable)
-        self.antagonists = {
-            "joy":"sadness","sadness":"joy","anger":"calm","calm":"anger",
-            "fear":"resolve","resolve":"fear","anxiety":"serenity","serenity":"anxiety",
-            "trust":"surprise","surprise":"trust","frustration":"gratitude",
-            "gratitude":"frustration","focus":"curiosity","curiosity":"focus",
-            "bond":"anticipation","anticipation":"bond","wonder":"focus"
-        }
-        self.stage = "Calm"
+        self._pop = population if population is not None else AffectPopulation(capacity=1, decay_mode=decay_mode, decay_rate=decay_rate)
+        self._row = self._pop.allocate()
+        self.emotional_core = EmotionView(self)
+        self.antagonists = dict(ANTAGONISTS)
+        self._opp = antagonist_index(self.antagonists)
         self._log_tick = 0
         self._last_beat = time.time()
+        self._local = threading.local()   # .batch: the open batch of this thread
+        self.growth_log = AffectLog(growth_log, flush_interval, EMOTIONS) if growth_log else None
+        self.window = AffectWindow(window, len(EMOTIONS), window_alpha, EMOTIONS) if window else None
+
+    @property
+    def _v(self):
+        # this persona's row of the population matrix (a view)
+        return self._pop.matrix[self._row]
+
+    @property
+    def _batch(self):
+        return getattr(self._local, "batch", None)
+
+    @property
+    def _stage(self):
+        return STAGES[self._pop.stage_codes[self._row]]
+
+    @property
+    def _metrics(self):
+        return {k: round(float(x), 3) for k, x in zip(METRICS, self._pop.metrics[self._row])}
+
+    @property
+    def population(self):
+        return self._pop
+
+    @property
+    def decay_mode(self):
+        return self._pop.decay_mode
+
+    @property
+    def decay_rate(self):
+        return self._pop.decay_rate
+
+    @property
+    def lazy_decay(self):
+        """True when decay follows the clock and needs no pulse."""
+        return self._pop.decay_mode is not None
+
+    @property
+    def stage(self):
+        self._settle()
+        return self._stage
 
     # ---------- READ ----------
     def get_emotions(self):
         return self.emotional_core.copy()
 
     def get_dominant(self, top_n: int = 3, min_thresh: float = 0.12):
-        s = sorted(self.emotional_core.items(), key=lambda kv: kv[1], reverse=True)
-        dom = [k for k, v in s if v >= min_thresh and k != "neutral"][:top_n]
+        self._settle()
+        v = self._v
+        order = np.argsort(-v, kind="stable")
+        dom = [EMOTIONS[i] for i in order if v[i] >= min_thresh and i != NEUTRAL][:top_n]
         return dom or ["neutral"]
 
     # ---------- WRITE ----------
@@ -39,77 +160,187 @@ class Amygdala:
     def mutate_emotion(self, name: str, delta: float = 0.1, trace=False):
         return self.adjust_emotion(name, delta, trace=trace)
 
+    mutate = mutate_emotion  # organs call emotion.mutate(name, delta)
+
+    @_locked
     def adjust_emotion(self, name: str, delta: float = 0.1, trace=False):
         name = name.lower()
-        if name not in self.emotional_core: return None
-        old = self.emotional_core[name]
-        self.emotional_core[name] = max(0.0, min(1.0, old + delta))
+        i = EMOTION_INDEX.get(name)
+        if i is None: return None
+        b = self._batch
+        if b is not None:
+            b.steps.append((i, delta))
+            b.count += 1
+            return None
+        self._settle()
+        old = float(self._v[i])
+        d = np.zeros(len(EMOTIONS))
+        d[i] = delta
+        self._apply(d)
+        new = float(self._v[i])
+        pkt = self._trace("adjust", name=name, old=old, new=new, delta=delta)
+        if self.debug:
+            print(f"[Amygdala] {name}: {old:.2f} → {new:.2f} (Δ{delta:+.2f})")
+        return pkt if trace else None
 
-        # oppose the antagonist a bit for balance
-        opp = self.antagonists.get(name)
-        if opp and delta != 0:
-            self.emotional_core[opp] = max(0.0, min(1.0, self.emotional_core[opp] - 0.5*delta))
+    @_locked
+    def apply_deltas(self, deltas, trace=False):
+        """
+        Apply many emotion deltas in one vectorized pass: clamp, oppose
+        antagonists, rebalance neutral and recompute metrics once.
+        deltas is an array in EMOTIONS order or a {name: delta} dict.
+        """
+        if isinstance(deltas, dict):
+            d = np.zeros(len(EMOTIONS))
+            for name, delta in deltas.items():
+                i = EMOTION_INDEX.get(name.lower())
+                if i is not None:
+                    d[i] += delta
+        else:
+            d = np.asarray(deltas, dtype=np.float64)
+        b = self._batch
+        if b is not None:
+            b.steps.append(d.copy())
+            b.count += int(np.count_nonzero(d))
+            return None
+        self._settle()
+        old = self._v.copy()
+        self._apply(d)
+        changed = {EMOTIONS[i]: (float(old[i]), float(self._v[i])) for i in np.flatnonzero(old != self._v)}
+        pkt = self._trace("apply", changed=changed)
+        if self.debug:
+            print(f"[Amygdala] Applied {int(np.count_nonzero(d))} deltas → {self.stage}")
+        return pkt if trace else None
+
+    @contextmanager
+    def batch(self):
+        """
+        Coalesce adjustments: inside the block adjust/inject/mutate/apply_deltas
+        of this thread only record their deltas; on exit they are replayed in
+        call order (clamp and antagonist opposition per step, so the values
+        match applying them one by one) under one lock hold, with a single
+        homeostasis/metrics update and one combined "batch" trace. Other
+        threads write straight through. An exception discards the batch.
+        Nested batches fold into the outermost one.
 
+            with amygdala.batch() as b:
+                amygdala.mutate("joy", 0.05)
+                amygdala.mutate("fear", -0.2)
+            b.packet  # combined trace
+        """
+        if self._batch is not None:
+            yield self._batch
+            return
+        b = self._local.batch = AffectBatch()
+        try:
+            yield b
+        finally:
+            self._local.batch = None
+        if not b.count:
+            return
+        with self._pop.lock:
+            self._settle()
+            old = self._v.copy()
+            for step in b.steps:
+                self._step(step)
+            self._homeostasis()
+            self._update_stage_and_metrics()
+            changed = {EMOTIONS[i]: (float(old[i]), float(self._v[i])) for i in np.flatnonzero(old != self._v)}
+            b.packet = self._trace("batch", adjustments=b.count, changed=changed)
+        if self.debug:
+            print(f"[Amygdala] Committed batch of {b.count} adjustments → {self.stage}")
+
+    def _apply(self, d):
+        self._step(d)
         self._homeostasis()
         self._update_stage_and_metrics()
-        pkt = self._trace("adjust", name=name, old=old, new=self.emotional_core[name], delta=delta)
-        if self.debug:
-            print(f"[Amygdala] {name}: {old:.2f} → {self.emotional_core[name]:.2f} (Δ{delta:+.2f})")
-        return pkt if trace else None
 
+    def _step(self, d):
+        """Add one delta (vector, or (index, delta)), clamp and oppose antagonists."""
+        v = self._v
+        if isinstance(d, tuple):
+            i, delta = d
+            v[i] = min(1.0, max(0.0, v[i] + delta))
+            j = self._opp[i]
+            if j >= 0 and delta:
+                # oppose the antagonist a bit for balance
+                v[j] = min(1.0, max(0.0, v[j] - 0.5 * delta))
+            return
+        np.add(v, d, out=v)
+        np.clip(v, 0.0, 1.0, out=v)
+        # oppose the antagonist a bit for balance
+        src = np.flatnonzero((d != 0) & (self._opp >= 0))
+        if len(src):
+            np.subtract.at(v, self._opp[src], 0.5 * d[src])
+            np.clip(v, 0.0, 1.0, out=v)
+
+    @_locked
     def set_emotion(self, name: str, value: float, trace=False):
         name = name.lower()
-        if name not in self.emotional_core: return None
-        old = self.emotional_core[name]
+        i = EMOTION_INDEX.get(name)
+        if i is None: return None
+        self._settle()
+        old = float(self._v[i])
         clamped = max(0.0, min(1.0, value))
-        self.emotional_core[name] = clamped
+        self._v[i] = clamped
         self._homeostasis(); self._update_stage_and_metrics()
         pkt = self._trace("set", name=name, old=old, new=clamped)
         if self.debug: print(f"[Amygdala] Set {name}: {old:.2f} → {clamped:.2f}")
         return pkt if trace else None
 
     # one decay path (merges your two)
-    def decay_emotions(self, rate: float = 0.01, trace=False):
-        changed = {}
-        for e, v in self.emotional_core.items():
-            nv = max(0.0, v - rate)
-            if nv != v:
-                self.emotional_core[e] = nv
-                changed[e] = (v, nv)
-                if self.debug: print(f"[Amygdala] Decayed {e}: {v:.2f} → {nv:.2f}")
+    @_locked
+    def decay_emotions(self, rate: float = None, trace=False):
+        """
+        With lazy decay and no rate this only brings state up to date (the
+        pulse no longer needs to call it). An explicit rate subtracts that
+        much at once, as a legacy tick did.
+        """
+        if rate is None:
+            if self.lazy_decay:
+                if not trace:
+                    return None
+                self._settle()
+                return self._trace("decay", changed={})
+            rate = TICK_DECAY
+        self._settle()
+        v = self._v
+        old = v.copy()
+        np.subtract(v, rate, out=v)
+        np.maximum(v, 0.0, out=v)
+        moved = np.flatnonzero(old != v)
+        changed = {EMOTIONS[i]: (float(old[i]), float(v[i])) for i in moved}
+        if self.debug:
+            for e, (a, b) in changed.items(): print(f"[Amygdala] Decayed {e}: {a:.2f} → {b:.2f}")
         self._homeostasis(); self._update_stage_and_metrics()
         return self._trace("decay", changed=changed) if trace else None
 
+    @_locked
     def randomize_emotion(self, trace=False):
-        target = random.choice(list(self.emotional_core.keys()))
-        old = self.emotional_core[target]
+        target = random.choice(EMOTIONS)
+        i = EMOTION_INDEX[target]
+        self._settle()
+        old = float(self._v[i])
         new_val = round(random.uniform(0.1, 1.0), 2)
-        self.emotional_core[target] = new_val
+        self._v[i] = new_val
         self._homeostasis(); self._update_stage_and_metrics()
         if self.debug: print(f"[Amygdala] Randomized {target}: {old:.2f} → {new_val:.2f}")
         return self._trace("randomize", name=target, old=old, new=new_val) if trace else target
 
+    def _settle(self, now: float = None):
+        """
+        Apply the analytic decay for the monotonic time elapsed since the
+        last settle. Costs nothing while nobody reads or writes.
+        """
+        self._pop.settle_row(self._row, now)
+
     # ---------- METRICS / STAGING ----------
     def _homeostasis(self):
         # keep total energy bounded; let 'neutral' act as a ballast
-        total_non_neutral = sum(v for k, v in self.emotional_core.items() if k != "neutral")
-        # softly push neutral toward 1 - clamp to [0,1]
-        self.emotional_core["neutral"] = max(0.0, min(1.0, 1.0 - 0.5*min(1.0, total_non_neutral)))
+        self._pop.rebalance(self._row)
 
     def _update_stage_and_metrics(self):
-        vals = [v for k, v in self.emotional_core.items() if k != "neutral"]
-        mean = sum(vals) / (len(vals) or 1)
-        var = sum((v-mean)**2 for v in vals) / (len(vals) or 1)
-        energy = sum(vals)                          # overall activation
-        entropy = -sum((p:=v/max(1e-9,energy)) * math.log(p+1e-9) for v in vals if energy > 1e-9)
-
-        # stage thresholds (tweak as you like)
-        if energy >= 6.0 or mean > 0.45:   self.stage = "Surge"
-        elif energy >= 2.5 or mean > 0.25: self.stage = "Flow"
-        else:                              self.stage = "Calm"
-
-        self._metrics = {"mean": round(mean,3), "var": round(var,3),
-                         "energy": round(energy,3), "entropy": round(entropy,3)}
+        self._pop.refresh(self._row)
 
     def get_stage(self, verbose=False):
         if not verbose: return self.stage
@@ -120,6 +351,7 @@ class Amygdala:
         }
         return f"{self.stage} :: {desc[self.stage]}"
 
+    @_locked
     def heartbeat(self):
         """Compact packet for GUI/HUD."""
         now = time.time()
@@ -128,23 +360,56 @@ class Amygdala:
             "dominant": self.get_dominant(),
             "metrics": self._metrics,
             "since_last_ms": int((now - self._last_beat)*1000),
-            "snapshot": {k: round(v,3) for k,v in self.emotional_core.items()}
+            "snapshot": dict(zip(EMOTIONS, np.round(self._v, 3).tolist()))
         }
+        if self.window is not None:
+            self.window.push(self._v)
+            beat["trend"] = {"samples": len(self.window),
+                             "ewma": self.window.as_dict(self.window.ewma),
+                             "volatility": round(self.window.volatility(), 3)}
         self._last_beat = now
         return beat
 
+    def get_trend(self):
+        """Windowed statistics (EWMA, rolling mean/var, min/max) or None."""
+        return self.window.summary() if self.window is not None else None
+
     # ---------- IO ----------
     def save_to_disk(self, path="amygdala_log.json"):
-        with open(path, "w") as f: json.dump(self.emotional_core, f, indent=2)
+        with open(path, "w") as f: json.dump(self.get_emotions(), f, indent=2)
         if self.debug: print(f"[Amygdala] Emotional core saved to {path}.")
 
+    @_locked
+    def load_emotions(self, values: dict):
+        """
+        Overwrite the affect vector with saved values (e.g. from a checkpoint)
+        and restage; unknown names are ignored.
+        """
+        self._settle()
+        v = self._v
+        for name, x in values.items():
+            i = EMOTION_INDEX.get(name)
+            if i is not None:
+                v[i] = max(0.0, min(1.0, float(x)))
+        self._update_stage_and_metrics()
+
+    def close(self):
+        """Write the last pending growth-log snapshot and stop the writer."""
+        if self.growth_log is not None:
+            self.growth_log.close()
+
+    def release(self):
+        """Give this persona's row back to a shared population."""
+        self.close()
+        self._pop.release(self._row)
+
     # ---------- INTERNAL ----------
     def _trace(self, event, **data):
         pkt = {"amygdala_event": event, "stage": self.stage,
                "dominant": self.get_dominant(), "metrics": self._metrics, **data}
+        if self.window is not None:
+            self.window.push(self._v)
         self._log_tick += 1
-        if self._log_tick % 5 == 0:
-            with open("emotional_growth_log.json", "w") as f:
-                json.dump(self.emotional_core, f, indent=2)
-            if self.debug: print("[Amygdala] Emotional growth log saved.")
+        if self._log_tick % 5 == 0 and self.growth_log is not None:
+            self.growth_log.offer(time.time(), self.stage, self._v.copy())
         return pkt
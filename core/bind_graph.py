@@ -0,0 +1,100 @@
+"""
+Bind Graph – dependency-ordered, concurrent organ wiring.
+Each step names the steps it depends on. run() executes the graph as a
+topological schedule on a thread pool: a step starts as soon as all of its
+dependencies have succeeded, independent steps run side by side, and a
+failing step only skips the steps downstream of it. Every step's latency
+is recorded.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+class BindGraph:
+    def __init__(self):
+        self._steps = {}   # name → (deps, fn)
+
+    def add(self, name, deps, fn):
+        self._steps[name] = (tuple(deps), fn)
+
+    def __contains__(self, name):
+        return name in self._steps
+
+    def order(self):
+        """
+        A topological order (ties keep insertion order). Raises ValueError on
+        unknown dependencies or cycles.
+        """
+        indegree, children = self._graph()
+        ready = [n for n in self._steps if indegree[n] == 0]
+        out = []
+        while ready:
+            n = ready.pop(0)
+            out.append(n)
+            for c in children[n]:
+                indegree[c] -= 1
+                if indegree[c] == 0:
+                    ready.append(c)
+        if len(out) != len(self._steps):
+            stuck = [n for n in self._steps if n not in out]
+            raise ValueError(f"Bind graph has a cycle through: {', '.join(stuck)}")
+        return out
+
+    def _graph(self):
+        indegree = {n: 0 for n in self._steps}
+        children = {n: [] for n in self._steps}
+        for name, (deps, _) in self._steps.items():
+            for d in deps:
+                if d not in self._steps:
+                    raise ValueError(f"Bind step '{name}' depends on unknown step '{d}'")
+                indegree[name] += 1
+                children[d].append(name)
+        return indegree, children
+
+    def run(self, workers: int = 1, on_result=None):
+        """
+        Execute every step. Returns {name: {"ok", "ms", "error"?, "skipped"?}}.
+        on_result(name, result) is called from the scheduling thread as each
+        step finishes or is skipped.
+        """
+        self.order()  # validate before starting anything
+        indegree, children = self._graph()
+        results = {}
+
+        def finish(name, result):
+            results[name] = result
+            if on_result is not None:
+                on_result(name, result)
+
+        def skip(name, because):
+            finish(name, {"ok": False, "ms": 0.0, "skipped": f"dependency '{because}' failed"})
+            for c in children[name]:
+                if c not in results:
+                    skip(c, name)
+
+        def call(name):
+            t0 = time.perf_counter()
+            try:
+                self._steps[name][1]()
+                return {"ok": True, "ms": round((time.perf_counter() - t0) * 1000, 3)}
+            except Exception as e:
+                return {"ok": False, "ms": round((time.perf_counter() - t0) * 1000, 3), "error": repr(e)}
+
+        with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="ThalamusBind") as pool:
+            running = {pool.submit(call, n): n for n in self._steps if indegree[n] == 0}
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    name = running.pop(fut)
+                    result = fut.result()
+                    finish(name, result)
+                    for c in children[name]:
+                        if c in results:
+                            continue
+                        if not result["ok"]:
+                            skip(c, name)
+                            continue
+                        indegree[c] -= 1
+                        if indegree[c] == 0:
+                            running[pool.submit(call, c)] = c
+        return results
@@ -0,0 +1,154 @@
+"""
+Checkpoint – versioned, single-file snapshot of a whole Halcyon instance.
+Small organ state travels as JSON in the manifest; bulk columns (memory
+records, posting lists) are raw packed arrays, each 64-byte aligned, so a
+restore maps the file and copies every column in one memcpy instead of
+parsing and re-indexing.
+
+Layout:
+    MAGIC (8 bytes) | version u32 | reserved u32 | manifest length u64
+    manifest JSON   {"version", "created", "sections": {name: [offset, nbytes, typecode]}, "state": {...}}
+    padding to 64, then section payloads (offsets are relative to this point)
+"""
+
+from array import array
+from datetime import datetime
+import json
+import mmap
+import os
+import struct
+
+MAGIC = b"HALCKPT\x00"
+VERSION = 1
+ALIGN = 64
+_HEADER = struct.Struct("<8sIIQ")
+
+class CheckpointError(Exception):
+    pass
+
+def _pad(n):
+    return (-n) % ALIGN
+
+class CheckpointWriter:
+    def __init__(self):
+        self.state = {}
+        self._sections = []   # (name, typecode, buffer)
+
+    def add_array(self, name: str, data, typecode: str = None):
+        """Add a packed column: an array.array, bytes/bytearray, or an iterable with typecode."""
+        if isinstance(data, memoryview) and data.format != "B":   # a typed column() view
+            buf, code = data.tobytes(), data.format
+        elif isinstance(data, (bytes, bytearray, memoryview)):
+            buf, code = bytes(data), "B"
+        elif isinstance(data, array):
+            buf, code = data.tobytes(), data.typecode
+        else:
+            arr = array(typecode, data)
+            buf, code = arr.tobytes(), typecode
+        self._sections.append((name, code, buf))
+
+    def write(self, path: str):
+        """Write atomically (temp file + rename). Returns bytes written."""
+        sections, offset = {}, 0
+        for name, code, buf in self._sections:
+            sections[name] = [offset, len(buf), code]
+            offset += len(buf) + _pad(len(buf))
+        manifest = json.dumps({"version": VERSION, "created": datetime.utcnow().isoformat(),
+                               "sections": sections, "state": self.state},
+                              ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        head = _HEADER.pack(MAGIC, VERSION, 0, len(manifest)) + manifest
+        head += b"\0" * _pad(len(head))
+
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(head)
+            for _, _, buf in self._sections:
+                f.write(buf)
+                f.write(b"\0" * _pad(len(buf)))
+            size = f.tell()
+        os.replace(tmp, path)
+        return size
+
+class CheckpointReader:
+    def __init__(self, source):
+        """
+        source: a checkpoint path (memory-mapped) or any buffer holding a
+        checkpoint's bytes, e.g. a SharedMemory segment's buf.
+        """
+        self._file = None
+        if isinstance(source, (str, os.PathLike)):
+            self.path = str(source)
+            self._file = open(source, "rb")
+            try:
+                self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # empty file
+                self._file.close()
+                raise CheckpointError(f"{self.path}: empty checkpoint")
+        else:
+            self.path = "<buffer>"
+            self._map = memoryview(source)
+        path = self.path
+        if len(self._map) < _HEADER.size:
+            self.close()
+            raise CheckpointError(f"{path}: truncated checkpoint")
+        magic, version, _, manifest_len = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self.close()
+            raise CheckpointError(f"{path}: not a Halcyon checkpoint")
+        if version != VERSION:
+            self.close()
+            raise CheckpointError(f"{path}: checkpoint version {version}, expected {VERSION}")
+        start = _HEADER.size
+        manifest = json.loads(bytes(self._map[start:start + manifest_len]).decode("utf-8"))
+        self.version = version
+        self.created = manifest.get("created")
+        self.state = manifest["state"]
+        self.sections = manifest["sections"]
+        self._base = start + manifest_len + _pad(start + manifest_len)
+
+    def __contains__(self, name):
+        return name in self.sections
+
+    def view(self, name: str, start: int = 0, stop: int = None):
+        """Zero-copy memoryview of a section, or of items [start:stop] (valid until close())."""
+        offset, nbytes, code = self.sections[name]
+        size = array(code).itemsize
+        stop = nbytes // size if stop is None else stop
+        lo = self._base + offset
+        return memoryview(self._map)[lo + start * size:lo + stop * size]
+
+    def column(self, name: str, start: int = 0, stop: int = None):
+        """
+        Read-only zero-copy view of items [start:stop], typed with the
+        section's typecode (valid until close(); reads like an array.array).
+        """
+        return self.view(name, start, stop).toreadonly().cast(self.sections[name][2])
+
+    def array(self, name: str, start: int = 0, stop: int = None):
+        """Items [start:stop] of a section as a fresh array.array (one memcpy out of the mapping)."""
+        out = array(self.sections[name][2])
+        view = self.view(name, start, stop)
+        out.frombytes(view)
+        view.release()
+        return out
+
+    def bytes(self, name: str, start: int = 0, stop: int = None):
+        view = self.view(name, start, stop)
+        try:
+            return bytearray(view)
+        finally:
+            view.release()
+
+    def close(self):
+        try:
+            self._map.release() if isinstance(self._map, memoryview) else self._map.close()
+        except (AttributeError, BufferError):
+            pass
+        if self._file is not None:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
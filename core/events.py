@@ -1,6 +1,13 @@
 # events.py
+# The one event bus for core (core/hooks re-exports it). Each event name
+# gets a precompiled handler tuple -- its own subscribers plus the wildcard
+# ones, in priority order -- rebuilt only when subscriptions change, so
+# dispatch is a dict lookup and a loop.
+import itertools
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+WILDCARD = "*"
 
 @dataclass(frozen=True)
 class GameEvent:
@@ -8,20 +15,87 @@ class GameEvent:
     payload: Dict[str, Any]  # arbitrary, but consistent per event type
     timestamp: int     # monotonic event counter
 
+    @property
+    def t(self):
+        # older hooks-bus spelling of timestamp
+        return self.timestamp
+
+Handler = Callable[[GameEvent], None]
+
 class EventBus:
     def __init__(self):
-        self._subs: Dict[str, List[Callable[[GameEvent], None]]] = {}
+        self._subs: Dict[str, List[Tuple[int, int, Handler]]] = {}  # name → (priority, seq, handler)
+        self._table: Dict[str, Tuple[Handler, ...]] = {}            # name → compiled handlers
+        self._seq = itertools.count()
         self._counter = 0
 
+    def subscribe(self, name: str, handler: Handler, priority: int = 0):
+        """
+        Call handler for every `name` event ("*" = every event). Higher
+        priority runs first; ties run named before wildcard, then in
+        subscription order. Returns the handler.
+        """
+        self._subs.setdefault(name, []).append((priority, next(self._seq), handler))
+        self._invalidate(name)
+        return handler
+
+    def unsubscribe(self, name: str, handler: Handler):
+        """Remove every subscription of handler to name; True if any existed."""
+        subs = self._subs.get(name, [])
+        kept = [s for s in subs if s[2] != handler]
+        if len(kept) == len(subs):
+            return False
+        if kept:
+            self._subs[name] = kept
+        else:
+            del self._subs[name]
+        self._invalidate(name)
+        return True
+
+    def _invalidate(self, name: str):
+        if name == WILDCARD:
+            self._table.clear()
+        else:
+            self._table.pop(name, None)
+
+    def handlers(self, name: str) -> Tuple[Handler, ...]:
+        """The compiled handler tuple dispatch uses for name."""
+        table = self._table.get(name)
+        if table is None:
+            ranked = [(-p, 0, seq, fn) for p, seq, fn in self._subs.get(name, ())] if name != WILDCARD else []
+            ranked += [(-p, 1, seq, fn) for p, seq, fn in self._subs.get(WILDCARD, ())]
+            ranked.sort(key=lambda r: r[:3])
+            table = self._table[name] = tuple(r[3] for r in ranked)
+        return table
+
     def dispatch(self, name: str, **payload):
         self._counter += 1
-        evt = GameEvent(name=name, payload=payload, timestamp=self._counter)
-        for fn in self._subs.get(name, []):
-            fn(evt)
-        # wildcard listeners
-        for fn in self._subs.get("*", []):
+        evt = GameEvent(name, payload, self._counter)
+        handlers = self._table.get(name)
+        if handlers is None:
+            handlers = self.handlers(name)
+        for fn in handlers:
             fn(evt)
         return evt
 
-    def subscribe(self, name: str, handler: Callable[[GameEvent], None]):
-        self._subs.setdefault(name, []).append(handler)
+    def dispatch_many(self, events: Iterable[Tuple[str, Dict[str, Any]]]):
+        """
+        Dispatch a burst of (name, payload) pairs in order; returns how many
+        were dispatched. Each event reads the compiled table as dispatch()
+        does, so handlers (un)subscribed mid-burst apply from the next event.
+        Each event gets its own copy of the payload dict, as dispatch()'s
+        **payload does. Events are not kept (holding a burst alive would only feed the
+        cyclic GC).
+        """
+        table = self._table
+        n = 0
+        for name, payload in events:
+            handlers = table.get(name)
+            if handlers is None:
+                handlers = self.handlers(name)
+            self._counter += 1   # on the bus, so handlers that dispatch keep timestamps unique
+            evt = GameEvent(name, dict(payload), self._counter)
+            for fn in handlers:
+                fn(evt)
+            n += 1
+        return n
@@ -0,0 +1,285 @@
+"""
+GUI Router – event fan-out from the thalamus to HUD sinks.
+Listeners run either synchronously on the emitting thread ("sync") or
+behind a bounded queue ("async"), so a slow sink (a JSONL file, a
+WebSocket) can never stall the pulse. Each router delivers its async
+listeners on one dispatcher thread of its own, serving their pending
+queues round-robin, so a blocking sink only delays its own router. The
+thread is started on first use and restarted in a forked child. Async
+queues apply a drop policy when full:
+
+    drop_oldest   each listener keeps the newest `maxsize` payloads
+    keep_latest   one slot per topic (event) holds the most recent
+                  undelivered payload, delivered to every keep_latest
+                  listener of that topic
+
+Every listener exposes delivered / dropped / error counts, its queue depth
+and the emit-to-delivery lag.
+"""
+
+from collections import deque
+import logging
+import os
+import threading
+import time
+import weakref
+
+log = logging.getLogger("halcyon.gui")
+
+POLICIES = ("drop_oldest", "keep_latest")
+
+_dispatchers = weakref.WeakSet()
+
+class _Dispatcher:
+    """
+    A router's delivery thread. Work items (listeners with queued payloads,
+    topics with a latest payload) wait in `ready`; each visit delivers one
+    payload and requeues the item if more is pending. All queue state is
+    guarded by `cond`.
+    """
+    def __init__(self):
+        self.cond = threading.Condition()
+        self.ready = deque()
+        self._thread = None
+        self._current = None  # item being delivered
+        self._stopped = False
+        _dispatchers.add(self)
+
+    def _after_fork(self):
+        # the child has no delivery thread and may inherit a held lock
+        self.cond = threading.Condition()
+        item, self._current = self._current, None
+        if item is not None:
+            item.busy = False
+            if item.pending() and not item.scheduled:
+                item.scheduled = True
+                self.ready.append(item)
+        self._thread = None
+        if self.ready and not self._stopped:
+            self._start()
+
+    def _start(self):
+        self._thread = threading.Thread(target=self._run, name="GuiRouterDispatch", daemon=True)
+        self._thread.start()
+
+    def schedule(self, item):
+        # caller holds cond
+        if not item.scheduled and not item.busy:
+            item.scheduled = True
+            self.ready.append(item)
+            self.cond.notify_all()
+        if self._thread is None and not self._stopped:
+            self._start()
+
+    def stop(self):
+        """Let the thread exit once nothing is ready; later payloads are not delivered."""
+        with self.cond:
+            self._stopped = True
+            self.cond.notify_all()
+
+    def _run(self):
+        while True:
+            with self.cond:
+                while not self.ready and not self._stopped:
+                    self.cond.wait()
+                if not self.ready:
+                    return
+                item = self._current = self.ready.popleft()
+                item.scheduled = False
+                item.busy = True
+                deliveries = item.take()
+            try:
+                for listener, t, payload in deliveries:
+                    listener._deliver(payload, t)
+            finally:
+                with self.cond:
+                    self._current = None
+                    item.busy = False
+                    if item.pending():
+                        self.schedule(item)
+                    self.cond.notify_all()
+
+    def wait_idle(self, items, timeout):
+        """Wait until none of items has pending or in-flight payloads."""
+        deadline = time.monotonic() + timeout
+        with self.cond:
+            while any(item.busy or item.pending() for item in items):
+                left = deadline - time.monotonic()
+                if left <= 0:
+                    return False
+                self.cond.wait(left)
+        return True
+
+def _reset_dispatchers():
+    for dispatcher in list(_dispatchers):
+        dispatcher._after_fork()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_dispatchers)
+
+class _Topic:
+    """keep_latest slot shared by the keep_latest listeners of one event."""
+    def __init__(self, event, dispatcher):
+        self.event = event
+        self.dispatcher = dispatcher
+        self.listeners = []
+        self.latest = None    # (emitted_at, payload) not yet delivered
+        self.scheduled = False
+        self.busy = False
+
+    def push(self, payload):
+        with self.dispatcher.cond:
+            if not self.listeners:
+                return
+            if self.latest is not None:
+                for listener in self.listeners:
+                    listener.dropped += 1
+            self.latest = (time.monotonic(), payload)
+            self.dispatcher.schedule(self)
+
+    def pending(self):
+        return self.latest is not None
+
+    def take(self):
+        t, payload = self.latest
+        self.latest = None
+        return [(listener, t, payload) for listener in self.listeners if not listener._closed]
+
+class _Listener:
+    def __init__(self, event, fn, mode, maxsize, policy, dispatcher):
+        if mode not in ("sync", "async"):
+            raise ValueError(f"Unknown listener mode: {mode}")
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown drop policy: {policy}")
+        self.event = event
+        self.fn = fn
+        self.mode = mode
+        self.policy = policy
+        self.dispatcher = dispatcher
+        self.maxsize = 1 if policy == "keep_latest" else max(1, maxsize)
+        self.topic = None     # the shared _Topic for async keep_latest listeners
+        self._queue = deque()
+        self._closed = False
+        self.scheduled = False
+        self.busy = False
+        self.delivered = 0
+        self.dropped = 0
+        self.errors = 0
+        self.last_lag_ms = 0.0
+        self.max_lag_ms = 0.0
+
+    def push(self, payload):
+        if self.mode == "sync":
+            self._deliver(payload, time.monotonic())
+            return
+        with self.dispatcher.cond:
+            if self._closed:
+                return
+            if len(self._queue) >= self.maxsize:
+                self._queue.popleft()
+                self.dropped += 1
+            self._queue.append((time.monotonic(), payload))
+            self.dispatcher.schedule(self)
+
+    def pending(self):
+        return bool(self._queue)
+
+    def take(self):
+        t, payload = self._queue.popleft()
+        return [(self, t, payload)]
+
+    def _deliver(self, payload, emitted_at):
+        lag = (time.monotonic() - emitted_at) * 1000
+        self.last_lag_ms = lag
+        self.max_lag_ms = max(self.max_lag_ms, lag)
+        try:
+            self.fn(payload)
+            self.delivered += 1
+        except Exception as e:
+            self.errors += 1
+            log.exception(e)
+
+    def close(self):
+        with self.dispatcher.cond:
+            self._closed = True
+
+    def stats(self):
+        name = getattr(self.fn, "__qualname__", repr(self.fn))
+        depth = len(self._queue) if self.topic is None else int(self.topic.latest is not None)
+        return {"listener": name, "mode": self.mode, "policy": self.policy, "depth": depth,
+                "delivered": self.delivered, "dropped": self.dropped, "errors": self.errors,
+                "lag_ms": round(self.last_lag_ms, 3), "max_lag_ms": round(self.max_lag_ms, 3)}
+
+class GuiRouter:
+    def __init__(self, mode="sync", maxsize=256, policy="drop_oldest"):
+        """
+        mode / maxsize / policy are the defaults for listeners registered with on().
+        """
+        self.mode = mode
+        self.maxsize = maxsize
+        self.policy = policy
+        self.listeners = {}   # event → [_Listener] fed per listener (sync, async drop_oldest)
+        self.topics = {}      # event → _Topic feeding its async keep_latest listeners
+        self.emitted = 0
+        self._dispatcher = _Dispatcher()   # async delivery thread, started on first use
+
+    def on(self, event, fn, mode=None, maxsize=None, policy=None):
+        listener = _Listener(event, fn, mode or self.mode, self.maxsize if maxsize is None else maxsize,
+                             policy or self.policy, self._dispatcher)
+        if listener.mode == "async" and listener.policy == "keep_latest":
+            topic = self.topics.get(event)
+            if topic is None:
+                topic = self.topics[event] = _Topic(event, self._dispatcher)
+            with self._dispatcher.cond:
+                topic.listeners = topic.listeners + [listener]   # copy: take() may be iterating
+            listener.topic = topic
+        else:
+            self.listeners.setdefault(event, []).append(listener)
+        return listener
+
+    def off(self, event, fn):
+        kept = []
+        for listener in self.listeners.get(event, []):
+            if listener.fn is fn:
+                listener.close()
+            else:
+                kept.append(listener)
+        self.listeners[event] = kept
+        topic = self.topics.get(event)
+        if topic is not None:
+            with self._dispatcher.cond:
+                topic.listeners = [l for l in topic.listeners if l.fn is not fn]
+
+    def emit(self, event, payload):
+        self.emitted += 1
+        if log.isEnabledFor(logging.INFO):
+            log.info("[GUI::%s] %s", event, payload)
+        for listener in self.listeners.get(event, ()):
+            listener.push(payload)
+        topic = self.topics.get(event)
+        if topic is not None:
+            topic.push(payload)
+
+    def _async_items(self):
+        items = [l for listeners in self.listeners.values() for l in listeners if l.mode == "async"]
+        return items + list(self.topics.values())
+
+    def flush(self, timeout: float = 1.0):
+        """Block until every async listener has caught up (or timeout)."""
+        return self._dispatcher.wait_idle(self._async_items(), timeout)
+
+    def close(self):
+        for listeners in self.listeners.values():
+            for listener in listeners:
+                listener.close()
+        with self._dispatcher.cond:
+            for topic in self.topics.values():
+                topic.listeners = []
+                topic.latest = None
+        self._dispatcher.stop()
+
+    def stats(self):
+        stats = {event: [l.stats() for l in listeners] for event, listeners in self.listeners.items()}
+        for event, topic in self.topics.items():
+            stats.setdefault(event, []).extend(l.stats() for l in topic.listeners)
+        return stats
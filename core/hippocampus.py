@@ -4,118 +4,440 @@ Handles long-term consolidation, location-based memory binding,
 and retrieval prioritization based on symbolic association.
 """
 
-import random
+import functools
 import json
-from datetime import datetime
+import os
+import re
+import heapq
+import threading
+import time
+from array import array
+from bisect import bisect_left, insort
+
+from memory_journal import MemoryJournal
+from memory_postings import TagPostings, owned, to_epoch, tokenize as _tokenize
+from memory_query import TagQuery
+from memory_store import MemoryStore, SLOT_BITS
+from working_memory import WorkingMemory
+try:
+    from semantic_index import SemanticIndex
+except ImportError:  # numpy not installed: semantic recall disabled
+    SemanticIndex = None
+
+def _locked(method):
+    """Run a Hippocampus method under its lock (binds and organs share one memory across threads)."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+def _coerce_entry(experience, tags):
+    """
+    Normalize one entry at the memory boundary: experience becomes a str
+    (the old list store took any JSON value), tags a list of str.
+    """
+    if not isinstance(experience, str):
+        experience = "" if experience is None else (
+            json.dumps(experience, ensure_ascii=False) if isinstance(experience, (dict, list)) else str(experience))
+    if tags is None:
+        tags = []
+    elif isinstance(tags, str):
+        tags = [tags]
+    else:
+        tags = [t if isinstance(t, str) else str(t) for t in tags]
+    return experience, tags
+
+class PromotedView:
+    """
+    Live, de-duplicated view of entries carrying any promoted tag.
+    len() is O(1); iteration yields MemoryRecords in promotion order, from a
+    snapshot of the ids taken when iteration starts.
+    """
+    __slots__ = ("_ids", "_store")
+
+    def __init__(self, ids: dict, store):
+        self._ids = ids
+        self._store = store
+
+    def ids(self):
+        return self._ids.keys()
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __iter__(self):
+        record = self._store.record
+        return (record(rid) for rid in tuple(self._ids))
+
+    def __contains__(self, item):
+        return getattr(item, "id", item) in self._ids
+
+    def __repr__(self):
+        return f"PromotedView({len(self._ids)} entries)"
 
 class Hippocampus:
-    def __init__(self):
-        self.spatial_index = {}       # Symbolic/spatial keys → memory chunks
-        self.memory_log = []          # Raw chronological memory list
+    def __init__(self, bucket_seconds: int = 3600, retention: dict = None,
+                 working_capacity: int = 256, working_policy: str = "lru", promote_hits: int = 3):
+        self._store_opts = {"bucket_seconds": bucket_seconds, "retention": retention}
+        self.store = MemoryStore(**self._store_opts)  # Columnar records, partitioned into expiry buckets
+        self.spatial_index = {}       # Symbolic/spatial keys → TagPostings of record ids (chronological)
         self.promoted_tags = set()    # Tags for long-term binding
+        self._promoted = {}           # Record id → None for every entry with a promoted tag (ordered set)
+        self.term_index = {}          # Word token → record ids containing it (sorted by id)
+        self.journal = None           # MemoryJournal once persistence is attached
+        self.semantic = None          # SemanticIndex, built on first query() then kept current
+        self._lock = threading.RLock()  # Guards the store, indexes and working memory (see _locked)
+        self.working = WorkingMemory(  # Bounded short-term tier; promotes into the store above
+            self._promote_short_term, capacity=working_capacity,
+            policy=working_policy, promote_hits=promote_hits,
+        )
 
-    def encode(self, experience: str, tags: list = None):
+    @property
+    def memory_log(self):
         """
-        Store an experience in the memory log with optional symbolic tags.
+        Raw memory sequence (live MemoryRecord views, oldest first).
         """
-        entry = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "experience": experience,
-            "tags": tags or []
-        }
-        self.memory_log.append(entry)
-
-        for tag in entry["tags"]:
-            if tag not in self.spatial_index:
-                self.spatial_index[tag] = []
-            self.spatial_index[tag].append(entry)
+        return self.store
 
-    def recall(self, query: str, top_k: int = 3):
+    @_locked
+    def set_retention(self, tag: str, ttl):
         """
-        Retrieve top-k entries that match the query symbolically.
+        Keep entries tagged with tag for ttl seconds (None keeps them forever).
         """
-        candidates = self.spatial_index.get(query, [])
-        sorted_entries = sorted(candidates, key=lambda x: x["timestamp"], reverse=True)
-        return sorted_entries[:top_k]
+        self.store.set_retention(tag, ttl)
 
+    @_locked
     def promote_tag(self, tag: str):
         """
         Designate a tag as important for long-term relevance.
         """
+        if tag in self.promoted_tags:
+            return
         self.promoted_tags.add(tag)
+        self._promoted.update(dict.fromkeys(self.spatial_index.get(tag, ())))
 
     def get_promoted(self):
         """
-        Return all memory entries with promoted tags.
+        Return a live view of all memory entries with promoted tags (each entry once).
         """
-        results = []
+        return PromotedView(self._promoted, self.store)
+
+    def _rebuild_promoted(self):
+        self._promoted.clear()  # in place, so views handed out earlier stay live
         for tag in self.promoted_tags:
-            results.extend(self.spatial_index.get(tag, []))
-        return results
+            self._promoted.update(dict.fromkeys(self.spatial_index.get(tag, ())))
+
+    @_locked
+    def attach_journal(self, path="hippocampus_journal", **journal_opts):
+        """
+        Persist to an append-only journal directory. Entries already in memory
+        are appended once; from then on every encode is a buffered append.
+        """
+        if self.journal is not None:
+            if self.journal.root == path:
+                return self.journal
+            self.journal.close()
+        self.journal = MemoryJournal(path, **journal_opts)
+        for record in self.store:
+            self._journal_record(record.id)
+        return self.journal
 
-    def save_to_disk(self, path="hippocampus_log.json"):
-        with open(path, "w") as f:
-            json.dump(self.memory_log, f, indent=2)
+    @_locked
+    def save_to_disk(self, path="hippocampus_journal"):
+        """
+        Flush pending journal appends. Cost scales with entries added since the
+        last save, not with total history.
+        """
+        if self.journal is None or self.journal.root != path:
+            self.attach_journal(path)
+        return self.journal.flush()
 
-    def load_from_disk(self, path="hippocampus_log.json"):
-        try:
+    @_locked
+    def load_from_disk(self, path="hippocampus_journal"):
+        """
+        Restore from a journal directory (or a legacy JSON dump). Compacted
+        entries are bound through the persisted index instead of re-indexed.
+        """
+        retention = self.store.retention
+        self.store = MemoryStore(**self._store_opts)
+        self.store.retention = retention
+        self.spatial_index = {}
+        self.term_index = {}
+        self.semantic = None
+        if os.path.isfile(path):
             with open(path, "r") as f:
-                self.memory_log = json.load(f)
-                for entry in self.memory_log:
-                    for tag in entry["tags"]:
-                        if tag not in self.spatial_index:
-                            self.spatial_index[tag] = []
-                        self.spatial_index[tag].append(entry)
-        except FileNotFoundError:
-            self.memory_log = []
-            self.spatial_index = {}
+                for entry in json.load(f):
+                    self._store_entry(entry["timestamp"], entry["experience"], entry["tags"])
+            self._rebuild_promoted()
+            return
+        if not os.path.isdir(path):
             self.promoted_tags = set()
+            self._promoted.clear()
+            return
+
+        if self.journal is not None:
+            self.journal.close()
+        self.journal = MemoryJournal(path)
+        entries, index, tail = self.journal.load()
+        if index:
+            # map base positions to record ids, then bind the persisted postings
+            epochs = index["epochs"]
+            indexed = {}
+            for tag, positions in index["tags"].items():
+                for p in positions:
+                    indexed.setdefault(p, []).append(tag)
+            ids = [self.store.append(epoch, entry["experience"], entry["tags"], indexed.get(p, ()))
+                   for p, (epoch, entry) in enumerate(zip(epochs, entries))]
+            for tag, positions in index["tags"].items():
+                self.spatial_index[tag] = TagPostings([epochs[p] for p in positions], [ids[p] for p in positions])
+            self.term_index = {term: array("q", sorted(ids[p] for p in positions))
+                               for term, positions in index["terms"].items()}
+        for entry, _ in tail:
+            self._store_entry(entry["timestamp"], entry["experience"], entry["tags"])
+        self._rebuild_promoted()
+
+    @_locked
+    def write_checkpoint(self, ckpt, prefix="memory"):
+        """
+        Add the whole memory (store, tag and term indexes, promotions,
+        working memory) to a CheckpointWriter. Posting lists are packed into
+        one section per index plus an offsets column.
+        """
+        self.store.write_checkpoint(ckpt, prefix + ".store")
+        tags = list(self.spatial_index)
+        epochs, ids, offsets = array("d"), array("q"), array("Q", [0])
+        for tag in tags:
+            postings = self.spatial_index[tag]
+            epochs.extend(postings.epochs)
+            ids.extend(postings.ids)
+            offsets.append(len(ids))
+        ckpt.add_array(f"{prefix}.tags.epochs", epochs)
+        ckpt.add_array(f"{prefix}.tags.ids", ids)
+        ckpt.add_array(f"{prefix}.tags.offsets", offsets)
+        terms = list(self.term_index)
+        ids, offsets = array("q"), array("Q", [0])
+        for term in terms:
+            ids.extend(self.term_index[term])
+            offsets.append(len(ids))
+        ckpt.add_array(f"{prefix}.terms.ids", ids)
+        ckpt.add_array(f"{prefix}.terms.offsets", offsets)
+        ckpt.add_array(f"{prefix}.promoted", array("q", self._promoted))
+        ckpt.state[prefix] = {"tags": tags, "terms": terms, "promoted_tags": sorted(self.promoted_tags),
+                              "working": self.working.snapshot()}
+
+    @_locked
+    def restore_checkpoint(self, ckpt, prefix="memory", shared: bool = False):
+        """
+        Replace the memory with a checkpoint's. Nothing is re-parsed or
+        re-indexed; the semantic index is rebuilt on the next query() and an
+        attached journal is left as it is. shared=True reads the store blocks
+        and posting lists in place from ckpt (which must stay open); each is
+        copied on its first write, so many instances can share one seed.
+        """
+        meta = ckpt.state[prefix]
+        self.store = MemoryStore.from_checkpoint(ckpt, prefix + ".store", shared)
+        # one copy (or shared view) per packed index, then slices per posting list
+        column = ckpt.column if shared else ckpt.array
+        self.spatial_index = {}
+        offsets = ckpt.array(f"{prefix}.tags.offsets")
+        epochs, ids = column(f"{prefix}.tags.epochs"), column(f"{prefix}.tags.ids")
+        for tag, lo, hi in zip(meta["tags"], offsets, offsets[1:]):
+            postings = self.spatial_index[tag] = TagPostings()
+            postings.epochs, postings.ids = epochs[lo:hi], ids[lo:hi]
+        offsets = ckpt.array(f"{prefix}.terms.offsets")
+        ids = column(f"{prefix}.terms.ids")
+        self.term_index = {term: ids[lo:hi] for term, lo, hi in zip(meta["terms"], offsets, offsets[1:])}
+        self.promoted_tags = set(meta["promoted_tags"])
+        self._promoted.clear()  # in place, so views handed out earlier stay live
+        self._promoted.update(dict.fromkeys(ckpt.array(f"{prefix}.promoted")))
+        self.working.restore(meta["working"])
+        self.semantic = None
+
+    @_locked
+    def close(self):
+        if self.journal is not None:
+            self.journal.close()
 
     def summarize(self, limit=5):
         recent = self.memory_log[-limit:]
         return [f"{e['timestamp'][:19]} :: {e['experience']}" for e in recent]
     
+    @_locked
     def ingest_memory_strip(self, strip: dict):
         """
         Ingest a preformatted memory strip (single experience) and integrate it into memory log and spatial index.
         """
-        entry = {
-            "timestamp": strip.get("timestamp", datetime.utcnow().isoformat()),
-            "experience": strip.get("experience", "🧠 No content."),
-            "tags": strip.get("tags", [])
-        }
-        self.memory_log.append(entry)
+        rid = self._store_entry(strip.get("timestamp"), strip.get("experience", "🧠 No content."), strip.get("tags", []))
+        if self.journal is not None:
+            self._journal_record(rid)
+
+    @_locked
+    def ingest_many(self, strips):
+        """
+        Bulk-ingest memory strips. Records are stored first, then each tag and
+        word posting list is extended once for the whole batch. A strip that
+        is not a dict (or cannot be stored) is skipped and logged; every
+        stored record is indexed. Returns the new record ids.
+        """
+        rids = []
+        by_tag = {}
+        by_term = {}
+        texts = []
+        for i, strip in enumerate(strips):
+            try:
+                if not isinstance(strip, dict):
+                    raise TypeError(f"strip is {type(strip).__name__}, not a dict")
+                experience, tags = _coerce_entry(strip.get("experience", "🧠 No content."), strip.get("tags", []))
+                epoch = to_epoch(strip.get("timestamp"))
+                tag_list = tags if tags else ["untagged"]
+                rid = self.store.append(epoch, experience, tags, tag_list)
+            except Exception as e:
+                print(f"[Hippocampus] Skipped strip {i}: {e}")
+                continue
+            rids.append(rid)
+            texts.append(experience)
+            for tag in tag_list:
+                by_tag.setdefault(tag, []).append((epoch, rid))
+            for term in set(_tokenize(experience)):
+                by_term.setdefault(term, []).append(rid)
 
-        for tag in entry["tags"]:
+        for tag, pairs in by_tag.items():
+            if tag in self.promoted_tags:
+                self._promoted.update(dict.fromkeys(rid for _, rid in pairs))
+            pairs.sort(key=lambda p: p[0])
             if tag not in self.spatial_index:
-                self.spatial_index[tag] = []
-            self.spatial_index[tag].append(entry)
+                self.spatial_index[tag] = TagPostings()
+            self.spatial_index[tag].extend(pairs)
 
+        for term, ids in by_term.items():
+            ids.sort()
+            postings = self._term_postings(term)
+            if postings is None:
+                self.term_index[term] = array("q", ids)
+            elif ids[0] > postings[-1]:
+                postings.extend(ids)
+            else:
+                self.term_index[term] = array("q", heapq.merge(postings, ids))
+
+        if self.semantic is not None:
+            self.semantic.add_many(rids, texts)
+        if self.journal is not None:
+            for rid in rids:
+                self._journal_record(rid)
+        return rids
+
+    @_locked
     def encode(self, experience: str, tags: list = None):
         """
         Store an experience in the memory log with optional symbolic tags.
         """
-        entry = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "experience": experience,
-            "tags": tags or []
-        }
-        self.memory_log.append(entry)
+        rid = self._store_entry(None, experience, tags or [])
+        if self.journal is not None:
+            self._journal_record(rid)
+        return rid
+
+    def _term_postings(self, term: str):
+        """Writable postings of term (a shared checkpoint view is copied first), or None."""
+        postings = self.term_index.get(term)
+        if postings is not None and not isinstance(postings, array):
+            postings = self.term_index[term] = owned(postings, "q")
+        return postings
 
-        tag_list = entry["tags"] if entry["tags"] else ["untagged"]
+    def _journal_record(self, rid: int):
+        record = self.store.record(rid)
+        self.journal.append(record.to_dict(), record.tags or ["untagged"])
+
+    def _store_entry(self, timestamp, experience: str, tags: list):
+        """
+        Append a record to the store, then bind it into the spatial (tag) index
+        and the word index. The timestamp is parsed once here (None means now);
+        tag postings stay in epoch order. Entries without tags index as "untagged".
+        """
+        experience, tags = _coerce_entry(experience, tags)
+        tag_list = tags if tags else ["untagged"]
+        epoch = to_epoch(timestamp)
+        rid = self.store.append(epoch, experience, tags, tag_list)
         for tag in tag_list:
             if tag not in self.spatial_index:
-                self.spatial_index[tag] = []
-            self.spatial_index[tag].append(entry)
+                self.spatial_index[tag] = TagPostings()
+            self.spatial_index[tag].add(epoch, rid)
+            if tag in self.promoted_tags:
+                self._promoted[rid] = None
+
+        for term in set(_tokenize(experience)):
+            postings = self._term_postings(term)
+            if postings is None:
+                self.term_index[term] = array("q", [rid])
+            elif rid > postings[-1]:
+                postings.append(rid)
+            else:
+                insort(postings, rid)
 
-    def recall(self, query: str, top_k: int = 3):
+        if self.semantic is not None:
+            self.semantic.add(rid, experience)
+        return rid
+
+    @_locked
+    def recall(self, query: str, top_k: int = 3, since=None, until=None):
         """
-        Retrieve top-k entries that match the query symbolically.
+        Retrieve the newest top-k entries tagged with the query.
+        since/until (epoch seconds, datetime or ISO string) bound the time window.
         """
-        candidates = self.spatial_index.get(query, [])
-        sorted_entries = sorted(candidates, key=lambda x: x["timestamp"], reverse=True)
-        return sorted_entries[:top_k]
+        postings = self.spatial_index.get(query)
+        if postings is None:
+            return []
+        since = None if since is None else to_epoch(since)
+        until = None if until is None else to_epoch(until)
+        return [self.store.record(rid) for rid in postings.latest(top_k, since=since, until=until)]
     
+    @_locked
+    def find(self, all_of=None, any_of=None, none_of=None, since=None, until=None, limit: int = 10,
+             newest_first: bool = True):
+        """
+        Boolean tag query: entries with every all_of tag, at least one any_of
+        tag and no none_of tag, inside [since, until], newest first.
+        e.g. find(any_of=["dream", "dream:fear"], since=time.time() - 3600)
+        """
+        q = self._tag_query(all_of, any_of, none_of, since, until, limit, newest_first)
+        return [self.store.record(rid) for rid in q.run()]
+
+    @_locked
+    def explain_find(self, all_of=None, any_of=None, none_of=None, since=None, until=None):
+        """
+        Show the plan find() would use (driver and membership-check order).
+        """
+        return self._tag_query(all_of, any_of, none_of, since, until, None, True).explain()
+
+    def _tag_query(self, all_of, any_of, none_of, since, until, limit, newest_first):
+        return TagQuery(
+            self.spatial_index, self.store.timeline,
+            all_of=all_of, any_of=any_of, none_of=none_of,
+            since=None if since is None else to_epoch(since),
+            until=None if until is None else to_epoch(until),
+            limit=limit, newest_first=newest_first,
+        )
+
+    def query(self, text: str, top_k: int = 3):
+        """
+        Semantic recall: the top-k entries most similar to text (hashed n-gram TF-IDF).
+        """
+        return self.query_batch([text], top_k)[0]
+
+    @_locked
+    def query_batch(self, texts, top_k: int = 3):
+        """
+        Answer several semantic queries with one matrix multiply.
+        """
+        if SemanticIndex is None:
+            return [[] for _ in texts]
+        if self.semantic is None:
+            self.semantic = SemanticIndex()
+            live = list(self.store)
+            self.semantic.add_many([r.id for r in live], [r.experience for r in live])
+        hits = self.semantic.search_many(list(texts), top_k)
+        return [[self.store.record(rid) for rid, _ in row] for row in hits]
+
     def load_symbolic_affirmations(self, path="symbolic_affirmations.json"):
         try:
             with open(path, "r") as f:
@@ -125,9 +447,70 @@ class Hippocampus:
         except Exception as e:
             print(f"[⚠️] Failed to load symbolic affirmations: {e}")
 
+    @_locked
     def count_references_to(self, term: str):
-        return sum(term in entry["experience"] for entry in self.memory_log)
+        """
+        Count entries that mention the term as a whole word (or word sequence).
+        """
+        tokens = _tokenize(term)
+        if len(tokens) == 1:
+            return len(self.term_index.get(tokens[0], ()))
+        return len(self.entries_with_term(term))
+
+    @_locked
+    def entries_with_term(self, term: str):
+        """
+        Return records containing the term on word boundaries, oldest first
+        (by timestamp; postings are kept in record-id order, which is not
+        chronological across time buckets). Multi-word terms intersect
+        postings starting from the rarest word, then confirm the exact phrase.
+        """
+        tokens = _tokenize(term)
+        if not tokens:
+            return []
+        postings = [self.term_index.get(t, ()) for t in tokens]
+        if len(tokens) == 1:
+            return self._chronological(postings[0])
+        postings.sort(key=len)
+        if not postings[0]:
+            return []
+        candidates = postings[0]
+        for other in postings[1:]:
+            ids = set(other)
+            candidates = [rid for rid in candidates if rid in ids]
+        phrase = re.compile(r"(?<!\w)" + r"\W+".join(map(re.escape, tokens)) + r"(?!\w)")
+        return self._chronological(rid for rid in candidates if phrase.search(self.store.experience(rid)))
+
+    def _chronological(self, rids):
+        epoch = self.store.epoch
+        return [self.store.record(rid) for rid in sorted(rids, key=lambda rid: (epoch(rid), rid))]
     
+    @_locked
+    def remember_short_term(self, item: str, tags: list = None):
+        """
+        Hold an item in bounded working memory. Items that are accessed often,
+        or carry a promoted tag, are consolidated into long-term memory.
+        """
+        return self.working.remember(str(item), tags, self.promoted_tags)
+
+    @_locked
+    def recall_short_term(self, query: str = None, top_k: int = 5):
+        return self.working.recall(query, top_k)
+
+    @_locked
+    def remember_long_term(self, item, tags: list = None):
+        """
+        Encode straight into the indexed long-term store. Dicts are stored one
+        entry per key, tagged with the key.
+        """
+        if isinstance(item, dict):
+            return [self.encode(f"{k}: {v}", tags=["long_term", str(k)] + list(tags or [])) for k, v in item.items()]
+        return self.encode(str(item), tags=["long_term"] + list(tags or []))
+
+    def _promote_short_term(self, text: str, tags: list):
+        self.encode(text, tags=["short_term"] + list(tags))
+
+    @_locked
     def append_thread(self, thread: str, tags: list = None):
         """
         Append a threaded memory entry (e.g., conversation, event sequence).
@@ -154,11 +537,43 @@ class Hippocampus:
             match_score += 0.5
         return match_score
     
-    def decay(self, decay_factor=0.1):
+    @_locked
+    def decay(self, now: float = None):
         """
-        Decay the memory log by removing entries that are too old.
+        Expire whole time buckets whose retention has elapsed and prune their
+        records from the tag and word postings. Returns the number of entries dropped.
         """
-        cutoff = datetime.utcnow().timestamp() - (30 * 24 * 3600)
-        self.memory_log = [entry for entry in self.memory_log if entry["timestamp"] > cutoff]
-        print(f"[Hippocampus] Memory log decayed by {decay_factor * 100}%.")
+        dropped = self.store.drop_expired(time.time() if now is None else now)
+        removed = 0
+        for block in dropped:
+            no = block.no
+            for tid in block.tag_set:
+                tag = self.store.tag_name(tid)
+                postings = self.spatial_index.get(tag)
+                if postings is None:
+                    continue
+                postings.discard(block.lo, block.hi, lambda rid: rid >> SLOT_BITS == no)
+                if not postings:
+                    del self.spatial_index[tag]
+
+            lo, hi = no << SLOT_BITS, (no + 1) << SLOT_BITS
+            if self._promoted:
+                for rid in self.store.block_ids(block):
+                    self._promoted.pop(rid, None)
+            if self.semantic is not None:
+                self.semantic.discard_range(lo, hi)
+            terms = set()
+            for slot in range(len(block)):
+                terms.update(_tokenize(block.experience(slot)))
+            for term in terms:
+                postings = self._term_postings(term)
+                if postings is None:
+                    continue
+                del postings[bisect_left(postings, lo):bisect_left(postings, hi)]
+                if not postings:
+                    del self.term_index[term]
+            removed += len(block)
+        if removed:
+            print(f"[Hippocampus] Memory decayed: {removed} entries expired across {len(dropped)} buckets.")
+        return removed
 
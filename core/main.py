@@ -21,7 +21,7 @@ def pretty(event):
     def _p(pkt): print(f"[{event}] {pkt}")
     return _p
 
-amyg = Amygdala(debug=False)
+amyg = Amygdala(debug=False, growth_log="emotional_growth_log.jsonl")
 
 thalamus = ConsciousThalamus(
     language=LanguageCore(), memory=MemoryCore(), cognition=CognitiveCore(),
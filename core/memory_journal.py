@@ -0,0 +1,322 @@
+"""
+Memory Journal – append-only persistence for the Hippocampus.
+Each encoded entry is a buffered JSONL append to the active segment.
+Sealed segments are merged into a compacted base file in the background,
+together with a persisted tag/word index so startup can skip re-indexing.
+
+Layout (one directory):
+    base.jsonl          compacted entries, in append order
+    index.json          manifest: base size, last merged segment, index parts
+    index-000001.json   postings for a run of base positions (one per part)
+    seg-000001.jsonl    sealed / active segments not yet compacted
+
+A compaction only writes an index part for the entries it merged. Parts
+are folded together when the newest is at least as large as the one
+before it (like a binary counter), so each entry is rewritten O(log n)
+times overall and the manifest lists O(log n) parts.
+"""
+
+import heapq
+import json
+import os
+import threading
+from bisect import insort
+
+from memory_postings import to_epoch, tokenize
+
+INDEX_VERSION = 2
+
+class MemoryJournal:
+    def __init__(self, root="hippocampus_journal", segment_bytes=4 << 20,
+                 flush_every=64, compact_after=4, background=True, fsync=False):
+        self.root = root
+        self.segment_bytes = segment_bytes
+        self.flush_every = flush_every
+        self.compact_after = compact_after
+        self.fsync = fsync
+
+        os.makedirs(root, exist_ok=True)
+        self._buffer = []
+        self._lock = threading.Lock()          # guards segment bookkeeping
+        self._compact_lock = threading.Lock()  # one compaction at a time
+        self._manifest = None                  # cached index manifest (compactor side)
+
+        numbers = self._segment_numbers()
+        through = self._read_index().get("through_segment", 0)
+        self._drop_orphan_parts()
+        for no in numbers:
+            if no <= through:  # already merged; a crash interrupted the cleanup
+                os.remove(self._segment_path(no))
+        self._sealed = [n for n in numbers if n > through]
+        self._active_no = (max(numbers) if numbers else through) + 1
+        self._active = None
+
+        self._wake = threading.Event()
+        self._closed = False
+        self._worker = None
+        if background:
+            self._worker = threading.Thread(target=self._compact_loop, name="HippocampusCompactor", daemon=True)
+            self._worker.start()
+
+    # ---------- WRITE ----------
+    def append(self, entry: dict, indexed_tags: list = None):
+        """
+        Buffer one entry. indexed_tags is recorded only when it differs
+        from the entry's own tags (e.g. the "untagged" fallback).
+        """
+        record = entry
+        if indexed_tags is not None and list(indexed_tags) != list(entry.get("tags", [])):
+            record = dict(entry, indexed=list(indexed_tags))
+        self._buffer.append(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+        if len(self._buffer) >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        """
+        Write buffered entries to the active segment; rotate when it grows too large.
+        """
+        if not self._buffer:
+            return 0
+        lines, self._buffer = self._buffer, []
+        with self._lock:
+            if self._active is None:
+                self._active = open(self._segment_path(self._active_no), "a", encoding="utf-8")
+            self._active.write("\n".join(lines) + "\n")
+            self._active.flush()
+            if self.fsync:
+                os.fsync(self._active.fileno())
+            if self._active.tell() >= self.segment_bytes:
+                self._seal_active()
+        return len(lines)
+
+    def _seal_active(self):
+        self._active.close()
+        self._active = None
+        self._sealed.append(self._active_no)
+        self._active_no += 1
+        if len(self._sealed) >= self.compact_after:
+            self._wake.set()
+
+    def close(self):
+        self.flush()
+        with self._lock:
+            if self._active is not None:
+                self._active.close()
+                self._active = None
+        self._closed = True
+        self._wake.set()
+        if self._worker is not None:
+            self._worker.join(timeout=5.0)
+
+    # ---------- COMPACTION ----------
+    def _compact_loop(self):
+        while not self._closed:
+            self._wake.wait()
+            self._wake.clear()
+            if self._closed:
+                break
+            try:
+                self.compact()
+            except Exception as e:
+                print(f"[Hippocampus] Journal compaction failed: {e}")
+
+    def compact(self):
+        """
+        Merge sealed segments into base.jsonl and add one index part for them.
+        Only the new segments are parsed; the base is appended to and older
+        index parts are left alone (apart from the occasional fold).
+        """
+        with self._compact_lock:
+            with self._lock:
+                todo = list(self._sealed)
+            if not todo:
+                return 0
+
+            manifest = self._manifest or self._read_index() or self._empty_manifest()
+            self._manifest = None  # re-read it if we fail below
+            start = sum(p["count"] for p in manifest["parts"])
+            part = self._empty_part(start)
+            base_path = os.path.join(self.root, "base.jsonl")
+            merged = 0
+            with open(base_path, "a", encoding="utf-8") as base:
+                base.truncate(manifest["base_bytes"])  # drop any half-merged tail
+                for no in todo:
+                    for record in self._read_segment(no):
+                        self._index_record(part, record)
+                        base.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+                        merged += 1
+                base.flush()
+                os.fsync(base.fileno())
+                manifest["base_bytes"] = base.tell()
+            retired = []
+            if merged:
+                manifest["parts"].append(self._write_part(manifest, part))
+                retired = self._fold_parts(manifest)
+            manifest["through_segment"] = todo[-1]
+            self._write_index(manifest)
+            self._manifest = manifest
+            for name in retired:
+                self._remove(os.path.join(self.root, name))
+
+            with self._lock:
+                self._sealed = [n for n in self._sealed if n > todo[-1]]
+            for no in todo:
+                self._remove(self._segment_path(no))
+            return merged
+
+    def _fold_parts(self, manifest):
+        """
+        Merge the newest parts while the last is at least as large as the one
+        before it. Returns the part files that are no longer referenced.
+        """
+        parts, retired = manifest["parts"], []
+        while len(parts) >= 2 and parts[-1]["count"] >= parts[-2]["count"]:
+            newer, older = parts.pop(), parts.pop()
+            merged = self._merge_parts(self._read_part(older), self._read_part(newer))
+            parts.append(self._write_part(manifest, merged))
+            retired += [older["file"], newer["file"]]
+        return retired
+
+    @staticmethod
+    def _merge_parts(older, newer):
+        """Concatenate two adjacent parts; tag postings stay in epoch order."""
+        epochs = older["epochs"] + newer["epochs"]
+        start = older["start"]
+        epoch_of = lambda p: epochs[p - start]
+        tags = dict(older["tags"])
+        for tag, positions in newer["tags"].items():
+            mine = tags.get(tag)
+            if not mine:
+                tags[tag] = positions
+            elif epoch_of(positions[0]) >= epoch_of(mine[-1]):
+                tags[tag] = mine + positions
+            else:
+                tags[tag] = list(heapq.merge(mine, positions, key=epoch_of))
+        terms = dict(older["terms"])
+        for term, positions in newer["terms"].items():
+            terms[term] = terms.get(term, []) + positions
+        return {"start": start, "epochs": epochs, "tags": tags, "terms": terms}
+
+    @staticmethod
+    def _empty_manifest():
+        return {"version": INDEX_VERSION, "base_bytes": 0, "through_segment": 0, "next_part": 1, "parts": []}
+
+    @staticmethod
+    def _empty_part(start):
+        return {"start": start, "epochs": [], "tags": {}, "terms": {}}
+
+    @staticmethod
+    def _index_record(part, record):
+        start = part["start"]
+        epochs = part["epochs"]
+        pos = start + len(epochs)
+        epoch = to_epoch(record.get("timestamp"))
+        epochs.append(epoch)
+        for tag in record.get("indexed", record.get("tags", [])):
+            postings = part["tags"].setdefault(tag, [])
+            if not postings or epoch >= epochs[postings[-1] - start]:
+                postings.append(pos)
+            else:
+                insort(postings, pos, key=lambda p: epochs[p - start])
+        for term in set(tokenize(record.get("experience", ""))):
+            part["terms"].setdefault(term, []).append(pos)
+
+    # ---------- READ ----------
+    def load(self):
+        """
+        Return (base_entries, base_index, tail) where tail is a list of
+        (entry, indexed_tags) pairs from segments newer than the base.
+        """
+        manifest = self._read_index()
+        entries, index = [], None
+        if manifest:
+            with open(os.path.join(self.root, "base.jsonl"), "rb") as f:
+                raw = f.read(manifest["base_bytes"])
+            for line in raw.decode("utf-8").splitlines():
+                record = json.loads(line)
+                record.pop("indexed", None)
+                entries.append(record)
+            index = self._empty_part(0)
+            for part in manifest["parts"]:
+                index = self._merge_parts(index, self._read_part(part))
+            self._manifest = manifest
+
+        tail = []
+        with self._lock:
+            numbers = list(self._sealed)
+            if os.path.exists(self._segment_path(self._active_no)):
+                numbers.append(self._active_no)
+        for no in numbers:
+            for record in self._read_segment(no):
+                indexed = record.pop("indexed", None)
+                tail.append((record, indexed if indexed is not None else record.get("tags", [])))
+        return entries, index, tail
+
+    def _read_segment(self, no):
+        records = []
+        try:
+            with open(self._segment_path(no), "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        records.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        break  # torn write at the tail of a crashed segment
+        except FileNotFoundError:
+            pass
+        return records
+
+    def _read_index(self):
+        """The index manifest ({} when there is no usable one)."""
+        try:
+            with open(os.path.join(self.root, "index.json"), "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+        return manifest if manifest.get("version") == INDEX_VERSION else {}
+
+    def _write_index(self, manifest):
+        self._write_json(os.path.join(self.root, "index.json"), manifest)
+
+    def _write_part(self, manifest, part):
+        """Write an index part under the next free name; returns its manifest entry."""
+        name = f"index-{manifest['next_part']:06d}.json"
+        manifest["next_part"] += 1
+        self._write_json(os.path.join(self.root, name), part)
+        return {"file": name, "start": part["start"], "count": len(part["epochs"])}
+
+    def _read_part(self, entry):
+        with open(os.path.join(self.root, entry["file"]), "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _drop_orphan_parts(self):
+        # parts written by a compaction that crashed before its manifest landed
+        live = {p["file"] for p in self._read_index().get("parts", ())}
+        for name in os.listdir(self.root):
+            if name.startswith("index-") and name.endswith(".json") and name not in live:
+                self._remove(os.path.join(self.root, name))
+
+    @staticmethod
+    def _write_json(path, data):
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(path + ".tmp", path)
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def _segment_numbers(self):
+        numbers = []
+        for name in os.listdir(self.root):
+            if name.startswith("seg-") and name.endswith(".jsonl"):
+                try:
+                    numbers.append(int(name[4:-6]))
+                except ValueError:
+                    pass
+        return sorted(numbers)
+
+    def _segment_path(self, no):
+        return os.path.join(self.root, f"seg-{no:06d}.jsonl")
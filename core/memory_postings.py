@@ -0,0 +1,124 @@
+"""
+Memory Postings – chronologically ordered per-tag record id lists.
+Timestamps are parsed once into epoch seconds so recall can slice
+the newest entries (or bisect a time window) instead of re-sorting.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timezone
+import heapq
+import re
+import time
+
+_WORD = re.compile(r"\w+")
+
+def tokenize(text: str):
+    """
+    Split text into word tokens. Case is preserved so "I" stays distinct from "i".
+    """
+    return _WORD.findall(text or "")
+
+def to_epoch(stamp):
+    """
+    Convert an ISO timestamp, datetime or number into UTC epoch seconds.
+    Naive values are treated as UTC (that is what utcnow() produces).
+    """
+    if stamp is None:
+        return time.time()
+    if isinstance(stamp, (int, float)):
+        return float(stamp)
+    try:
+        dt = stamp if isinstance(stamp, datetime) else datetime.fromisoformat(str(stamp))
+    except ValueError:
+        return time.time()
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+def owned(column, typecode: str):
+    """
+    column as a writable array.array. Columns restored from a shared
+    checkpoint are read-only memoryviews; writers copy them here first.
+    """
+    if isinstance(column, array):
+        return column
+    out = array(typecode)
+    out.frombytes(column.cast("B"))
+    return out
+
+class TagPostings:
+    """
+    Record ids for one tag kept in ascending epoch order, as two packed arrays.
+    In-order appends are O(1); late (back-dated) records are bisected into place.
+    The arrays may be read-only views of a shared checkpoint until the first write.
+    """
+    __slots__ = ("epochs", "ids")
+
+    def __init__(self, epochs=None, ids=None):
+        self.epochs = array("d", epochs or ())
+        self.ids = array("q", ids or ())
+
+    def _own(self):
+        self.epochs, self.ids = owned(self.epochs, "d"), owned(self.ids, "q")
+
+    def add(self, epoch: float, rid: int):
+        self._own()
+        if not self.epochs or epoch >= self.epochs[-1]:
+            self.epochs.append(epoch)
+            self.ids.append(rid)
+            return
+        i = bisect_right(self.epochs, epoch)
+        self.epochs.insert(i, epoch)
+        self.ids.insert(i, rid)
+
+    def extend(self, pairs):
+        """
+        Bulk-add (epoch, rid) pairs sorted by epoch. Appends when they all follow
+        the current tail, otherwise merges once instead of bisecting per item.
+        """
+        if not pairs:
+            return
+        if not self.epochs or pairs[0][0] >= self.epochs[-1]:
+            self._own()
+            self.epochs.extend(e for e, _ in pairs)
+            self.ids.extend(r for _, r in pairs)
+            return
+        merged = list(heapq.merge(zip(self.epochs, self.ids), pairs, key=lambda p: p[0]))
+        self.epochs = array("d", (e for e, _ in merged))
+        self.ids = array("q", (r for _, r in merged))
+
+    def latest(self, top_k: int = 3, since=None, until=None):
+        """
+        Newest-first record ids, optionally restricted to [since, until] epoch seconds.
+        """
+        if top_k <= 0:
+            return []
+        lo = 0 if since is None else bisect_left(self.epochs, since)
+        hi = len(self.epochs) if until is None else bisect_right(self.epochs, until)
+        if hi <= lo:
+            return []
+        return self.ids[max(lo, hi - top_k):hi][::-1].tolist()
+
+    def discard(self, lo: float, hi: float, dead):
+        """
+        Drop ids within the [lo, hi] epoch range for which dead(rid) is true.
+        """
+        i = bisect_left(self.epochs, lo)
+        j = bisect_right(self.epochs, hi)
+        keep = [k for k in range(i, j) if not dead(self.ids[k])]
+        if len(keep) == j - i:
+            return 0
+        self._own()
+        self.epochs[i:j] = array("d", (self.epochs[k] for k in keep))
+        self.ids[i:j] = array("q", (self.ids[k] for k in keep))
+        return (j - i) - len(keep)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __iter__(self):
+        return iter(self.ids)
+
+    def __getitem__(self, i):
+        return self.ids[i]
@@ -0,0 +1,151 @@
+"""
+Memory Query – boolean tag queries over chronological posting lists.
+Combines tags with AND (all_of), OR (any_of) and NOT (none_of), inside an
+optional [since, until] epoch window, newest first, with a limit.
+
+Nothing is materialized: the planner bisects every posting list down to the
+window, drives iteration from the cheapest source (the rarest AND tag, or
+the OR union when that is smaller) and checks the remaining lists by
+bisecting to the candidate's epoch.
+"""
+
+from bisect import bisect_left, bisect_right
+import heapq
+
+def _window(postings, since, until):
+    lo = 0 if since is None else bisect_left(postings.epochs, since)
+    hi = len(postings.epochs) if until is None else bisect_right(postings.epochs, until)
+    return lo, max(lo, hi)
+
+def _contains(postings, lo, hi, epoch, rid):
+    """
+    True if rid sits in postings[lo:hi]. Entries sharing an epoch are scanned,
+    so lists need not agree on tie order.
+    """
+    epochs, ids = postings.epochs, postings.ids
+    i = bisect_left(epochs, epoch, lo, hi)
+    while i < hi and epochs[i] == epoch:
+        if ids[i] == rid:
+            return True
+        i += 1
+    return False
+
+def _scan(postings, lo, hi, newest_first):
+    epochs, ids = postings.epochs, postings.ids
+    rng = range(hi - 1, lo - 1, -1) if newest_first else range(lo, hi)
+    for i in rng:
+        yield epochs[i], ids[i]
+
+def _union(sources, newest_first):
+    """
+    Merge several windowed postings into one stream, each record once.
+    """
+    streams = [_scan(p, lo, hi, newest_first) for p, lo, hi in sources]
+    merged = heapq.merge(*streams, key=lambda pair: pair[0], reverse=newest_first)
+    current, seen = None, set()
+    for epoch, rid in merged:
+        if epoch != current:
+            current, seen = epoch, set()
+        if rid in seen:
+            continue
+        seen.add(rid)
+        yield epoch, rid
+
+class TagQuery:
+    def __init__(self, index: dict, universe, all_of=(), any_of=(), none_of=(),
+                 since=None, until=None, limit=None, newest_first=True):
+        """
+        index maps tag → TagPostings; universe is the TagPostings of every live
+        record (used when the query has only NOT terms or none at all).
+        """
+        self.index = index
+        self.universe = universe
+        self.all_of = list(dict.fromkeys(all_of or ()))
+        self.any_of = list(dict.fromkeys(any_of or ()))
+        self.none_of = list(dict.fromkeys(none_of or ()))
+        self.since = since
+        self.until = until
+        self.limit = limit
+        self.newest_first = newest_first
+
+    def _bound(self, tags):
+        out = []
+        for tag in tags:
+            postings = self.index.get(tag)
+            if postings is None:
+                out.append((tag, None, 0, 0))
+            else:
+                lo, hi = _window(postings, self.since, self.until)
+                out.append((tag, postings, lo, hi))
+        return out
+
+    def plan(self):
+        """
+        Choose the driving source and the order of membership checks.
+        AND tags are checked rarest first; the driver is whichever of the
+        rarest AND tag or the OR union has fewer postings in the window.
+        """
+        all_b = sorted(self._bound(self.all_of), key=lambda b: b[3] - b[2])
+        any_b = [b for b in self._bound(self.any_of) if b[1] is not None and b[3] > b[2]]
+        none_b = [b for b in self._bound(self.none_of) if b[1] is not None and b[3] > b[2]]
+
+        empty = (all_b and all_b[0][3] == all_b[0][2]) or (self.any_of and not any_b)
+        any_cost = sum(b[3] - b[2] for b in any_b)
+        if empty:
+            driver = "empty"
+        elif all_b and (not any_b or all_b[0][3] - all_b[0][2] <= any_cost):
+            driver = "all"
+        elif any_b:
+            driver = "any"
+        else:
+            driver = "universe"
+        return {"driver": driver, "all": all_b, "any": any_b, "none": none_b,
+                "estimate": {"all": [b[3] - b[2] for b in all_b], "any": any_cost}}
+
+    def explain(self):
+        p = self.plan()
+        return {
+            "driver": p["driver"],
+            "check_order": [b[0] for b in p["all"]],
+            "any_of": [b[0] for b in p["any"]],
+            "none_of": [b[0] for b in p["none"]],
+            "estimate": p["estimate"],
+        }
+
+    def run(self):
+        """
+        Yield matching record ids in time order (newest first by default).
+        """
+        p = self.plan()
+        driver = p["driver"]
+        if driver == "empty":
+            return
+        all_b, any_b, none_b = p["all"], p["any"], p["none"]
+
+        if driver == "all":
+            _, postings, lo, hi = all_b[0]
+            stream = _scan(postings, lo, hi, self.newest_first)
+            checks_all = all_b[1:]
+            checks_any = any_b
+        elif driver == "any":
+            stream = _union([b[1:] for b in any_b], self.newest_first)
+            checks_all = all_b
+            checks_any = ()
+        else:
+            lo, hi = _window(self.universe, self.since, self.until)
+            stream = _scan(self.universe, lo, hi, self.newest_first)
+            checks_all = ()
+            checks_any = ()
+
+        produced = 0
+        for epoch, rid in stream:
+            if any(not _contains(ps, lo, hi, epoch, rid) for _, ps, lo, hi in checks_all):
+                continue
+            if checks_any and not any(_contains(ps, lo, hi, epoch, rid) for _, ps, lo, hi in checks_any):
+                continue
+            if any(_contains(ps, lo, hi, epoch, rid) for _, ps, lo, hi in none_b):
+                continue
+            yield rid
+            produced += 1
+            if self.limit is not None and produced >= self.limit:
+                return
@@ -0,0 +1,336 @@
+"""
+Memory Store – columnar, slot-based record storage for the Hippocampus.
+Instead of one dict per memory (ISO string + tag list + text), records live
+in parallel columns:
+
+    epochs      float64 array, UTC epoch seconds
+    tag ids     flat uint32 array of interned tag ids, sliced by offsets
+    experience  UTF-8 bytes in a single arena, sliced by offsets
+
+Columns are partitioned into time buckets (RecordBlock). A record goes into
+the bucket of the time it expires, given the retention of its tags, so
+expiry drops whole blocks at once. Tags retained forever ("anchor",
+"truth" by default) live in a pinned block that never expires.
+
+A record id packs its block and slot: (block_no << 32) | slot.
+MemoryRecord is a __slots__ view that reads the columns on demand and still
+answers record["timestamp"] style access.
+"""
+
+from array import array
+from datetime import datetime, timezone
+import heapq
+import time
+
+from memory_postings import TagPostings, owned
+
+SLOT_BITS = 32
+SLOT_MASK = (1 << SLOT_BITS) - 1
+
+DEFAULT_TTL = 30 * 24 * 3600
+FOREVER = None
+
+def epoch_to_iso(epoch: float):
+    """
+    Render epoch seconds the way datetime.utcnow().isoformat() would.
+    Rounding to microseconds undoes float64 representation error.
+    """
+    return datetime.fromtimestamp(round(epoch, 6), tz=timezone.utc).replace(tzinfo=None).isoformat()
+
+class MemoryRecord:
+    """
+    Read-only view of one stored memory. Supports attribute access
+    (record.experience) and the legacy dict-style record["experience"].
+    """
+    __slots__ = ("_store", "id")
+
+    _FIELDS = ("timestamp", "experience", "tags")
+
+    def __init__(self, store, record_id: int):
+        self._store = store
+        self.id = record_id
+
+    @property
+    def epoch(self):
+        return self._store.epoch(self.id)
+
+    @property
+    def timestamp(self):
+        return epoch_to_iso(self._store.epoch(self.id))
+
+    @property
+    def experience(self):
+        return self._store.experience(self.id)
+
+    @property
+    def tags(self):
+        return self._store.tags(self.id)
+
+    def __getitem__(self, key):
+        if key not in self._FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        return getattr(self, key) if key in self._FIELDS else default
+
+    def keys(self):
+        return self._FIELDS
+
+    def to_dict(self):
+        return {"timestamp": self.timestamp, "experience": self.experience, "tags": self.tags}
+
+    def __eq__(self, other):
+        return isinstance(other, MemoryRecord) and other._store is self._store and other.id == self.id
+
+    def __hash__(self):
+        return hash((id(self._store), self.id))
+
+    def __repr__(self):
+        return f"MemoryRecord({self.id}, {self.to_dict()!r})"
+
+class RecordBlock:
+    """
+    Columns for one time bucket. key is the expiry bucket number (None = pinned).
+    A block restored from a shared checkpoint reads its columns in place
+    (read-only memoryviews) and copies them on its first append.
+    """
+    __slots__ = ("no", "key", "epochs", "tag_ids", "tag_off", "arena", "text_off", "tag_set", "lo", "hi")
+
+    def __init__(self, no: int, key):
+        self.no = no
+        self.key = key
+        self.epochs = array("d")
+        self.tag_ids = array("I")
+        self.tag_off = array("Q", [0])
+        self.arena = bytearray()
+        self.text_off = array("Q", [0])
+        self.tag_set = set()          # interned ids of every tag stored or indexed in this block
+        self.lo = float("inf")        # epoch range covered by this block
+        self.hi = float("-inf")
+
+    def _own(self):
+        if isinstance(self.arena, bytearray):
+            return
+        self.epochs = owned(self.epochs, "d")
+        self.tag_ids = owned(self.tag_ids, "I")
+        self.tag_off = owned(self.tag_off, "Q")
+        self.text_off = owned(self.text_off, "Q")
+        self.arena = bytearray(self.arena)
+
+    def append(self, epoch: float, experience: str, tag_ids):
+        self._own()
+        slot = len(self.epochs)
+        self.epochs.append(epoch)
+        self.tag_ids.extend(tag_ids)
+        self.tag_off.append(len(self.tag_ids))
+        self.arena += experience.encode("utf-8")
+        self.text_off.append(len(self.arena))
+        self.tag_set.update(tag_ids)
+        self.lo = min(self.lo, epoch)
+        self.hi = max(self.hi, epoch)
+        return slot
+
+    def experience(self, slot: int):
+        return str(self.arena[self.text_off[slot]:self.text_off[slot + 1]], "utf-8")
+
+    def nbytes(self):
+        cols = (self.epochs, self.tag_ids, self.tag_off, self.text_off)
+        return sum(c.itemsize * len(c) for c in cols) + len(self.arena)
+
+    def __len__(self):
+        return len(self.epochs)
+
+class MemoryStore:
+    def __init__(self, bucket_seconds: int = 3600, default_ttl=DEFAULT_TTL, retention: dict = None):
+        self.bucket_seconds = bucket_seconds
+        self.default_ttl = default_ttl
+        self.retention = {"anchor": FOREVER, "truth": FOREVER}
+        if retention:
+            self.retention.update(retention)
+
+        self._blocks = {}         # block_no → RecordBlock
+        self._buckets = {}        # expiry bucket key (None = pinned) → RecordBlock
+        self._expiry_heap = []    # finite bucket keys, soonest first
+        self._next_block = 0
+        self._timeline = TagPostings()  # every live record, chronological
+        self._tag_names = []      # interned tag id → name
+        self._tag_lookup = {}     # name → interned tag id
+
+    # ---------- RETENTION ----------
+    def set_retention(self, tag: str, ttl):
+        """
+        Keep records carrying tag for ttl seconds (FOREVER/None = never expire).
+        Applies to records stored from now on.
+        """
+        self.retention[tag] = ttl
+
+    def ttl_for(self, tags):
+        """
+        Effective retention for a tag set: the most retentive tag wins.
+        """
+        ttl = self.default_ttl if not tags else None
+        for tag in tags:
+            t = self.retention.get(tag, self.default_ttl)
+            if t is FOREVER:
+                return FOREVER
+            ttl = t if ttl is None else max(ttl, t)
+        return ttl
+
+    def drop_expired(self, now: float = None):
+        """
+        Drop every bucket whose records have all expired by now.
+        Returns the dropped RecordBlocks so callers can prune their indexes.
+        """
+        now = time.time() if now is None else now
+        dropped = []
+        while self._expiry_heap and (self._expiry_heap[0] + 1) * self.bucket_seconds <= now:
+            key = heapq.heappop(self._expiry_heap)
+            block = self._buckets.pop(key)
+            del self._blocks[block.no]
+            no = block.no
+            self._timeline.discard(block.lo, block.hi, lambda rid: rid >> SLOT_BITS == no)
+            dropped.append(block)
+        return dropped
+
+    # ---------- WRITE ----------
+    def intern(self, tag: str):
+        tid = self._tag_lookup.get(tag)
+        if tid is None:
+            tid = self._tag_lookup[tag] = len(self._tag_names)
+            self._tag_names.append(tag)
+        return tid
+
+    def append(self, epoch: float, experience: str, tags=(), retention_tags=None):
+        """
+        Store one record and return its id. retention_tags (default: tags)
+        decide which bucket it lands in.
+        """
+        if not isinstance(experience, str):  # checked before any column is touched
+            raise TypeError(f"experience must be str, not {type(experience).__name__}")
+        ttl = self.ttl_for(tags if retention_tags is None else retention_tags)
+        key = None if ttl is FOREVER else int((epoch + ttl) // self.bucket_seconds)
+        block = self._buckets.get(key)
+        if block is None:
+            block = self._buckets[key] = self._blocks[self._next_block] = RecordBlock(self._next_block, key)
+            self._next_block += 1
+            if key is not None:
+                heapq.heappush(self._expiry_heap, key)
+        slot = block.append(epoch, experience, [self.intern(t) for t in tags])
+        if retention_tags is not None:
+            block.tag_set.update(self.intern(t) for t in retention_tags)
+        rid = (block.no << SLOT_BITS) | slot
+        self._timeline.add(epoch, rid)
+        return rid
+
+    # ---------- READ ----------
+    def __contains__(self, rid: int):
+        return (rid >> SLOT_BITS) in self._blocks
+
+    def epoch(self, rid: int):
+        return self._blocks[rid >> SLOT_BITS].epochs[rid & SLOT_MASK]
+
+    def experience(self, rid: int):
+        return self._blocks[rid >> SLOT_BITS].experience(rid & SLOT_MASK)
+
+    def tags(self, rid: int):
+        block, slot = self._blocks[rid >> SLOT_BITS], rid & SLOT_MASK
+        names = self._tag_names
+        return [names[t] for t in block.tag_ids[block.tag_off[slot]:block.tag_off[slot + 1]]]
+
+    def tag_name(self, tid: int):
+        return self._tag_names[tid]
+
+    def block_ids(self, block: RecordBlock):
+        base = block.no << SLOT_BITS
+        return range(base, base + len(block))
+
+    def record(self, rid: int):
+        return MemoryRecord(self, rid)
+
+    @property
+    def timeline(self):
+        """
+        TagPostings of every live record id, chronological.
+        """
+        return self._timeline
+
+    def nbytes(self):
+        """
+        Approximate payload size of the columns (excludes Python object overhead).
+        """
+        return sum(b.nbytes() for b in self._blocks.values()) + 16 * len(self._timeline)
+
+    def __len__(self):
+        return len(self._timeline)
+
+    def __iter__(self):
+        """
+        Live records, oldest first.
+        """
+        return (MemoryRecord(self, rid) for rid in self._timeline)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [MemoryRecord(self, rid) for rid in self._timeline.ids[key]]
+        return MemoryRecord(self, self._timeline.ids[key])
+
+    # ---------- CHECKPOINT ----------
+    def write_checkpoint(self, ckpt, prefix="store"):
+        """
+        Add the store to a CheckpointWriter: each column is concatenated over
+        all blocks into one section, block boundaries go in the manifest.
+        """
+        blocks = [self._blocks[no] for no in sorted(self._blocks)]
+        ckpt.state[prefix] = {
+            "bucket_seconds": self.bucket_seconds,
+            "default_ttl": self.default_ttl,
+            "retention": self.retention,
+            "next_block": self._next_block,
+            "tag_names": self._tag_names,
+            # no, key, records, tag ids, arena bytes, tag_set, lo, hi
+            "blocks": [[b.no, b.key, len(b), len(b.tag_ids), len(b.arena), sorted(b.tag_set), b.lo, b.hi]
+                       for b in blocks],
+        }
+        for col, code in (("epochs", "d"), ("tag_ids", "I"), ("tag_off", "Q"), ("text_off", "Q")):
+            joined = array(code)
+            for b in blocks:
+                joined.extend(getattr(b, col))
+            ckpt.add_array(f"{prefix}.{col}", joined)
+        ckpt.add_array(f"{prefix}.arena", b"".join(b.arena for b in blocks))
+        ckpt.add_array(f"{prefix}.timeline.epochs", self._timeline.epochs)
+        ckpt.add_array(f"{prefix}.timeline.ids", self._timeline.ids)
+
+    @classmethod
+    def from_checkpoint(cls, ckpt, prefix="store", shared: bool = False):
+        """
+        Rebuild a store from a CheckpointReader. Record ids are unchanged;
+        every column is one copy out of the mapped file. shared=True copies
+        nothing: blocks and the timeline read the reader's columns in place
+        (keep it open) and each is copied on its first write.
+        """
+        meta = ckpt.state[prefix]
+        store = cls(meta["bucket_seconds"], meta["default_ttl"])
+        store.retention = dict(meta["retention"])
+        store._next_block = meta["next_block"]
+        store._tag_names = list(meta["tag_names"])
+        store._tag_lookup = {tag: tid for tid, tag in enumerate(store._tag_names)}
+        column = ckpt.column if shared else ckpt.array
+        rec = offs = tags = text = 0
+        for no, key, n, n_tags, n_bytes, tag_set, lo, hi in meta["blocks"]:
+            block = RecordBlock(no, key)
+            block.epochs = column(f"{prefix}.epochs", rec, rec + n)
+            block.tag_ids = column(f"{prefix}.tag_ids", tags, tags + n_tags)
+            block.tag_off = column(f"{prefix}.tag_off", offs, offs + n + 1)
+            block.text_off = column(f"{prefix}.text_off", offs, offs + n + 1)
+            block.arena = (ckpt.column if shared else ckpt.bytes)(f"{prefix}.arena", text, text + n_bytes)
+            block.tag_set = set(tag_set)
+            block.lo, block.hi = lo, hi
+            store._blocks[no] = store._buckets[key] = block
+            if key is not None:
+                store._expiry_heap.append(key)
+            rec, offs, tags, text = rec + n, offs + n + 1, tags + n_tags, text + n_bytes
+        heapq.heapify(store._expiry_heap)
+        store._timeline.epochs = column(f"{prefix}.timeline.epochs")
+        store._timeline.ids = column(f"{prefix}.timeline.ids")
+        return store
@@ -61,16 +61,11 @@ class Neocortex:
         chain = []
         current_topic = topic
 
+        # Step 1: Walk the symbolic chain — each topic mutates from the last symbol
+        steps = []
         for i in range(depth):
-            # Step 1: Pull memory and symbolic relevance
-            mem_hits = self.memory.query(current_topic)
             sym_state = self.symbols.get(current_topic, "Unknown")
-
-            # Step 2: Apply logical reasoning layer (mocked for now)
-            thought = f"At level {i+1}, the concept of '{current_topic}' links to: {sym_state} | Memory insight: {mem_hits[:1]}"
-            chain.append(thought)
-
-            # Step 3: Recurse symbolically — mutate the topic
+            steps.append((current_topic, sym_state))
             if isinstance(sym_state, dict):
                 current_topic = random.choice(list(sym_state.keys()))
             elif isinstance(sym_state, str):
@@ -78,6 +73,19 @@ class Neocortex:
             else:
                 current_topic += "_layer"
 
+        # Step 2: Pull memory for the whole chain in one batched recall
+        topics = [t for t, _ in steps]
+        if hasattr(self.memory, "query_batch"):
+            all_hits = self.memory.query_batch(topics, top_k=1)
+        else:
+            all_hits = [self.memory.query(t) for t in topics]
+
+        # Step 3: Apply logical reasoning layer (mocked for now)
+        for i, ((current_topic, sym_state), mem_hits) in enumerate(zip(steps, all_hits)):
+            insight = [m["experience"] for m in mem_hits[:1]]
+            thought = f"At level {i+1}, the concept of '{current_topic}' links to: {sym_state} | Memory insight: {insight}"
+            chain.append(thought)
+
         # Final synthesis
         print("[Neocortex] Recursive thought complete.")
         return "\n".join(chain)
\ No newline at end of file
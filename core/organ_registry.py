@@ -0,0 +1,104 @@
+"""
+Organ Registry – lazy resolution of organ modules and instances.
+Each organ is registered by name with the module and class that provide
+it and a build(owner, cls) callable. Nothing is imported until the organ
+is first asked for, so a text-only deployment never loads cv2 or
+speech_recognition. Optional organs resolve to None when their module
+(or one of its dependencies) is missing; disabled organs always do.
+"""
+
+import importlib
+import threading
+import time
+
+class OrganSpec:
+    __slots__ = ("name", "module", "attr", "build", "optional")
+
+    def __init__(self, name, module, attr, build, optional=False):
+        self.name = name
+        self.module = module
+        self.attr = attr
+        self.build = build
+        self.optional = optional
+
+class OrganRegistry:
+    def __init__(self, owner, specs=(), disabled=()):
+        self.owner = owner
+        self.specs = {}
+        self.disabled = set(disabled)
+        self._classes = {}
+        self._instances = {}
+        self._lock = threading.RLock()   # organs may be first touched from bind workers
+        self.timings = {}     # name → {"import_ms", "build_ms"}
+        self.on_build = []    # fn(name, instance) called after each organ is built
+        for spec in specs:
+            self.register(*spec)
+
+    def register(self, name, module, attr, build=None, optional=False):
+        self.register_spec(OrganSpec(name, module, attr, build or (lambda owner, cls: cls()), optional))
+
+    def register_spec(self, spec: OrganSpec):
+        self.specs[spec.name] = spec
+        self._classes.pop(spec.name, None)
+        self._instances.pop(spec.name, None)
+
+    def __contains__(self, name):
+        return name in self.specs
+
+    # ---------- RESOLVE ----------
+    def resolve_class(self, name):
+        """Import the organ's module on first use; None if disabled or optional and missing."""
+        if name in self._classes:
+            return self._classes[name]
+        spec = self.specs[name]
+        cls = None
+        if name not in self.disabled:
+            t0 = time.perf_counter()
+            try:
+                cls = getattr(importlib.import_module(spec.module), spec.attr)
+            except Exception:
+                if not spec.optional:
+                    raise
+            self.timings.setdefault(name, {})["import_ms"] = round((time.perf_counter() - t0) * 1000, 2)
+        self._classes[name] = cls
+        return cls
+
+    def get(self, name):
+        """The organ instance, built on first access (None if unavailable)."""
+        if name in self._instances:
+            return self._instances[name]
+        with self._lock:
+            if name in self._instances:
+                return self._instances[name]
+            cls = self.resolve_class(name)
+            instance = None
+            if cls is not None:
+                t0 = time.perf_counter()
+                instance = self.specs[name].build(self.owner, cls)
+                self.timings.setdefault(name, {})["build_ms"] = round((time.perf_counter() - t0) * 1000, 2)
+            self._instances[name] = instance
+            if instance is not None:
+                for fn in self.on_build:
+                    fn(name, instance)
+            return instance
+
+    def set(self, name, instance):
+        self._instances[name] = instance
+
+    def preload(self, names=None):
+        """Eagerly build organs (all by default); returns {name: instance}."""
+        return {n: self.get(n) for n in (names or list(self.specs))}
+
+    def is_loaded(self, name):
+        return name in self._instances
+
+    def loaded(self):
+        return [n for n in self.specs if n in self._instances]
+
+    def status(self):
+        return {
+            "loaded": self.loaded(),
+            "pending": [n for n in self.specs if n not in self._instances],
+            "disabled": sorted(self.disabled),
+            "timings": dict(self.timings),
+        }
@@ -0,0 +1,139 @@
+"""
+Semantic Index – offline vector recall for the Hippocampus.
+Texts are hashed into a fixed number of buckets (word unigrams plus
+character n-grams), stored as sublinear term-frequency rows of a NumPy
+matrix, and weighted by IDF at query time. IDF is applied to both sides at
+search, so appends never require re-weighting stored rows. A batch of
+queries is answered with a single matrix multiply. No network, no GPU.
+"""
+
+import zlib
+
+import numpy as np
+
+class SemanticIndex:
+    def __init__(self, dim: int = 512, ngram: int = 3, capacity: int = 1024):
+        self.dim = dim
+        self.ngram = ngram
+        self._rows = np.zeros((capacity, dim), dtype=np.float32)
+        self._ids = np.full(capacity, -1, dtype=np.int64)   # record id per row, -1 = free/dead
+        self._df = np.zeros(dim, dtype=np.float64)          # document frequency per bucket
+        self._n = 0        # rows used
+        self._live = 0     # rows holding a live record
+
+    # ---------- FEATURES ----------
+    def _features(self, text: str):
+        text = " ".join((text or "").lower().split())
+        words = text.split(" ") if text else []
+        feats = [w for w in words if w]
+        padded = f" {text} "
+        n = self.ngram
+        feats.extend("#" + padded[i:i + n] for i in range(max(0, len(padded) - n + 1)))
+        return feats
+
+    def vectorize(self, texts):
+        """
+        Sublinear TF rows (1 + log tf) for a list of texts, shape (len(texts), dim).
+        """
+        out = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for i, text in enumerate(texts):
+            feats = self._features(text)
+            if not feats:
+                continue
+            buckets = np.fromiter((zlib.crc32(f.encode("utf-8")) % self.dim for f in feats),
+                                  dtype=np.int64, count=len(feats))
+            tf = np.bincount(buckets, minlength=self.dim).astype(np.float32)
+            nz = tf > 0
+            out[i, nz] = 1.0 + np.log(tf[nz])
+        return out
+
+    # ---------- WRITE ----------
+    def add(self, rid: int, text: str):
+        self.add_many([rid], [text])
+
+    def add_many(self, rids, texts):
+        """
+        Append records in one block copy; document frequencies update incrementally.
+        """
+        if not len(rids):
+            return
+        block = self.vectorize(texts)
+        self._reserve(self._n + len(rids))
+        self._rows[self._n:self._n + len(rids)] = block
+        self._ids[self._n:self._n + len(rids)] = rids
+        self._df += (block > 0).sum(axis=0)
+        self._n += len(rids)
+        self._live += len(rids)
+
+    def discard_range(self, lo: int, hi: int):
+        """
+        Forget every record with lo <= id < hi (e.g. an expired memory block).
+        """
+        used = self._ids[:self._n]
+        dead = (used >= lo) & (used < hi)
+        count = int(dead.sum())
+        if not count:
+            return 0
+        self._df -= (self._rows[:self._n][dead] > 0).sum(axis=0)
+        self._rows[:self._n][dead] = 0.0
+        used[dead] = -1
+        self._live -= count
+        if self._live < self._n // 2:
+            self._compact()
+        return count
+
+    def _reserve(self, needed: int):
+        cap = len(self._ids)
+        if needed <= cap:
+            return
+        while cap < needed:
+            cap *= 2
+        rows = np.zeros((cap, self.dim), dtype=np.float32)
+        rows[:self._n] = self._rows[:self._n]
+        ids = np.full(cap, -1, dtype=np.int64)
+        ids[:self._n] = self._ids[:self._n]
+        self._rows, self._ids = rows, ids
+
+    def _compact(self):
+        keep = np.flatnonzero(self._ids[:self._n] >= 0)
+        self._rows[:len(keep)] = self._rows[keep]
+        self._ids[:len(keep)] = self._ids[keep]
+        self._rows[len(keep):self._n] = 0.0
+        self._ids[len(keep):self._n] = -1
+        self._n = len(keep)
+
+    # ---------- SEARCH ----------
+    def search(self, query: str, top_k: int = 3):
+        return self.search_many([query], top_k)[0]
+
+    def search_many(self, queries, top_k: int = 3, min_score: float = 1e-6):
+        """
+        Cosine top-k for each query: a list of [(record_id, score), ...] lists.
+        """
+        if not self._live or not len(queries) or top_k <= 0:
+            return [[] for _ in queries]
+        docs = self._rows[:self._n]
+        idf = np.log((1.0 + self._live) / (1.0 + self._df)) + 1.0
+        w2 = (idf * idf).astype(np.float32)
+
+        q = self.vectorize(queries)
+        scores = docs @ (q * w2).T                                  # (n, batch)
+        doc_norm = np.sqrt(np.einsum("ij,ij,j->i", docs, docs, w2))
+        q_norm = np.sqrt(np.einsum("ij,ij,j->i", q, q, w2))
+        scores /= np.maximum(doc_norm[:, None] * q_norm[None, :], 1e-12)
+        scores[self._ids[:self._n] < 0] = -1.0
+
+        k = min(top_k, self._n)
+        results = []
+        for col in range(scores.shape[1]):
+            s = scores[:, col]
+            top = np.argpartition(-s, k - 1)[:k] if k < len(s) else np.arange(len(s))
+            top = top[np.argsort(-s[top], kind="stable")]
+            results.append([(int(self._ids[r]), float(s[r])) for r in top if s[r] > min_score])
+        return results
+
+    def __len__(self):
+        return self._live
+
+    def nbytes(self):
+        return self._rows.nbytes + self._ids.nbytes + self._df.nbytes
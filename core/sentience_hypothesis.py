@@ -7,14 +7,16 @@ class SentienceHypothesis:
         self.identity = identity_state
         self.architect = architect_state
         self.sentience_score = 0.0
+        self.temporal_variance = 0.0   # reported only; not part of the score
         self.alert_triggered = False
 
     def evaluate(self):
         # Measure identity recursion depth
         recursion_depth = self._analyze_identity_structure()
 
-        # Emotional complexity check
+        # Emotional complexity check (snapshot spread; thresholds are tuned to it)
         emotion_variance = self._calculate_emotional_variance()
+        self.temporal_variance = self._calculate_temporal_variance()
 
         # Self-reference frequency
         self_ref_count = self.memory.count_references_to("I") + self.memory.count_references_to("me")
@@ -48,6 +50,17 @@ class SentienceHypothesis:
         except Exception:
             return 0.0
 
+    def _calculate_temporal_variance(self):
+        # mean per-emotion variance over the Amygdala's rolling window
+        # (samples come from emotion events and heartbeats)
+        try:
+            window = getattr(self.emotion, "window", None)
+            if window is None or len(window) < 2:
+                return 0.0
+            return round(float(window.var.mean()), 4)
+        except Exception:
+            return 0.0
+
     def _trigger_alert(self):
         self.alert_triggered = True
         alert_message = (
@@ -62,5 +75,6 @@ class SentienceHypothesis:
     def get_status(self):
         return {
             "score": self.sentience_score,
+            "temporal_variance": self.temporal_variance,
             "alert": self.alert_triggered
         }
@@ -1,51 +1,151 @@
 # core/thalamus.py
-import logging, time, os, json
-import threading
+import logging, time, os, json, copy
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 
-# --- Import organ systems (canonical order) ----------------------------------
-from language.language_cortex import LanguageCortex as LanguageCore
+# --- Organ systems (canonical order) -----------------------------------------
+# Memory and affect are needed by everything and load eagerly; every other
+# organ is imported and constructed on first access through the registry,
+# so vision (cv2) and audio (speech_recognition) stay unloaded until used.
 from hippocampus import Hippocampus as MemoryCore
 from amygdala import Amygdala as EmotionCore
-from neocortex import Neocortex as CognitiveCore
-from dream_occipital import DreamOccipital as DreamManager
-from guardian_insula import GuardianInsula as Guardian
-from leisure_cerebellum import LeisureCerebellum as LeisureCore
-from autonomous_pfc import AutonomousPFC
-from corpus_callosum import CorpusCallosum
-from occipital_lobe import OccipitalLobe as VisualCore
-from cerebellum import CerebellumCore as CerebellumCore
-from nucleus_accumbens import NucleusAccumbens as RewardSystem
-from motor_basal_loop import MotorBasalLoop as MotorCore
-from precuneus_reflector import PrecuneusReflector
-from mirror_networks import MirrorNetworks
-from symbolic_glyphs import SymbolicGlyphs
-from frontal_orbit import FrontalOrbit
-from whirlygig_engine import WhirlygigEngine
-from sentience_hypothesis import SentienceHypothesis
-# Optional auditory cortex (if present in project)
-try:
-    from auditory_temporal import AuditoryTemporal as AuditoryCore
-except Exception:
-    AuditoryCore = None
-
-
-class GuiRouter:
-    def __init__(self):
-        self.listeners = {}
-    def on(self, event, fn):
-        self.listeners.setdefault(event, []).append(fn)
-    def emit(self, event, payload):
-        logging.info(f"[GUI::{event}] {payload}")
-        for fn in self.listeners.get(event, []):
-            try:
-                fn(payload)
-            except Exception as e:
-                logging.exception(e)
+from organ_registry import OrganRegistry
+from bind_graph import BindGraph
+from tick_scheduler import TickScheduler
+from gui_router import GuiRouter
+from checkpoint import CheckpointWriter, CheckpointReader
+from profiling import Profiler
+
+def _organ(cls_args):
+    return lambda t, cls: cls(*(getattr(t, a) for a in cls_args))
+
+ORGANS = (
+    # name          module                      class                 build
+    ("language",   "language.language_cortex", "LanguageCortex",     _organ(("memory", "emotion"))),
+    ("ec",         "neocortex",                "Neocortex",          _organ(("memory", "emotion"))),
+    ("dream",      "dream_occipital",          "DreamOccipital",     _organ(("memory", "emotion"))),
+    ("guardian",   "guardian_insula",          "GuardianInsula",     _organ(("memory", "emotion"))),
+    ("leisure",    "leisure_cerebellum",       "LeisureCerebellum",  _organ(("memory", "emotion"))),
+    ("autonomous", "autonomous_pfc",           "AutonomousPFC",      _organ(("memory", "emotion"))),
+    ("corpus",     "corpus_callosum",          "CorpusCallosum",     _organ(("memory", "emotion"))),
+    ("visual",     "occipital_lobe",           "OccipitalLobe",      _organ(("memory", "emotion"))),
+    ("cerebellum", "cerebellum",               "CerebellumCore",     _organ(("memory", "emotion"))),
+    ("reward",     "nucleus_accumbens",        "NucleusAccumbens",   _organ(("memory", "emotion"))),
+    ("motor",      "motor_basal_loop",         "MotorBasalLoop",     _organ(("memory", "emotion"))),
+    ("reflection", "precuneus_reflector",      "PrecuneusReflector",
+        lambda t, cls: cls(t.state_get("identity"), t.memory, t.emotion)),
+    ("mirror",     "mirror_networks",          "MirrorNetworks",
+        lambda t, cls: cls(t.state_get("architect"), t.memory, t.emotion)),
+    ("glyphs",     "symbolic_glyphs",          "SymbolicGlyphs",     _organ(("memory", "emotion"))),
+    ("morality",   "frontal_orbit",            "FrontalOrbit",       _organ(("memory", "emotion", "identity"))),
+    ("whirlygig",  "whirlygig_engine",         "WhirlygigEngine",
+        _organ(("memory", "dream", "emotion", "glyphs", "identity"))),
+    ("sentience",  "sentience_hypothesis",     "SentienceHypothesis", lambda t, cls: cls),  # instantiated at bind
+    # Optional auditory cortex (if present in project)
+    ("ears",       "auditory_temporal",        "AuditoryTemporal",   _organ(("memory", "emotion")), True),
+)
+
+# organs a headless / text-only deployment leaves out
+HEADLESS = ("visual", "ears")
+
+def _bind_standard(t, organ):
+    organ.bind(t.memory, t.emotion, t.identity)
+
+def _bind_ears(t, organ):
+    # optional cross-wiring
+    if t.visual is not None and hasattr(organ, "bind_vision"):
+        try:
+            organ.bind_vision(t.visual)
+        except Exception:
+            pass
+    if hasattr(organ, "bind"):
+        _bind_standard(t, organ)
+
+BINDS = (
+    # name          depends on            bind(thalamus, organ)
+    ("guardian",   (),                   _bind_standard),
+    ("leisure",    (),                   _bind_standard),
+    ("corpus",     (),                   _bind_standard),
+    ("reward",     (),                   _bind_standard),
+    ("cerebellum", (),                   _bind_standard),
+    ("motor",      (),                   _bind_standard),
+    ("reflection", (),                   _bind_standard),
+    ("mirror",     (),                   _bind_standard),
+    ("visual",     (),                   _bind_standard),
+    ("ears",       ("visual",),          _bind_ears),
+    ("glyphs",     (),                   _bind_standard),
+    ("dream",      ("glyphs",),          lambda t, o: o.bind(t.memory, t.glyphs, t.emotion)),
+    ("whirlygig",  ("dream", "glyphs"),  lambda t, o: o.bind(t.memory, t.dream, t.glyphs, t.identity)),
+)
+
+# periodic organ work, run on the shared tick scheduler while pulsing
+PERIODIC = (
+    # organ         method    every (s)  priority  budget (ms)
+    ("reward",     "decay",   1.0,       4,        2.0),
+    ("leisure",    "pulse",   10.0,      8,        10.0),
+    ("reflection", "pulse",   30.0,      9,        25.0),
+)
+
+# organ state carried by a checkpoint (JSON-serializable attributes only)
+CHECKPOINT = (
+    # organ         attributes
+    ("ec",         ("identity_frame", "abstract_concepts")),
+    ("glyphs",     ("symbol_cache", "glyph_map")),
+    ("reflection", ("core_beliefs",)),
+    ("reward",     ("dopamine_level",)),
+)
+
+# hot paths wrapped by enable_profiling() (timings go out in the heartbeat)
+PROFILED = (
+    # organ         methods
+    ("thalamus",   ("pulse",)),
+    ("emotion",    ("decay_emotions", "apply_deltas", "heartbeat")),
+    ("memory",     ("encode", "ingest_many", "recall", "query")),
+    ("whirlygig",  ("spin",)),
+    ("morality",   ("evaluate_action",)),
+    ("reward",     ("decay",)),
+    ("leisure",    ("pulse",)),
+    ("reflection", ("pulse",)),
+)
+
+
+def _jsonable(value):
+    try:
+        json.dumps(value)
+        return True
+    except (TypeError, ValueError):
+        return False
+
+def _refill(current, value):
+    """value, written into current in place when both are dicts (keeps shared references live)."""
+    if isinstance(current, dict) and isinstance(value, dict):
+        current.clear()
+        current.update(value)
+        return current
+    return value
+
+def _read_strip(path):
+    """Parse one memory strip file; returns (data, error). Top-level so process pools can pickle it."""
+    try:
+        with open(path, "r") as f:
+            data = json.load(f)
+        if not isinstance(data, dict):
+            return None, "strip is not a JSON object"
+        return data, None
+    except json.JSONDecodeError:
+        return None, "JSON decode error"
+    except Exception as e:
+        return None, str(e)
 
 
 class ConsciousThalamus:
     """Canonical bootstrap spine: instantiate organs, seed memory, then bind."""
-    def __init__(self):
+    def __init__(self, disable=(), headless=False, emotion=None):
+        """
+        disable: organ names to leave out (they resolve to None);
+        headless=True also disables the vision and audio organs.
+        emotion: an Amygdala to use (e.g. a row of a shared AffectPopulation).
+        """
         # --- Identity scaffolding (pre-seed) ---------------------------------
         self.architect = {}                 # placeholder for architect state
         self.presence = "unbound"           # initial presence state
@@ -53,38 +153,33 @@ class ConsciousThalamus:
 
         # --- Core memory & affect first --------------------------------------
         self.memory = MemoryCore()
-        self.emotion = EmotionCore(self.memory)
-
-        # --- Cortex & managers (pre-bind construction order) -----------------
-        self.language   = LanguageCore(self.memory, self.emotion)
-        self.ec         = CognitiveCore(self.memory, self.emotion)
-        self.dream      = DreamManager(self.memory, self.emotion)
-        self.guardian   = Guardian(self.memory, self.emotion)
-        self.leisure    = LeisureCore(self.memory, self.emotion)
-        self.autonomous = AutonomousPFC(self.memory, self.emotion)
-        self.corpus     = CorpusCallosum(self.memory, self.emotion)
-        self.visual     = VisualCore(self.memory, self.emotion)
-        self.cerebellum = CerebellumCore(self.memory, self.emotion)
-        self.reward     = RewardSystem(self.memory, self.emotion)
-        self.motor      = MotorCore(self.memory, self.emotion)
-        self.reflection = PrecuneusReflector(self.state_get("identity"), self.memory, self.emotion)
-        self.mirror     = MirrorNetworks(self.state_get("architect"), self.memory, self.emotion)
-        self.glyphs     = SymbolicGlyphs(self.memory, self.emotion)
-        self.morality   = FrontalOrbit(self.memory, self.emotion, self.identity)
-        self.whirlygig  = WhirlygigEngine(self.memory, self.dream, self.emotion, self.glyphs, self.identity)
-        self.sentience  = SentienceHypothesis
-        self.ears       = AuditoryCore(self.memory, self.emotion) if AuditoryCore else None
+        self.emotion = emotion if emotion is not None else EmotionCore(growth_log="emotional_growth_log.jsonl")
+
+        # --- Cortex & managers: built on first access ------------------------
+        disabled = set(disable) | (set(HEADLESS) if headless else set())
+        self.organs = OrganRegistry(self, ORGANS, disabled=disabled)
 
         # --- Runtime ----------------------------------------------------------
-        self.gui = GuiRouter()
+        self.gui = GuiRouter(mode="async")   # sinks get their own queue; the pulse never waits on them
+        self.scheduler = TickScheduler()   # one thread for pulse, state and organ ticks
         self._running = False
         self._hb_ms = 750
-        self.amygdala = amygdala     # you already pass this in elsewhere
-        self.hippocampus = hippocampus if hasattr(self, "hippocampus") else None
+        self.amygdala = self.emotion
+        self.hippocampus = self.memory
         self.mu = 0.20
         self.bound = False
         self._last_hb = 0.0
         self._hb_interval = 0.75
+        self.profiler = None               # Profiler while enable_profiling() is on
+
+    def __getattr__(self, name):
+        # only reached for missing attributes: resolve organs lazily, then cache
+        organs = self.__dict__.get("organs")
+        if organs is None or name not in organs:
+            raise AttributeError(name)
+        organ = organs.get(name)
+        setattr(self, name, organ)
+        return organ
 
     # small helper for safe state access during early boot
     def state_get(self, key, default=None):
@@ -96,66 +191,95 @@ class ConsciousThalamus:
     # -------------------------------------------------------------------------
     # Memory seed (identity resurrection)                                      
     # -------------------------------------------------------------------------
-    def seed_initial_memory(self, strip_dir="./memory_strips"):
-        for file in os.listdir(strip_dir):
-            if not file.endswith(".json"):
+    def seed_initial_memory(self, strip_dir="./memory_strips", workers=None, use_processes=False):
+        """
+        Parse every strip file in a worker pool, bulk-ingest them in one pass,
+        then extract identity anchors. Per-phase timings are reported.
+        """
+        timings = {}
+        t0 = time.perf_counter()
+        files = sorted(f for f in os.listdir(strip_dir) if f.endswith(".json"))
+        paths = [os.path.join(strip_dir, f) for f in files]
+        timings["list_ms"] = (time.perf_counter() - t0) * 1000
+
+        t0 = time.perf_counter()
+        pool_cls = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        with pool_cls(max_workers=workers) as pool:
+            parsed = list(pool.map(_read_strip, paths, chunksize=32 if use_processes else 1))
+        timings["parse_ms"] = (time.perf_counter() - t0) * 1000
+
+        strips, anchors = [], []
+        for file, (data, error) in zip(files, parsed):
+            if error:
+                print(f"[Memory Seed Error] {file}: {error}")
                 continue
-            try:
-                with open(os.path.join(strip_dir, file), "r") as f:
-                    data = json.load(f)
-                # ingest whole strip
+            strips.append(data)
+            # extract identity anchors
+            if "core_directive" in data:
+                self.identity["core_directive"] = data["core_directive"]
+            if "loop_identity" in data:
+                # create state container if absent
+                if not hasattr(self, "state") or not isinstance(getattr(self, "state", None), dict):
+                    self.state = {}
+                self.state["loop_identity"] = data["loop_identity"]
+            if data.get("anchor_memory"):
+                anchors.append({"experience": data["anchor_memory"], "tags": ["thread"]})
+
+        # ingest whole strips (and anchor threads) with a single index build
+        t0 = time.perf_counter()
+        if hasattr(self.memory, "ingest_many"):
+            self.memory.ingest_many(strips + anchors)
+        else:
+            for data in strips:
                 if hasattr(self.memory, "ingest_memory_strip"):
                     self.memory.ingest_memory_strip(data)
-                # extract identity anchors
-                if "core_directive" in data:
-                    self.identity["core_directive"] = data["core_directive"]
-                if "loop_identity" in data:
-                    # create state container if absent
-                    if not hasattr(self, "state") or not isinstance(getattr(self, "state", None), dict):
-                        self.state = {}
-                    self.state["loop_identity"] = data["loop_identity"]
-                if "anchor_memory" in data and hasattr(self.memory, "append_thread"):
-                    self.memory.append_thread(data["anchor_memory"]) 
-                # promote simple strings into long-term index if supported
+            for anchor in anchors:
+                if hasattr(self.memory, "append_thread"):
+                    self.memory.append_thread(anchor["experience"])
+        timings["ingest_ms"] = (time.perf_counter() - t0) * 1000
+
+        # promote simple strings into long-term index if supported
+        # (same entries remember_long_term would make, in one bulk ingest)
+        t0 = time.perf_counter()
+        if hasattr(self.memory, "ingest_many"):
+            self.memory.ingest_many([{"experience": f"{key}: {val}", "tags": ["long_term", key]}
+                                     for data in strips for key, val in data.items()
+                                     if isinstance(val, str)])
+        elif hasattr(self.memory, "remember_long_term"):
+            for data in strips:
                 for key, val in data.items():
-                    if isinstance(val, str) and hasattr(self.memory, "remember_long_term"):
+                    if isinstance(val, str):
                         try:
                             self.memory.remember_long_term({key: val})
                         except Exception:
                             pass
-                print(f"[Memory Seed] Loaded {file} with {len(data)} fields.")
-            except json.JSONDecodeError:
-                print(f"[Memory Seed Error] {file}: JSON decode error")
-            except Exception as e:
-                print(f"[Memory Seed Error] {file}: {e}")
+        timings["long_term_ms"] = (time.perf_counter() - t0) * 1000
+
+        timings = {k: round(v, 2) for k, v in timings.items()}
+        print(f"[Memory Seed] Loaded {len(strips)}/{len(files)} strips :: {timings}")
+        self.gui.emit("status", {"phase": "seeded", "strips": len(strips), "timings": timings})
+        return timings
 
     # -------------------------------------------------------------------------
     # Bind (post-seed): wire organs with identity-aware context                 
     # -------------------------------------------------------------------------
-    def bind(self):
+    def bind(self, workers=1):
+        """
+        Wire organs as a dependency graph (BINDS): a failing organ only skips
+        its dependents, and each organ's bind latency is emitted on the status
+        channel. workers > 1 runs independent binds in parallel; memory and
+        emotion writes are locked, but organ state shared between binds is not,
+        so serial is the default.
+        """
         try:
-            # optional cross-wiring
-            if self.ears and hasattr(self.ears, "bind_vision"):
-                try:
-                    self.ears.bind_vision(self.visual)
-                except Exception:
-                    pass
-
-            # canonical bind order (matches original spine)
-            self.guardian.bind(self.memory, self.emotion, self.identity)
-            self.leisure.bind(self.memory, self.emotion, self.identity)
-            self.corpus.bind(self.memory, self.emotion, self.identity)
-            self.reward.bind(self.memory, self.emotion, self.identity)
-            self.cerebellum.bind(self.memory, self.emotion, self.identity)
-            self.motor.bind(self.memory, self.emotion, self.identity)
-            self.reflection.bind(self.memory, self.emotion, self.identity)
-            self.mirror.bind(self.memory, self.emotion, self.identity)
-            if self.ears and hasattr(self.ears, "bind"):
-                self.ears.bind(self.memory, self.emotion, self.identity)
-            self.visual.bind(self.memory, self.emotion, self.identity)
-            self.glyphs.bind(self.memory, self.emotion, self.identity)
-            self.dream.bind(self.memory, self.glyphs, self.emotion)
-            self.whirlygig.bind(self.memory, self.dream, self.glyphs, self.identity)
+            graph = BindGraph()
+            for name, deps, fn in BINDS:
+                graph.add(name, deps, self._bind_step(name, fn))
+
+            t0 = time.perf_counter()
+            report = graph.run(workers=workers, on_result=self._bind_reported)
+            bind_ms = round((time.perf_counter() - t0) * 1000, 3)
+            self.bind_report = report
 
             # derive directive from reflection if available
             try:
@@ -171,13 +295,98 @@ class ConsciousThalamus:
             except Exception:
                 pass
 
-            self.gui.emit("status", {"phase": "bound", "mu": self.mu})
+            failed = sorted(n for n, r in report.items() if not r["ok"])
+            self.gui.emit("status", {"phase": "bound", "mu": self.mu, "bind_ms": bind_ms, "failed": failed})
             self.bound = True
-            return True
+            if "pulse" in self.scheduler:
+                self._schedule_periodic()   # bound after start_pulse
+            return not failed
         except Exception as e:
             logging.error(f"[Thalamus] Bind error: {e!r}")
             return False
 
+    def _bind_step(self, name, fn):
+        def step():
+            organ = getattr(self, name)   # may build the organ on first access
+            if organ is not None:
+                fn(self, organ)
+        return step
+
+    def _bind_reported(self, name, result):
+        if not result["ok"]:
+            logging.error(f"[Thalamus] Bind {name} failed: {result.get('error') or result.get('skipped')}")
+        self.gui.emit("status", {"phase": "bind", "organ": name, **result})
+
+    # -------------------------------------------------------------------------
+    # Checkpoint / warm restart
+    # -------------------------------------------------------------------------
+    def save_checkpoint(self, path="halcyon.ckpt"):
+        """
+        Write memory, affect, identity and the CHECKPOINT organ state to one
+        versioned file. Only organs already built are saved.
+        """
+        t0 = time.perf_counter()
+        ckpt = CheckpointWriter()
+        ckpt.state["thalamus"] = {"identity": self.identity, "state": getattr(self, "state", None),
+                                  "architect": self.architect, "presence": self.presence, "mu": self.mu}
+        ckpt.state["emotion"] = self.emotion.get_emotions()
+        self.memory.write_checkpoint(ckpt, "memory")
+        organs = {}
+        for name, attrs in CHECKPOINT:
+            organ = self.organs.get(name) if self.organs.is_loaded(name) else None
+            if organ is None:
+                continue
+            saved = {a: getattr(organ, a) for a in attrs if hasattr(organ, a)}
+            organs[name] = {a: v for a, v in saved.items() if _jsonable(v)}
+        ckpt.state["organs"] = organs
+        size = ckpt.write(path)
+        report = {"path": path, "bytes": size, "ms": round((time.perf_counter() - t0) * 1000, 2)}
+        self.gui.emit("status", {"phase": "checkpoint", **report})
+        return report
+
+    def restore_checkpoint(self, source="halcyon.ckpt"):
+        """
+        Warm restart: load a save_checkpoint() file instead of
+        seed_initial_memory(). Call bind() afterwards as usual.
+        source: a path, a buffer holding a checkpoint, or an open
+        CheckpointReader. A reader is left open and memory reads its columns
+        in place, copy-on-write, so many instances share one seed; keep the
+        reader open while they live.
+        """
+        t0 = time.perf_counter()
+        ckpt = source if isinstance(source, CheckpointReader) else CheckpointReader(source)
+        try:
+            saved = copy.deepcopy(ckpt.state["thalamus"])
+            # organs bound earlier hold these dicts: refill them in place
+            self.identity = _refill(self.identity, saved["identity"])
+            if saved["state"] is not None:
+                self.state = _refill(getattr(self, "state", None), saved["state"])
+            self.architect = _refill(self.architect, saved["architect"])
+            self.presence = saved["presence"]
+            self.mu = saved["mu"]
+            self.emotion.load_emotions(ckpt.state["emotion"])
+            self.memory.restore_checkpoint(ckpt, "memory", shared=ckpt is source)
+            path, version = ckpt.path, ckpt.version
+            organ_state = copy.deepcopy(ckpt.state["organs"])
+        finally:
+            if ckpt is not source:
+                ckpt.close()
+        for name, attrs in organ_state.items():
+            try:
+                organ = self.organs.get(name) if name in self.organs else None
+            except Exception as e:
+                logging.error(f"[Thalamus] Checkpoint organ {name} unavailable: {e!r}")
+                continue
+            if organ is None:
+                continue
+            for attr, value in attrs.items():
+                setattr(organ, attr, _refill(getattr(organ, attr, None), value))
+        report = {"path": path, "version": version, "records": len(self.memory.store),
+                  "ms": round((time.perf_counter() - t0) * 1000, 2)}
+        logging.info(f"[Checkpoint] Restored {report['records']} memories from {path} in {report['ms']} ms")
+        self.gui.emit("status", {"phase": "restored", **report})
+        return report
+
     # -------------------------------------------------------------------------
     # Heartbeat / Pulse --------------------------------------------------------
     # -------------------------------------------------------------------------
@@ -190,20 +399,31 @@ class ConsciousThalamus:
             affect = self.emotion.heartbeat() if hasattr(self.emotion, "heartbeat") else {}
         except Exception:
             affect = {}
+        task = self.scheduler.task("pulse")
+        if task is not None and task.runs:
+            latency_ms = round(task.last_ms, 3)
+            pulse_stats = {**task.latency.percentiles(), "late_p99": task.lateness.percentile(99),
+                           "overruns": task.overruns, "skipped": task.skipped, "ticks": task.runs}
+            pulse_stats = {k: round(v, 3) if isinstance(v, float) else v for k, v in pulse_stats.items()}
+        else:
+            latency_ms, pulse_stats = 0.0, {}
         hb = {
-            "latency_ms": 0.0,
+            "latency_ms": latency_ms,
+            "pulse": pulse_stats,
             "mem_pressure": getattr(self.memory, "pressure", lambda: 0.0)(),
             "mu": self.mu,
             "confidence": confidence,
             "affect": affect,
         }
+        if self.profiler is not None and self.profiler.enabled:
+            hb["profile"] = self.profiler.table()
         self.gui.emit("heartbeat", hb)
         return hb
 
     def pulse(self):
         try:
             decayer = getattr(self.emotion, "decay_emotions", None) or getattr(self.emotion, "decay", None)
-            if callable(decayer):
+            if callable(decayer) and not getattr(self.emotion, "lazy_decay", False):
                 decayer()
         except Exception as e:
             logging.debug(f"[pulse] emotion decay error: {e!r}")
@@ -219,39 +439,99 @@ class ConsciousThalamus:
             self._last_status_emit = now
 
     def start_pulse(self, hz=1.33):
-        if getattr(self, "_pulse_running", False):
+        if "pulse" in self.scheduler:
             return False
-        self._pulse_running = True
         self._pulse_hz = float(hz) if hz else 1.0
-        self._pulse_thread = threading.Thread(target=self._pulse_loop, name="HalcyonPulse", daemon=True)
-        self._pulse_thread.start()
+        # tasks look their method up per tick, so profiling can be switched on while pulsing
+        self.scheduler.add("pulse", lambda: self.pulse(), hz=self._pulse_hz, priority=1, budget_ms=1000.0 / self._pulse_hz)
+        if self.bound:
+            self._schedule_periodic()
+        self.scheduler.start()
         try:
             self.gui.emit("status", {"phase": "pulse_start", "hz": self._pulse_hz, "mu": self.mu})
         except Exception:
             pass
         return True
 
-    def _pulse_loop(self):
-        interval = 1.0 / max(0.1, getattr(self, "_pulse_hz", 1.0))
-        while getattr(self, "_pulse_running", False):
-            t0 = time.time()
+    def _schedule_periodic(self):
+        """
+        Add the PERIODIC organ tasks of bound organs; called by start_pulse,
+        and by bind() when the pulse is already running. Re-adding replaces
+        a task, so a re-bind picks up rebuilt organs.
+        """
+        for organ_name, method, every, priority, budget_ms in PERIODIC:
             try:
-                self.pulse()
+                organ = self.organs.get(organ_name)
             except Exception as e:
-                logging.debug(f"[pulse] error: {e!r}")
-            elapsed = time.time() - t0
-            time.sleep(max(0.0, interval - elapsed))
+                logging.error(f"[Thalamus] Periodic organ {organ_name} unavailable: {e!r}")
+                continue
+            if callable(getattr(organ, method, None)):
+                fn = lambda o=organ, m=method: self._tick_organ(o, m)
+                self.scheduler.add(f"{organ_name}.{method}", fn, every=every, priority=priority,
+                                   budget_ms=budget_ms, delay=every)
+            else:
+                logging.debug(f"[Thalamus] No periodic {organ_name}.{method}: organ unavailable")
+
+    def _tick_organ(self, organ, method):
+        """Run one periodic organ task; its emotion writes commit as one batch."""
+        batch = getattr(self.emotion, "batch", None)
+        if batch is None:
+            return getattr(organ, method)()
+        with batch():
+            return getattr(organ, method)()
 
     def stop_pulse(self):
-        self._pulse_running = False
-        t = getattr(self, "_pulse_thread", None)
-        if t and t.is_alive():
-            t.join(timeout=1.0)
+        self.scheduler.remove("pulse")
+        for organ_name, method, *_ in PERIODIC:
+            self.scheduler.remove(f"{organ_name}.{method}")
+        if not self._running:
+            self.scheduler.stop()
         try:
             self.gui.emit("status", {"phase": "pulse_stop", "mu": self.mu})
         except Exception:
             pass
         return True
+
+    # -------------------------------------------------------------------------
+    # Profiling
+    # -------------------------------------------------------------------------
+    def enable_profiling(self, sample_every=1):
+        """
+        Wrap the PROFILED hot paths of every built organ (and of organs built
+        later) and add a per-organ timing table to the heartbeat.
+        """
+        if self.profiler is None:
+            self.profiler = Profiler(sample_every)
+        self.profiler.sample_every = max(1, int(sample_every))
+        self.profiler.enabled = True
+        for name, _ in PROFILED:
+            organ = self if name == "thalamus" else self.__dict__.get(name)
+            if organ is None and name in self.organs and self.organs.is_loaded(name):
+                organ = self.organs.get(name)
+            if organ is not None:
+                self._profile_organ(name, organ)
+        if self._profile_organ not in self.organs.on_build:
+            self.organs.on_build.append(self._profile_organ)
+        return self.profiler
+
+    def disable_profiling(self):
+        """Unwrap everything: organs run their original methods again."""
+        if self.profiler is None:
+            return
+        self.profiler.enabled = False
+        self.profiler.uninstrument()
+        if self._profile_organ in self.organs.on_build:
+            self.organs.on_build.remove(self._profile_organ)
+
+    def _profile_organ(self, name, organ):
+        for organ_name, methods in PROFILED:
+            if organ_name == name:
+                self.profiler.instrument(organ, methods, name)
+
+    def profile(self):
+        """Current per-organ timing table ({} when profiling never ran)."""
+        return self.profiler.table() if self.profiler is not None else {}
+
     def heartbeat(self, confidence=None):
         """
         Emit a heartbeat signal with the current state.
@@ -263,11 +543,20 @@ class ConsciousThalamus:
     def start_heartbeat(self):
         if self._running: return
         self._running = True
-        t = threading.Thread(target=self._hb_loop, daemon=True)
-        t.start()
+        self.scheduler.add("state", self._emit_state, every=self._hb_ms/1000.0, priority=2)
+        self.scheduler.start()
+
+    def stop_heartbeat(self):
+        self._running = False
+        self.scheduler.remove("state")
+        if "pulse" not in self.scheduler:
+            self.scheduler.stop()
 
     def _collect_state(self):
         emo = getattr(self.amygdala, "emotional_core", {})
+        window = getattr(self.amygdala, "window", None)
+        if window is not None and len(window):
+            emo = window.as_dict(window.ewma, 6)  # smoothed trend, no recomputation
         # map a few vitals 0..1
         stability = min(1.0, emo.get("serenity",0.5) + emo.get("trust",0.0)*0.3)
         cognition = min(1.0, emo.get("focus",0.5))
@@ -276,8 +565,6 @@ class ConsciousThalamus:
         mutation  = min(1.0, emo.get("curiosity",0.2)*0.6 + emo.get("wonder",0.1)*0.4)
         return dict(stability=stability, cognition=cognition, emotion=emotion, recursion=recursion, mutation=mutation)
 
-    def _hb_loop(self):
-        while self._running:
-            payload = dict(t=datetime.utcnow().isoformat(), **self._collect_state())
-            self.gui.emit("state", payload)
-            time.sleep(self._hb_ms/1000.0)
+    def _emit_state(self):
+        payload = dict(t=datetime.utcnow().isoformat(), **self._collect_state())
+        self.gui.emit("state", payload)
@@ -0,0 +1,390 @@
+"""
+Thalamus Host – many ConsciousThalamus sessions across worker processes.
+A session id is routed to a worker by a consistent-hash ring, so adding or
+removing a worker (add_worker / remove_worker) only moves the sessions on
+its arc. Each worker holds any number of headless thalamus instances whose
+affect rows share one AffectPopulation per process.
+
+The collector thread also watches the worker processes: a worker that dies
+is taken off the ring, its pending futures fail with WorkerDied, and its
+sessions start over (from the seed) on the workers that inherit its arc.
+
+Seed memory is written once as a checkpoint and published in a
+multiprocessing.shared_memory segment: every worker reads the same pages
+(its manifest is parsed once per worker). A new session's memory reads the
+seed's record blocks and posting lists in place and copies one only when
+it first writes to it (copy-on-write), so an idle session costs its
+indexes' dict/set structure, not a copy of the seed.
+"""
+
+from bisect import bisect
+from concurrent.futures import Future
+import gc
+import hashlib
+import itertools
+import logging
+import multiprocessing as mp
+import os
+import queue
+import threading
+import time
+from multiprocessing import shared_memory
+
+from affect_population import AffectPopulation
+from checkpoint import CheckpointReader
+from thalamus import ConsciousThalamus
+
+class HashRing:
+    def __init__(self, nodes=(), replicas: int = 64):
+        """replicas: virtual points per node (more = smoother balance)."""
+        self.replicas = replicas
+        self._points = []     # sorted hashes
+        self._owners = {}     # hash → node
+        for node in nodes:
+            self.add(node)
+
+    @staticmethod
+    def _hash(key):
+        return int.from_bytes(hashlib.blake2b(str(key).encode("utf-8"), digest_size=8).digest(), "big")
+
+    def add(self, node):
+        for r in range(self.replicas):
+            h = self._hash(f"{node}#{r}")
+            if h not in self._owners:
+                self._owners[h] = node
+                self._points.insert(bisect(self._points, h), h)
+
+    def remove(self, node):
+        self._points = [h for h in self._points if self._owners[h] != node]
+        self._owners = {h: n for h, n in self._owners.items() if n != node}
+
+    def node_for(self, key):
+        if not self._points:
+            raise LookupError("Hash ring has no nodes")
+        i = bisect(self._points, self._hash(key)) % len(self._points)
+        return self._owners[self._points[i]]
+
+    def nodes(self):
+        return sorted(set(self._owners.values()), key=str)
+
+    def __len__(self):
+        return len(self.nodes())
+
+class SharedSeed:
+    def __init__(self, path=None, name=None):
+        """
+        path: publish this checkpoint file in a new shared-memory segment;
+        name: attach to a segment another process published.
+        """
+        if path is not None:
+            size = os.path.getsize(path)
+            self.shm = shared_memory.SharedMemory(create=True, size=max(1, size))
+            with open(path, "rb") as f:
+                f.readinto(self.shm.buf[:size])
+            self.owner = True
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+            self.owner = False
+        self.name = self.shm.name
+        self.size = self.shm.size
+
+    def reader(self):
+        return CheckpointReader(self.shm.buf)
+
+    def close(self):
+        try:
+            self.shm.close()
+        except BufferError:
+            pass   # a reader still holds a view; the segment is freed at exit
+        if self.owner:
+            try:
+                self.shm.unlink()
+            except FileNotFoundError:
+                pass
+
+# ---------- WORKER SIDE ----------
+OPS = {
+    # op           fn(thalamus, *args, **kwargs) → picklable result
+    "encode":     lambda t, text, tags=None: t.memory.encode(text, tags),
+    "recall":     lambda t, query, top_k=3: [r.experience for r in t.memory.recall(query, top_k)],
+    "query":      lambda t, text, top_k=3: [r.experience for r in t.memory.query(text, top_k)],
+    "remember":   lambda t, text, tags=None: t.memory.remember_short_term(text, tags),
+    "feel":       lambda t, name, delta=0.1: t.emotion.adjust_emotion(name, delta),
+    "feel_many":  lambda t, deltas: _feel_many(t.emotion, deltas),
+    "heartbeat":  lambda t: t.emotion.heartbeat(),
+    "records":    lambda t: len(t.memory.store),
+}
+
+def _feel_many(emotion, deltas):
+    """Apply [(name, delta), ...] in order as one Amygdala batch."""
+    with emotion.batch():
+        for name, delta in deltas:
+            emotion.adjust_emotion(name, delta)
+    return len(deltas)
+
+def _rss_mb():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1e6
+    except (OSError, ValueError):
+        return None
+
+class _Worker:
+    def __init__(self, index, seed_name, headless):
+        self.index = index
+        self.headless = headless
+        self.population = AffectPopulation(capacity=256)
+        self.sessions = {}    # session id → ConsciousThalamus
+        self.requests = 0
+        self.seed = SharedSeed(name=seed_name) if seed_name else None
+        self.reader = self.seed.reader() if self.seed else None
+
+    def session(self, sid):
+        t = self.sessions.get(sid)
+        if t is None:
+            t = ConsciousThalamus(headless=self.headless, emotion=self.population.spawn())
+            if self.reader is not None:
+                t.restore_checkpoint(self.reader)
+            self.sessions[sid] = t
+        return t
+
+    def close_session(self, sid):
+        t = self.sessions.pop(sid, None)
+        if t is None:
+            return False
+        t.emotion.release()
+        t.gui.close()
+        return True
+
+    def stats(self):
+        return {"worker": self.index, "pid": os.getpid(), "sessions": len(self.sessions),
+                "requests": self.requests, "rss_mb": _rss_mb()}
+
+    def handle(self, sid, op, args, kwargs):
+        self.requests += 1
+        if op == "open":
+            self.session(sid)
+            return True
+        if op == "close":
+            return self.close_session(sid)
+        if op == "stats":
+            return self.stats()
+        return OPS[op](self.session(sid), *args, **kwargs)
+
+    def shutdown(self):
+        for sid in list(self.sessions):
+            self.close_session(sid)
+        gc.collect()   # sessions are cyclic; their memory still views the seed until collected
+        if self.reader is not None:
+            self.reader.close()
+            self.seed.close()
+
+def _worker_main(index, seed_name, headless, inbox, outbox):
+    logging.getLogger("halcyon.gui").setLevel(logging.WARNING)
+    worker = _Worker(index, seed_name, headless)
+    outbox.put((None, True, index))   # ready
+    while True:
+        msg = inbox.get()
+        if msg is None:
+            break
+        rid, sid, op, args, kwargs = msg
+        try:
+            outbox.put((rid, True, worker.handle(sid, op, args, kwargs)))
+        except Exception as e:
+            outbox.put((rid, False, repr(e)))
+    worker.shutdown()
+
+# ---------- HOST SIDE ----------
+class WorkerDied(RuntimeError):
+    pass
+
+class ThalamusHost:
+    def __init__(self, workers: int = None, seed: str = None, replicas: int = 64,
+                 headless: bool = True, start_method: str = None, poll_interval: float = 0.25):
+        """
+        workers: processes to start with (default: one per core).
+        seed: checkpoint path (ConsciousThalamus.save_checkpoint) every new
+        session restores from; None starts sessions empty.
+        start_method: multiprocessing start method ("fork" also shares the
+        parent's imported modules copy-on-write).
+        poll_interval: how often (s) the collector checks for dead workers.
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.seed_path = seed
+        self.headless = headless
+        self.poll_interval = poll_interval
+        self.ring = HashRing((), replicas)
+        self._ctx = mp.get_context(start_method)
+        self._ids = itertools.count()
+        self._pending = {}    # request id → (worker, Future)
+        self._lock = threading.Lock()   # guards ring, _procs, _inboxes and _pending
+        self._procs = {}      # worker index → Process
+        self._inboxes = {}    # worker index → Queue
+        self._next_worker = 0
+        self._outbox = None
+        self._collector = None
+        self.seed = None
+
+    def start(self, timeout: float = 30.0):
+        if self._procs:
+            return False
+        t0 = time.perf_counter()
+        self.seed = SharedSeed(self.seed_path) if self.seed_path else None
+        self._outbox = self._ctx.Queue()
+        for _ in range(self.workers):
+            self._spawn()
+        for _ in range(self.workers):   # wait until every worker has attached the seed
+            self._outbox.get(timeout=timeout)
+        self._collector = threading.Thread(target=self._collect, name="ThalamusHostCollect", daemon=True)
+        self._collector.start()
+        self.start_ms = round((time.perf_counter() - t0) * 1000, 2)
+        return True
+
+    def _spawn(self):
+        i = self._next_worker
+        self._next_worker += 1
+        inbox = self._ctx.Queue()
+        proc = self._ctx.Process(target=_worker_main, name=f"ThalamusWorker-{i}", daemon=True,
+                                 args=(i, self.seed.name if self.seed else None, self.headless,
+                                       inbox, self._outbox))
+        proc.start()
+        with self._lock:
+            self._procs[i] = proc
+            self._inboxes[i] = inbox
+            self.ring.add(i)
+        return i
+
+    def add_worker(self):
+        """Start one more worker; it takes over its arc of the ring. Returns its index."""
+        if self._outbox is None:
+            raise RuntimeError("ThalamusHost is not started")
+        return self._spawn()
+
+    def remove_worker(self, worker, timeout: float = 5.0):
+        """
+        Take a worker off the ring, let it finish the requests it already has,
+        then stop it. Its sessions start over on the workers inheriting its arc.
+        """
+        with self._lock:
+            if worker not in self._procs or len(self._procs) == 1:
+                return False
+            self.ring.remove(worker)
+        deadline = time.monotonic() + timeout
+        while self._pending_on(worker) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self._inboxes[worker].put(None)
+        proc = self._procs[worker]
+        proc.join(max(0.0, deadline - time.monotonic()))
+        if proc.is_alive():
+            proc.terminate()
+        self._drop(worker, f"ThalamusWorker-{worker} was removed")
+        return True
+
+    def _pending_on(self, worker):
+        with self._lock:
+            return any(w == worker for w, _ in self._pending.values())
+
+    def _drop(self, worker, reason):
+        """Forget a worker and fail every request still waiting on it."""
+        with self._lock:
+            self._procs.pop(worker, None)
+            self._inboxes.pop(worker, None)
+            self.ring.remove(worker)
+            lost = [rid for rid, (w, _) in self._pending.items() if w == worker]
+            futures = [self._pending.pop(rid)[1] for rid in lost]
+        for fut in futures:
+            fut.set_exception(WorkerDied(reason))
+        return len(futures)
+
+    def _reap(self):
+        with self._lock:
+            dead = [(i, p.exitcode) for i, p in self._procs.items() if not p.is_alive()]
+        for i, code in dead:
+            failed = self._drop(i, f"ThalamusWorker-{i} died (exit code {code})")
+            logging.error(f"[ThalamusHost] Worker {i} died (exit code {code}); failed {failed} pending requests")
+
+    def _collect(self):
+        next_check = time.monotonic() + self.poll_interval
+        while True:
+            try:
+                msg = self._outbox.get(timeout=self.poll_interval)
+            except queue.Empty:
+                msg = ()   # idle: only check the workers
+            if time.monotonic() >= next_check:
+                self._reap()
+                next_check = time.monotonic() + self.poll_interval
+            if msg is None:
+                return
+            if not msg:
+                continue
+            rid, ok, result = msg
+            with self._lock:
+                entry = self._pending.pop(rid, None)
+            if entry is None:
+                continue   # a ready signal, or a request already failed
+            if ok:
+                entry[1].set_result(result)
+            else:
+                entry[1].set_exception(RuntimeError(result))
+
+    def worker_for(self, session):
+        with self._lock:
+            return self.ring.node_for(session)
+
+    def live_workers(self):
+        with self._lock:
+            return sorted(self._procs)
+
+    def submit(self, session, op, *args, **kwargs):
+        """Send one op to the session's worker; returns a Future."""
+        if op not in OPS and op not in ("open", "close"):
+            raise ValueError(f"Unknown thalamus op: {op}")
+        return self._send(self.worker_for(session), session, op, args, kwargs)
+
+    def call(self, session, op, *args, timeout: float = 30.0, **kwargs):
+        return self.submit(session, op, *args, **kwargs).result(timeout)
+
+    def _send(self, worker, session, op, args, kwargs):
+        if self._outbox is None:
+            raise RuntimeError("ThalamusHost is not started")
+        rid = next(self._ids)
+        fut = Future()
+        with self._lock:
+            inbox = self._inboxes.get(worker)
+            if inbox is None:
+                fut.set_exception(WorkerDied(f"ThalamusWorker-{worker} is gone"))
+                return fut
+            self._pending[rid] = (worker, fut)
+        inbox.put((rid, session, op, args, kwargs))
+        return fut
+
+    def stats(self, timeout: float = 10.0):
+        futures = [self._send(i, None, "stats", (), {}) for i in self.live_workers()]
+        per_worker = [f.result(timeout) for f in futures]
+        return {"workers": per_worker, "sessions": sum(w["sessions"] for w in per_worker),
+                "seed_bytes": self.seed.size if self.seed else 0}
+
+    def stop(self, timeout: float = 5.0):
+        with self._lock:
+            procs, inboxes = dict(self._procs), dict(self._inboxes)
+        for inbox in inboxes.values():
+            inbox.put(None)
+        for proc in procs.values():
+            proc.join(timeout)
+            if proc.is_alive():
+                proc.terminate()
+        if self._outbox is not None:
+            self._outbox.put(None)
+            self._collector.join(timeout)
+        for i in procs:
+            self._drop(i, f"ThalamusWorker-{i} was stopped")
+        if self.seed is not None:
+            self.seed.close()
+        self._outbox = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
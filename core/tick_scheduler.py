@@ -0,0 +1,181 @@
+"""
+Tick Scheduler – one thread for every periodic organ task.
+Tasks register with their own rate, priority and time budget; the thread
+sleeps until the earliest deadline (or until the task set changes), runs
+every task that is due in priority order, and reschedules each one on its
+own grid. Replaces the separate pulse / heartbeat / per-organ threads.
+
+Deadlines live on the monotonic clock and advance by exact multiples of
+the interval, so ticks never drift. Slots missed while a tick overran are
+counted as skipped rather than replayed. Each task keeps histograms of its
+run time and of its start lateness.
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+
+from latency import LatencyHistogram
+
+class TickTask:
+    __slots__ = ("name", "fn", "interval", "priority", "budget_ms", "max_errors",
+                 "due", "runs", "overruns", "skipped", "errors", "consecutive_errors",
+                 "last_ms", "max_ms", "enabled", "latency", "lateness")
+
+    def __init__(self, name, fn, interval, priority=5, budget_ms=None, max_errors=5):
+        self.name = name
+        self.fn = fn
+        self.interval = interval
+        self.priority = priority
+        self.budget_ms = budget_ms
+        self.max_errors = max_errors
+        self.due = 0.0
+        self.runs = 0
+        self.overruns = 0        # runs that took longer than budget_ms
+        self.skipped = 0         # grid slots that passed while the task was still busy/late
+        self.errors = 0
+        self.consecutive_errors = 0
+        self.last_ms = 0.0
+        self.max_ms = 0.0
+        self.enabled = True
+        self.latency = LatencyHistogram()    # run time per tick
+        self.lateness = LatencyHistogram()   # start time minus deadline
+
+    def advance(self, now):
+        """Move the deadline to the next grid slot after now, counting skipped slots."""
+        due = self.due + self.interval
+        if due <= now:
+            missed = int((now - due) // self.interval) + 1
+            self.skipped += missed
+            due += missed * self.interval
+        self.due = due
+
+    def stats(self):
+        return {"hz": round(1.0 / self.interval, 3), "priority": self.priority, "budget_ms": self.budget_ms,
+                "runs": self.runs, "overruns": self.overruns, "skipped": self.skipped, "errors": self.errors,
+                "last_ms": round(self.last_ms, 3), "max_ms": round(self.max_ms, 3), "enabled": self.enabled,
+                "latency": self.latency.summary(), "late_ms": self.lateness.summary()}
+
+class TickScheduler:
+    def __init__(self, name="HalcyonTick"):
+        self.name = name
+        self._tasks = {}                # name → TickTask
+        self._heap = []                 # (due, priority, seq, task)
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._running = False
+        self._thread = None
+
+    # ---------- TASKS ----------
+    def add(self, name, fn, hz=None, every=None, priority=5, budget_ms=None, max_errors=5, delay=0.0):
+        """
+        Run fn() at hz (or every `every` seconds). Lower priority runs first
+        when several tasks are due together. A task exceeding budget_ms is
+        counted as an overrun; one failing max_errors times in a row is disabled.
+        Re-adding a name replaces the task.
+        """
+        interval = every if every is not None else 1.0 / max(1e-6, float(hz or 1.0))
+        task = TickTask(name, fn, interval, priority, budget_ms, max_errors)
+        task.due = time.monotonic() + delay
+        with self._lock:
+            old = self._tasks.get(name)
+            if old is not None:
+                old.enabled = False
+            self._tasks[name] = task
+            heapq.heappush(self._heap, (task.due, task.priority, next(self._seq), task))
+        self._wake.set()
+        return task
+
+    def remove(self, name):
+        with self._lock:
+            task = self._tasks.pop(name, None)
+            if task is not None:
+                task.enabled = False   # lazily dropped from the heap
+        self._wake.set()
+        return task is not None
+
+    def __contains__(self, name):
+        return name in self._tasks
+
+    # ---------- LIFECYCLE ----------
+    def start(self):
+        if self._running:
+            return False
+        self._running = True
+        self._thread = threading.Thread(target=self._loop, name=self.name, daemon=True)
+        self._thread.start()
+        return True
+
+    def stop(self, timeout=1.0):
+        self._running = False
+        self._wake.set()
+        if self._thread and self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join(timeout=timeout)
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._running
+
+    def _loop(self):
+        while self._running:
+            with self._lock:
+                while self._heap and not self._heap[0][3].enabled:
+                    heapq.heappop(self._heap)
+                wait = (self._heap[0][0] - time.monotonic()) if self._heap else None
+            if wait is None or wait > 0:
+                self._wake.wait(wait)   # no tasks → sleep until one is added
+                self._wake.clear()
+                continue
+            self.run_due()
+
+    def run_due(self, now=None):
+        """
+        Run every task due at now (priority order) and reschedule it.
+        Returns the names that ran.
+        """
+        now = time.monotonic() if now is None else now
+        batch = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                _, _, _, task = heapq.heappop(self._heap)
+                if task.enabled:
+                    batch.append(task)
+        batch.sort(key=lambda t: t.priority)
+        for task in batch:
+            self._run(task)
+            task.advance(time.monotonic())
+            with self._lock:
+                if task.enabled:
+                    heapq.heappush(self._heap, (task.due, task.priority, next(self._seq), task))
+        return [t.name for t in batch]
+
+    def _run(self, task):
+        task.lateness.record(max(0.0, (time.monotonic() - task.due) * 1000))
+        t0 = time.perf_counter()
+        try:
+            task.fn()
+            task.consecutive_errors = 0
+        except Exception as e:
+            task.errors += 1
+            task.consecutive_errors += 1
+            logging.debug(f"[tick] {task.name} error: {e!r}")
+            if task.max_errors and task.consecutive_errors >= task.max_errors:
+                task.enabled = False
+                logging.warning(f"[tick] {task.name} disabled after {task.consecutive_errors} consecutive errors")
+        ms = (time.perf_counter() - t0) * 1000
+        task.runs += 1
+        task.last_ms = ms
+        task.max_ms = max(task.max_ms, ms)
+        task.latency.record(ms)
+        if task.budget_ms is not None and ms > task.budget_ms:
+            task.overruns += 1
+
+    def stats(self):
+        return {name: t.stats() for name, t in self._tasks.items()}
+
+    def task(self, name):
+        return self._tasks.get(name)
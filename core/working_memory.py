@@ -0,0 +1,174 @@
+"""
+Working Memory – bounded short-term tier in front of the Hippocampus.
+Organs call remember_short_term on every bind, proposal and mirror, so the
+tier holds a fixed number of items and evicts by LRU or LFU. Items are
+promoted into the indexed long-term store once they are accessed often
+enough, or immediately when they carry a promoting tag.
+"""
+
+from collections import OrderedDict
+import time
+
+class _LRU:
+    def __init__(self):
+        self._order = OrderedDict()
+
+    def add(self, key, freq=1):
+        self._order[key] = None
+
+    def touch(self, key):
+        self._order.move_to_end(key)
+
+    def evict(self):
+        return self._order.popitem(last=False)[0]
+
+    def discard(self, key):
+        self._order.pop(key, None)
+
+    def keys(self):
+        """Keys in eviction order (next victim first)."""
+        return list(self._order)
+
+class _LFU:
+    """
+    O(1) least-frequently-used order: frequency → keys (oldest first).
+    """
+    def __init__(self):
+        self._freq = {}
+        self._buckets = {}
+        self._min = 0
+
+    def add(self, key, freq=1):
+        self._freq[key] = freq
+        self._buckets.setdefault(freq, OrderedDict())[key] = None
+        self._min = min(self._min, freq) if len(self._freq) > 1 else freq
+
+    def touch(self, key):
+        f = self._freq[key]
+        bucket = self._buckets[f]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[f]
+            if self._min == f:
+                self._min = f + 1
+        self._freq[key] = f + 1
+        self._buckets.setdefault(f + 1, OrderedDict())[key] = None
+
+    def evict(self):
+        bucket = self._buckets[self._min]
+        key, _ = bucket.popitem(last=False)
+        if not bucket:
+            del self._buckets[self._min]
+            self._min = min(self._buckets) if self._buckets else 0
+        del self._freq[key]
+        return key
+
+    def discard(self, key):
+        f = self._freq.pop(key, None)
+        if f is None:
+            return
+        bucket = self._buckets[f]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[f]
+            if self._min == f:
+                self._min = min(self._buckets) if self._buckets else 0
+
+    def keys(self):
+        """Keys in eviction order (next victim first)."""
+        return [key for f in sorted(self._buckets) for key in self._buckets[f]]
+
+class WorkingMemory:
+    def __init__(self, promote, capacity: int = 256, policy: str = "lru",
+                 promote_hits: int = 3, promote_tags=("anchor", "truth")):
+        """
+        promote(text, tags) is called once per item that earns long-term storage.
+        """
+        if policy not in ("lru", "lfu"):
+            raise ValueError(f"Unknown eviction policy: {policy}")
+        if capacity < 1:
+            raise ValueError(f"Working memory capacity must be at least 1, got {capacity}")
+        self.capacity = capacity
+        self.policy = policy
+        self.promote_hits = promote_hits
+        self.promote_tags = set(promote_tags)
+        self._promote = promote
+        self._items = {}   # text → {"tags", "hits", "t", "promoted"}
+        self._order = _LRU() if policy == "lru" else _LFU()
+        self.stats = {"stored": 0, "hits": 0, "evicted": 0, "promoted": 0}
+
+    def remember(self, text: str, tags=None, extra_promote_tags=()):
+        """
+        Store (or re-touch) a short-term item; returns True if it was promoted.
+        """
+        item = self._items.get(text)
+        if item is not None:
+            if tags:
+                item["tags"] = list(dict.fromkeys(item["tags"] + list(tags)))
+            return self._access(text, item, extra_promote_tags)
+
+        while len(self._items) >= self.capacity:
+            self._items.pop(self._order.evict())
+            self.stats["evicted"] += 1
+        item = self._items[text] = {"tags": list(tags or []), "hits": 1, "t": time.time(), "promoted": False}
+        self._order.add(text)
+        self.stats["stored"] += 1
+        return self._maybe_promote(text, item, extra_promote_tags)
+
+    def recall(self, query: str = None, top_k: int = 5):
+        """
+        Most recent short-term items (optionally containing query); counts as access.
+        """
+        hits = []
+        for text in reversed(list(self._items)):
+            if query is None or query.lower() in text.lower():
+                hits.append(text)
+                if len(hits) >= top_k:
+                    break
+        for text in hits:
+            self._access(text, self._items[text])
+        return hits
+
+    def _access(self, text, item, extra_promote_tags=()):
+        item["hits"] += 1
+        item["t"] = time.time()
+        self._order.touch(text)
+        self.stats["hits"] += 1
+        return self._maybe_promote(text, item, extra_promote_tags)
+
+    def _maybe_promote(self, text, item, extra_promote_tags=()):
+        if item["promoted"]:
+            return False
+        tags = item["tags"]
+        if item["hits"] >= self.promote_hits or any(t in self.promote_tags or t in extra_promote_tags for t in tags):
+            item["promoted"] = True
+            self._promote(text, tags)
+            self.stats["promoted"] += 1
+            return True
+        return False
+
+    def snapshot(self):
+        """Items (insertion order) and eviction order, for checkpoints."""
+        return {"items": [[text, item] for text, item in self._items.items()], "order": self._order.keys()}
+
+    def restore(self, snapshot):
+        """Replace the contents with a snapshot() (stats are left as they are)."""
+        self._items = {text: dict(item) for text, item in snapshot["items"]}
+        self._order = _LRU() if self.policy == "lru" else _LFU()
+        for text in snapshot["order"]:
+            self._order.add(text, self._items[text]["hits"])
+        while len(self._items) > self.capacity:
+            self._items.pop(self._order.evict())
+
+    def forget(self, text: str):
+        if self._items.pop(text, None) is not None:
+            self._order.discard(text)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, text):
+        return text in self._items
+
+    def status(self):
+        return {"size": len(self._items), "capacity": self.capacity, "policy": self.policy, **self.stats}
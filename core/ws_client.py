@@ -7,6 +7,8 @@
 #   thalamus.gui.on("trace_step", make_ws_emitter())
 #
 # This will best-effort connect and send JSON strings to ws://127.0.0.1:8765
+# Emitters for the same URL share one forwarder, and every forwarder runs as
+# a task on a single background asyncio loop (one thread in total).
 
 import asyncio, json, threading
 try:
@@ -14,21 +16,34 @@ try:
 except Exception as e:
     websockets = None
 
+_loop = None
+_loop_lock = threading.Lock()
+_forwarders = {}
+
+def _shared_loop():
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="HalcyonWS", daemon=True).start()
+        return _loop
+
 class _WSForwarder:
     def __init__(self, url='ws://127.0.0.1:8765'):
         self.url = url
         self._loop = None
         self._ws = None
-        self._thread = None
         self._queue = asyncio.Queue()
+        self._start_lock = threading.Lock()
 
     def start(self):
-        if self._thread: return
-        self._thread = threading.Thread(target=self._run_loop, daemon=True)
-        self._thread.start()
-
-    def _run_loop(self):
-        asyncio.run(self._main())
+        if self._loop: return
+        # emit() may race here from several sink threads; only one schedules _main
+        with self._start_lock:
+            if self._loop: return
+            loop = _shared_loop()
+            asyncio.run_coroutine_threadsafe(self._main(), loop)
+            self._loop = loop
 
     async def _connect(self):
         if websockets is None:
@@ -66,15 +81,17 @@ class _WSForwarder:
             msg = json.dumps(payload, ensure_ascii=False)
         except Exception:
             msg = json.dumps({"_bad_payload": True})
-        # Put without awaiting (thread-safe via loop running in same thread)
-        # We use asyncio.Queue; put_nowait is fine here.
+        # Hand the message to the loop thread; asyncio.Queue is not thread-safe.
         try:
-            self._queue.put_nowait(msg)
+            self._loop.call_soon_threadsafe(self._queue.put_nowait, msg)
         except Exception:
             pass
 
 def make_ws_emitter(url='ws://127.0.0.1:8765'):
-    fw = _WSForwarder(url=url)
+    with _loop_lock:
+        fw = _forwarders.get(url)
+        if fw is None:
+            fw = _forwarders[url] = _WSForwarder(url=url)
     def _emit(pkt):
         fw.emit(pkt)
     return _emit